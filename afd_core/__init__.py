@@ -1,12 +1,32 @@
-from .afd import AFD, TraceStep, TraceResult
-from .generator import generate_strings
+from .afd import AFD
+from .nfa import NFA
+from .types import TraceStep, TraceResult, TraceSteps, EquivalenceResult
+from .generator import generate_strings, iter_accepted
+from .counting import count_accepted, count_accepted_upto
+from .sampling import sample_accepted
+from .ranking import rank, unrank
+from .equivalence import equivalent
+from .regex import compile_regex
+from .streaming import StreamingRunner
 from .persistence import save_to_json, load_from_json
 
 __all__ = [
     "AFD",
+    "NFA",
     "TraceStep",
     "TraceResult",
+    "TraceSteps",
+    "EquivalenceResult",
     "generate_strings",
+    "iter_accepted",
+    "count_accepted",
+    "count_accepted_upto",
+    "sample_accepted",
+    "rank",
+    "unrank",
+    "equivalent",
+    "compile_regex",
+    "StreamingRunner",
     "save_to_json",
     "load_from_json",
 ]
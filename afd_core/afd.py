@@ -1,52 +1,14 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from array import array
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from . import vectorized
+from .tokenizer import Tokenizer, is_uniquely_decodable
+from .types import TraceResult, TraceStep, TraceSteps, index_typecode
 
-"""
-Representación de una traza de pasos en la simulación de un AFD.
-
-Consiste de una lista de objetos `TraceStep` que representan cada paso
-en la simulación. Cada objeto `TraceStep` tiene los siguientes campos:
-
-* `from_state`: el estado desde el que se hace la transición
-* `symbol`: el símbolo que se lee en la transición (None para el estado inicial)
-* `to_state`: el estado al que se llega después de la transición
-
-La clase `TraceResult` representa el resultado de la simulación de un AFD.
-Tiene los siguientes campos:
-
-* `accepted`: indica si la cadena es aceptada por el AFD
-* `final_state`: el estado final en el que se queda después de la simulación
-* `steps`: la traza de pasos que se realizaron durante la simulación
-"""
-
-
-@dataclass
-class TraceStep:
-    """Representa un paso en la simulación de un AFD."""
-
-    from_state: str
-    """El estado desde el que se hace la transición."""
-
-    to_state: str
-    """El estado al que se llega después de la transición."""
-    
-    symbol: Optional[str] = None
-    """El símbolo que se lee en la transición (None para el estado inicial)."""
-
-
-@dataclass
-class TraceResult:
-    """Representa el resultado de la simulación de un AFD."""
-
-    accepted: bool
-    """Indica si la cadena es aceptada por el AFD."""
-
-    final_state: str
-    """El estado final en el que se queda después de la simulación."""
-
-    steps: List[TraceStep]
-    """La traza de pasos que se realizaron durante la simulación."""
+# Entradas binarias: bytes traducidos por bloque y marca de byte inválido
+BYTE_BLOCK_SIZE = 1 << 16
+INVALID_BYTE = 255
 
 
 class AFD:
@@ -63,18 +25,30 @@ class AFD:
         if not self.validate():
             raise ValueError("AFD inválido")
 
+        # Compilar la tabla de transiciones una sola vez
+        self.compile()
+
     def validate(self) -> bool:
         """Valida que el AFD sea correcto y completo."""
         try:
+            # Conjuntos para que la validación sea O(estados × símbolos)
+            states = set(self.states)
+
             # Verificar que el estado inicial esté en states
-            if self.initial not in self.states:
+            if self.initial not in states:
                 raise ValueError(f"Estado inicial '{self.initial}' no está en la lista de estados")
             
             # Verificar que todos los estados finales estén en states
             for final in self.finals:
-                if final not in self.states:
+                if final not in states:
                     raise ValueError(f"Estado final '{final}' no está en la lista de estados")
             
+            # Con símbolos de varios caracteres, cada cadena debe separarse
+            # en símbolos de una única forma (ver `tokenizer`)
+            if any(len(symbol) != 1 for symbol in self.alphabet) and \
+                    not is_uniquely_decodable(self.alphabet):
+                raise ValueError("El alfabeto no se puede separar en símbolos de forma única")
+
             # Verificar que la función de transición esté completa
             for state in self.states:
                 if state not in self.transitions:
@@ -85,7 +59,7 @@ class AFD:
                         raise ValueError(f"Falta transición desde '{state}' con símbolo '{symbol}'")
                     
                     next_state = self.transitions[state][symbol]
-                    if next_state not in self.states:
+                    if next_state not in states:
                         raise ValueError(f"Transición desde '{state}' con '{symbol}' lleva a estado inexistente '{next_state}'")
             
             return True
@@ -93,24 +67,436 @@ class AFD:
         except ValueError:
             return False
 
-    def simulate(self, cadena: str) -> TraceResult:
-        """Simula la ejecución de una cadena en el AFD."""
-        steps = []
-        current_state = self.initial
-        
-        # Paso inicial
-        steps.append(TraceStep(from_state="", to_state=current_state, symbol=None))
-        
-        # Procesar cada símbolo
+    def compile(self) -> None:
+        """
+        Compila el AFD en una tabla densa de enteros.
+
+        Los estados y símbolos se numeran según su orden en `states` y
+        `alphabet`. La tabla `_table` es un arreglo plano donde
+        `_table[estado * num_simbolos + simbolo]` es el índice del estado
+        siguiente, y `_final_table[estado]` es 1 si el estado es final.
+
+        Se invoca automáticamente al crear el AFD; si se modifican sus
+        atributos después, hay que volver a llamarlo.
+        """
+        self._state_names: List[str] = list(dict.fromkeys(self.states))
+        self._state_index: Dict[str, int] = {
+            state: i for i, state in enumerate(self._state_names)
+        }
+        self._symbol_names: List[str] = list(dict.fromkeys(self.alphabet))
+        self._symbol_index: Dict[str, int] = {
+            symbol: i for i, symbol in enumerate(self._symbol_names)
+        }
+        self._num_symbols = len(self._symbol_names)
+
+        # Con símbolos de varios caracteres la entrada se separa con un trie
+        # (ver `tokenizer`); si no, cada carácter es un símbolo
+        multi_char = any(len(symbol) != 1 for symbol in self._symbol_names)
+        self._tokenizer = Tokenizer(self._symbol_names) if multi_char else None
+
+        # Tabla byte -> índice de símbolo para entradas binarias; los bytes
+        # fuera del alfabeto se traducen a `INVALID_BYTE`
+        self._byte_table = None
+        if not multi_char and self._num_symbols < INVALID_BYTE:
+            self._byte_table = bytes(self._symbol_index.get(chr(b), INVALID_BYTE)
+                                     for b in range(256))
+
+        table = array("i")
+        for state in self._state_names:
+            row = self.transitions[state]
+            for symbol in self._symbol_names:
+                table.append(self._state_index[row[symbol]])
+        self._table = table
+
+        final_table = bytearray(len(self._state_names))
+        for final in self.finals:
+            final_table[self._state_index[final]] = 1
+        self._final_table = bytes(final_table)
+        self._initial_index = self._state_index[self.initial]
+
+    def _is_final_index(self, state: int) -> bool:
+        """Indica si el estado con índice `state` es final."""
+        return self._final_table[state] == 1
+
+    def is_final(self, state: str) -> bool:
+        """Indica si `state` es un estado final del AFD."""
+        index = self._state_index.get(state)
+        return index is not None and self._is_final_index(index)
+
+    # -------------------------
+    # Propiedades del lenguaje: O(estados × símbolos)
+    # -------------------------
+    def _final_flags(self) -> bytearray:
+        """Copia modificable de `_final_table`: `flags[i]` es 1 si el estado `i` es final."""
+        return bytearray(self._final_table)
+
+    def _reachable(self) -> bytearray:
+        """Marca los estados alcanzables desde el inicial (BFS)."""
+        table = self._table
+        k = self._num_symbols
+        marked = bytearray(len(self._state_names))
+        marked[self._initial_index] = 1
+        queue = deque([self._initial_index])
+        while queue:
+            state = queue.popleft()
+            for target in table[state * k:(state + 1) * k]:
+                if not marked[target]:
+                    marked[target] = 1
+                    queue.append(target)
+        return marked
+
+    def _coreachable(self) -> bytearray:
+        """
+        Marca los estados desde los que se puede llegar a un estado final.
+
+        Recorre en BFS el grafo de transiciones invertido desde los finales.
+        """
+        table = self._table
+        k = self._num_symbols
+        n = len(self._state_names)
+
+        predecessors: List[List[int]] = [[] for _ in range(n)]
+        for state in range(n):
+            for target in table[state * k:(state + 1) * k]:
+                predecessors[target].append(state)
+
+        marked = self._final_flags()
+        queue = deque(i for i in range(n) if marked[i])
+        while queue:
+            state = queue.popleft()
+            for previous in predecessors[state]:
+                if not marked[previous]:
+                    marked[previous] = 1
+                    queue.append(previous)
+        return marked
+
+    def _has_useful_cycle(self, coreachable: bytearray) -> bool:
+        """
+        Indica si hay un ciclo entre estados alcanzables y co-alcanzables, es
+        decir, si el lenguaje del AFD es infinito.
+        """
+        table = self._table
+        k = self._num_symbols
+        if not coreachable[self._initial_index]:
+            return False
+
+        # DFS iterativo con colores: 0 = sin visitar, 1 = en la pila, 2 = terminado
+        color = bytearray(len(self._state_names))
+        stack = [(self._initial_index, 0)]
+        color[self._initial_index] = 1
+        while stack:
+            state, j = stack[-1]
+            if j == k:
+                color[state] = 2
+                stack.pop()
+                continue
+            stack[-1] = (state, j + 1)
+            target = table[state * k + j]
+            if not coreachable[target]:
+                continue
+            if color[target] == 1:
+                return True
+            if color[target] == 0:
+                color[target] = 1
+                stack.append((target, 0))
+        return False
+
+    def is_empty(self) -> bool:
+        """Indica si el AFD no acepta ninguna cadena."""
+        return not self._coreachable()[self._initial_index]
+
+    def is_finite(self) -> bool:
+        """Indica si el AFD acepta una cantidad finita de cadenas."""
+        return not self._has_useful_cycle(self._coreachable())
+
+    def is_universal(self) -> bool:
+        """Indica si el AFD acepta todas las cadenas sobre su alfabeto."""
+        finals = self._final_flags()
+        reachable = self._reachable()
+        return all(finals[i] for i in range(len(reachable)) if reachable[i])
+
+    def shortest_accepted(self) -> Optional[str]:
+        """
+        Devuelve una cadena aceptada de longitud mínima (la primera en el
+        orden de `alphabet`), o None si el AFD no acepta ninguna.
+        """
+        table = self._table
+        k = self._num_symbols
+        finals = self._final_flags()
+
+        # BFS desde el inicial guardando (estado previo, símbolo) por estado
+        parent: Dict[int, Tuple[int, int]] = {self._initial_index: (-1, -1)}
+        queue = deque([self._initial_index])
+        while queue:
+            state = queue.popleft()
+            if finals[state]:
+                pieces = []
+                while parent[state][0] >= 0:
+                    state, j = parent[state]
+                    pieces.append(self._symbol_names[j])
+                return "".join(reversed(pieces))
+            for j in range(k):
+                target = table[state * k + j]
+                if target not in parent:
+                    parent[target] = (state, j)
+                    queue.append(target)
+        return None
+
+    def _index_blocks(self, cadena) -> Optional[Iterator[Sequence[int]]]:
+        """
+        Convierte la entrada en bloques de índices de símbolos cuando no se
+        puede recorrer carácter a carácter.
+
+        * `bytes`, `bytearray` y `memoryview`: cada byte `b` es el símbolo
+          `chr(b)`. Se traducen por bloques con `bytes.translate` y la tabla
+          de 256 entradas `_byte_table`, sin decodificar a `str`.
+        * `str` con un alfabeto de símbolos de varios caracteres: un único
+          bloque con la salida del tokenizador.
+
+        :return: iterador de bloques, o None si cada elemento de `cadena`
+                 es un símbolo
+        """
+        if isinstance(cadena, (bytes, bytearray, memoryview)):
+            return self._byte_blocks(cadena)
+        if self._tokenizer is not None and isinstance(cadena, str):
+            return iter((self._tokenizer.tokenize(cadena),))
+        return None
+
+    def _byte_blocks(self, data) -> Iterator[Sequence[int]]:
+        view = memoryview(data).cast("B")
+        if self._byte_table is None:
+            # Símbolos de varios caracteres o más de 255 símbolos
+            yield self._indices(view.tobytes().decode("latin-1"))
+            return
+
+        for start in range(0, len(view), BYTE_BLOCK_SIZE):
+            block = view[start:start + BYTE_BLOCK_SIZE].tobytes().translate(self._byte_table)
+            bad = block.find(INVALID_BYTE)
+            if bad >= 0:
+                raise ValueError(f"Byte 0x{view[start + bad]:02x} no está en el alfabeto")
+            yield block
+
+    def _indices(self, cadena) -> Sequence[int]:
+        """Índices de los símbolos de `cadena` (tokenizada si hace falta)."""
+        blocks = self._index_blocks(cadena)
+        if blocks is not None:
+            indices = array("i")
+            for block in blocks:
+                indices.extend(block)
+            return indices
+        indices = []
         for symbol in cadena:
-            if symbol not in self.alphabet:
+            j = self._symbol_index.get(symbol)
+            if j is None:
                 raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
-            
-            from_state = current_state
-            current_state = self.transitions[current_state][symbol]
-            steps.append(TraceStep(from_state=from_state, to_state=current_state, symbol=symbol))
-        
+            indices.append(j)
+        return indices
+
+    def _run_index(self, cadena: str) -> int:
+        """Procesa la cadena sin guardar traza y devuelve el índice del estado final."""
+        symbol_index = self._symbol_index
+        table = self._table
+        k = self._num_symbols
+        current = self._initial_index
+
+        blocks = self._index_blocks(cadena)
+        if blocks is not None:
+            for block in blocks:
+                for j in block:
+                    current = table[current * k + j]
+            return current
+
+        for symbol in cadena:
+            j = symbol_index.get(symbol)
+            if j is None:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+            current = table[current * k + j]
+
+        return current
+
+    def run(self, cadena: str) -> str:
+        """
+        Ejecuta la cadena sin construir la traza.
+
+        :param cadena: cadena de entrada
+        :return: estado en el que termina la simulación
+        """
+        return self._state_names[self._run_index(cadena)]
+
+    def accepts(self, cadena: str) -> bool:
+        """
+        Indica si el AFD acepta la cadena, sin construir la traza.
+
+        :param cadena: cadena de entrada
+        :return: True si la cadena termina en un estado final
+        """
+        return self._is_final_index(self._run_index(cadena))
+
+    def minimize(self) -> Tuple["AFD", Dict[str, str]]:
+        """
+        Devuelve el AFD mínimo equivalente (algoritmo de Hopcroft, ver
+        `afd_core.minimize`).
+
+        :return: (AFD mínimo, diccionario estado original -> estado nuevo)
+        """
+        from .minimize import minimize
+        return minimize(self)
+
+    def trim(self) -> "AFD":
+        """
+        Devuelve un AFD equivalente sin estados no alcanzables y con los
+        estados muertos reunidos en un único sumidero (ver
+        `afd_core.minimize.trim`).
+        """
+        from .minimize import trim
+        return trim(self)
+
+    # -------------------------
+    # Operaciones booleanas (ver `afd_core.operations`)
+    # -------------------------
+    def intersection(self, *others: "AFD") -> "AFD":
+        """AFD que acepta las cadenas aceptadas por este AFD y por todos los demás."""
+        from .operations import intersection
+        return intersection(self, *others)
+
+    def union(self, *others: "AFD") -> "AFD":
+        """AFD que acepta las cadenas aceptadas por este AFD o por alguno de los demás."""
+        from .operations import union
+        return union(self, *others)
+
+    def difference(self, other: "AFD") -> "AFD":
+        """AFD que acepta las cadenas aceptadas por este AFD y no por `other`."""
+        from .operations import difference
+        return difference(self, other)
+
+    def symmetric_difference(self, other: "AFD") -> "AFD":
+        """AFD que acepta las cadenas aceptadas por exactamente uno de los dos AFDs."""
+        from .operations import symmetric_difference
+        return symmetric_difference(self, other)
+
+    def complement(self, alphabet: Optional[List[str]] = None) -> "AFD":
+        """AFD que acepta las cadenas (sobre `alphabet`) que este AFD rechaza."""
+        from .operations import complement
+        return complement(self, alphabet)
+
+    def state_name(self, index: int) -> str:
+        """Devuelve el nombre del estado con índice `index` en la tabla compilada."""
+        return self._state_names[index]
+
+    def run_many(self, strings: Iterable[str]):
+        """
+        Ejecuta muchas cadenas a la vez, sin construir trazas.
+
+        Con NumPy instalado, todas las cadenas avanzan en paralelo sobre la
+        matriz de transiciones y se devuelve un arreglo `int32`; sin NumPy
+        se devuelve un `array('i')` calculado con `run`.
+
+        :param strings: cadenas de entrada
+        :return: índice del estado final de cada cadena (ver `state_name`),
+                 o -1 si la cadena tiene símbolos fuera del alfabeto
+        """
+        if vectorized.HAS_NUMPY:
+            return vectorized.run_many(self, strings)
+
+        final = array("i")
+        for cadena in strings:
+            try:
+                final.append(self._run_index(cadena))
+            except ValueError:
+                final.append(-1)
+        return final
+
+    def accepts_many(self, strings: Iterable[str]):
+        """
+        Indica qué cadenas acepta el AFD, procesándolas en lote.
+
+        :param strings: cadenas de entrada
+        :return: vector booleano de NumPy (o lista de bool sin NumPy); las
+                 cadenas con símbolos fuera del alfabeto cuentan como rechazadas
+        """
+        if vectorized.HAS_NUMPY:
+            return vectorized.accepts_many(self, strings)
+
+        return [index >= 0 and self._is_final_index(index)
+                for index in self.run_many(strings)]
+
+    def iter_trace(self, cadena: str) -> Iterator[TraceStep]:
+        """
+        Genera los pasos de la simulación uno a uno, sin guardarlos.
+
+        El primer paso corresponde al estado inicial. Un símbolo fuera del
+        alfabeto lanza `ValueError` al llegar a él.
+        """
+        names = self._state_names
+        symbol_index = self._symbol_index
+        table = self._table
+        k = self._num_symbols
+        current = self._initial_index
+
+        yield TraceStep(from_state="", to_state=names[current], symbol=None)
+
+        blocks = self._index_blocks(cadena)
+        if blocks is not None:
+            cadena = (self._symbol_names[j] for block in blocks for j in block)
+
+        for symbol in cadena:
+            j = symbol_index.get(symbol)
+            if j is None:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+
+            from_state = current
+            current = table[current * k + j]
+            yield TraceStep(from_state=names[from_state],
+                            to_state=names[current], symbol=symbol)
+
+    def simulate(self, cadena: str) -> TraceResult:
+        """
+        Simula la ejecución de una cadena en el AFD.
+
+        La traza se guarda como dos arreglos compactos de índices de estados
+        y símbolos, y sus pasos se construyen bajo demanda (ver `TraceSteps`).
+
+        Si el alfabeto tiene símbolos de varios caracteres, la cadena se
+        separa en su única secuencia de símbolos (ver `tokenizer`);
+        también se puede pasar una secuencia de símbolos ya separados, o
+        datos binarios (`bytes`, `bytearray`, `memoryview`) donde cada byte
+        `b` es el símbolo `chr(b)`.
+        """
+        symbol_index = self._symbol_index
+        table = self._table
+        k = self._num_symbols
+        current = self._initial_index
+
+        # Paso inicial
+        states = array(index_typecode(len(self._state_names)), [current])
+        symbols = array(index_typecode(k))
+        append_state = states.append
+        append_symbol = symbols.append
+
+        # Procesar cada símbolo sobre la tabla compilada
+        blocks = self._index_blocks(cadena)
+        if blocks is not None:
+            for block in blocks:
+                for j in block:
+                    current = table[current * k + j]
+                    append_state(current)
+                if isinstance(block, bytes) and symbols.typecode == "B":
+                    symbols.frombytes(block)
+                else:
+                    symbols.fromlist(list(block))
+        else:
+            for symbol in cadena:
+                j = symbol_index.get(symbol)
+                if j is None:
+                    raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+
+                current = table[current * k + j]
+                append_state(current)
+                append_symbol(j)
+
         # Verificar si es aceptada
-        accepted = current_state in self.finals
-        
-        return TraceResult(accepted=accepted, final_state=current_state, steps=steps)
+        accepted = self._is_final_index(current)
+        steps = TraceSteps(self._state_names, self._symbol_names, states, symbols)
+
+        return TraceResult(accepted=accepted, final_state=self._state_names[current],
+                           steps=steps)
@@ -0,0 +1,176 @@
+"""
+Validación en lote de corpus grandes usando varios procesos.
+
+Las cadenas se agrupan en bloques (`chunk_size`) que se reparten entre
+los procesos de un `ProcessPoolExecutor`. El AFD compilado se envía una
+sola vez a cada proceso, en el inicializador del pool, y cada tarea solo
+transporta su bloque de cadenas y devuelve los índices de los estados
+finales (ver `AFD.run_many`).
+
+La entrada puede ser cualquier iterable: los bloques se leen a medida
+que hay procesos libres, con un número acotado de tareas en curso, así
+que la memoria no depende del tamaño del corpus.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from .afd import AFD
+
+# Cadenas por tarea enviada a un proceso
+DEFAULT_CHUNK_SIZE = 20_000
+
+# AFD del proceso trabajador (lo asigna `_init_worker`)
+_worker_afd: Optional[AFD] = None
+
+
+class BatchChunk(NamedTuple):
+    """
+    Resultado de validar un bloque de cadenas.
+
+    Tiene los siguientes campos:
+    * `start`: posición de la primera cadena del bloque en la entrada
+    * `strings`: las cadenas del bloque
+    * `final_indices`: índice del estado final de cada cadena (ver
+      `AFD.state_name`), o -1 si tiene símbolos fuera del alfabeto
+    """
+    start: int
+    strings: List[str]
+    final_indices: array
+
+
+def _init_worker(afd: AFD) -> None:
+    """Guarda el AFD compilado en el proceso trabajador."""
+    global _worker_afd
+    _worker_afd = afd
+
+
+def _run_chunk(afd: AFD, strings: List[str]) -> array:
+    """Calcula los estados finales de un bloque como `array('i')`."""
+    final = afd.run_many(strings)
+    if isinstance(final, array):
+        return final
+    result = array("i")
+    result.frombytes(final.astype("int32").tobytes())
+    return result
+
+
+def _run_worker_chunk(strings: List[str]) -> array:
+    return _run_chunk(_worker_afd, strings)
+
+
+def _chunks(strings: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(strings)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_chunks(afd: AFD, strings: Iterable[str], workers: Optional[int] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                ordered: bool = True) -> Iterator[BatchChunk]:
+    """
+    Valida las cadenas por bloques y los devuelve a medida que terminan.
+
+    :param afd: AFD con el que se validan las cadenas
+    :param strings: cadenas de entrada (lista o cualquier iterable)
+    :param workers: número de procesos; None usa todos los núcleos y
+                    1 valida en el proceso actual
+    :param chunk_size: cadenas por bloque
+    :param ordered: si es False, los bloques se entregan en el orden en que
+                    terminan (usar `BatchChunk.start` para ubicarlos)
+    :return: iterador de `BatchChunk`
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(strings, chunk_size)
+
+    if workers == 1:
+        start = 0
+        for chunk in chunks:
+            yield BatchChunk(start, chunk, _run_chunk(afd, chunk))
+            start += len(chunk)
+        return
+
+    # Si todo cabe en un bloque no vale la pena crear procesos
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        yield BatchChunk(0, first, _run_chunk(afd, first))
+        return
+
+    def pending_chunks():
+        yield first
+        yield second
+        yield from chunks
+
+    max_pending = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(afd,)) as executor:
+        source = pending_chunks()
+        pending = deque()
+        start = 0
+
+        def submit_next() -> bool:
+            nonlocal start
+            chunk = next(source, None)
+            if chunk is None:
+                return False
+            future = executor.submit(_run_worker_chunk, chunk)
+            pending.append((future, start, chunk))
+            start += len(chunk)
+            return True
+
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        try:
+            yield from _drain(pending, submit_next, ordered)
+        finally:
+            # Si el consumidor abandona la iteración, descartar lo pendiente
+            for future, _, _ in pending:
+                future.cancel()
+
+
+def _drain(pending: deque, submit_next, ordered: bool) -> Iterator[BatchChunk]:
+    """Entrega los bloques en curso reponiendo una tarea por cada uno."""
+    while pending:
+        if ordered:
+            future, chunk_start, chunk = pending.popleft()
+            yield BatchChunk(chunk_start, chunk, future.result())
+            submit_next()
+            continue
+
+        done, _ = wait([entry[0] for entry in pending], return_when=FIRST_COMPLETED)
+        for entry in [entry for entry in pending if entry[0] in done]:
+            pending.remove(entry)
+            future, chunk_start, chunk = entry
+            yield BatchChunk(chunk_start, chunk, future.result())
+            submit_next()
+
+
+def validate_batch(afd: AFD, strings: Iterable[str], workers: Optional[int] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> array:
+    """
+    Valida todas las cadenas y devuelve sus estados finales en orden.
+
+    :param afd: AFD con el que se validan las cadenas
+    :param strings: cadenas de entrada
+    :param workers: número de procesos (ver `iter_chunks`)
+    :param chunk_size: cadenas por bloque
+    :return: `array('i')` con el índice del estado final de cada cadena,
+             o -1 si tiene símbolos fuera del alfabeto
+    """
+    final = array("i")
+    for chunk in iter_chunks(afd, strings, workers=workers, chunk_size=chunk_size):
+        final.extend(chunk.final_indices)
+    return final
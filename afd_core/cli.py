@@ -0,0 +1,106 @@
+"""
+Interfaz de línea de comandos para validar corpus con un AFD.
+
+Uso:
+    python -m afd_core.cli validate afd.json cadenas.txt[.gz] [-o salida.csv]
+    python -m afd_core.cli scan afd.json registros.log [--delimiter '\n']
+
+Cada línea del archivo de entrada es una cadena (una línea vacía es la
+cadena vacía). Los resultados se escriben a medida que se validan, en la
+salida estándar (TSV: `índice<TAB>cadena<TAB>resultado<TAB>estado final`)
+o en el archivo indicado con `-o` (CSV, JSONL o TSV según la extensión,
+ver `file_validator`). Al terminar se informa el rendimiento por stderr.
+
+`scan` valida un archivo sin comprimir directamente desde el mapa de
+memoria (ver `scanner`) y solo informa el resumen; es el camino rápido
+para archivos de registro muy grandes.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from .batch import DEFAULT_CHUNK_SIZE
+from .file_validator import FORMATS, ValidationStats, validate_file
+from .persistence import load_from_json
+from .scanner import scan_blocks
+
+
+def _validate(args: argparse.Namespace) -> int:
+    afd = load_from_json(args.afd)
+    stats = validate_file(afd, args.input, args.output, fmt=args.format,
+                          workers=args.workers, chunk_size=args.chunk_size)
+    print(stats.summary(), file=sys.stderr)
+    return 0
+
+
+def _delimiter(text: str) -> bytes:
+    """
+    Convierte el delimitador de la línea de comandos a bytes. Admite
+    secuencias de escape ('\\n', '\\t', '\\0', '\\xHH'); los demás caracteres
+    se codifican en UTF-8.
+    """
+    try:
+        # unicode_escape deja cada byte sin escapar como el carácter de igual código
+        delimiter = text.encode("utf-8").decode("unicode_escape").encode("latin-1")
+    except UnicodeError:
+        raise argparse.ArgumentTypeError(
+            f"delimitador inválido: {text!r} (usar \\xHH para bytes arbitrarios)")
+    if not delimiter:
+        raise argparse.ArgumentTypeError("el delimitador no puede ser vacío")
+    return delimiter
+
+
+def _scan(args: argparse.Namespace) -> int:
+    afd = load_from_json(args.afd)
+
+    # Solo se cuentan los resultados de cada bloque, sin guardarlos
+    started = time.perf_counter()
+    total = accepted = rejected = errors = 0
+    for block in scan_blocks(afd, args.input, args.delimiter):
+        counts = block.counts()
+        total += len(block.final_indices)
+        accepted += counts[0]
+        rejected += counts[1]
+        errors += counts[2]
+    stats = ValidationStats(total=total, accepted=accepted, rejected=rejected, errors=errors,
+                            seconds=time.perf_counter() - started)
+    print(stats.summary(), file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m afd_core.cli",
+                                     description="Herramientas de línea de comandos para AFDs.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate = subparsers.add_parser("validate", help="Valida un archivo de cadenas (una por línea)")
+    validate.add_argument("afd", help="AFD en formato JSON")
+    validate.add_argument("input", help="Archivo con una cadena por línea")
+    validate.add_argument("--workers", type=int, default=None,
+                          help="Número de procesos (por defecto, todos los núcleos)")
+    validate.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                          help="Cadenas por bloque enviado a cada proceso")
+    validate.add_argument("-o", "--output", default=None,
+                          help="Archivo de salida (.csv, .jsonl o .tsv, opcionalmente .gz)")
+    validate.add_argument("--format", choices=FORMATS, default=None,
+                          help="Formato de salida (por defecto, según la extensión)")
+    validate.set_defaults(func=_validate)
+
+    scan = subparsers.add_parser("scan", help="Valida cada registro de un archivo grande sin cargarlo en memoria")
+    scan.add_argument("afd", help="AFD en formato JSON")
+    scan.add_argument("input", help="Archivo de registros (sin comprimir)")
+    scan.add_argument("--delimiter", type=_delimiter, default="\\n",
+                      help="Separador de registros, admite escapes como \\n o \\t (por defecto, \\n)")
+    scan.set_defaults(func=_scan)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
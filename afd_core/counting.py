@@ -0,0 +1,196 @@
+"""
+Conteo exacto de las cadenas aceptadas por un AFD, sin enumerarlas.
+
+`count_accepted(afd, n)` devuelve cuántas cadenas de longitud exactamente
+`n` acepta el AFD y `count_accepted_upto(afd, n)` cuántas de longitud a lo
+sumo `n`. Los resultados son enteros de Python (sin desbordamiento).
+
+Para longitudes moderadas se usa programación dinámica sobre la tabla de
+transiciones, O(n × estados × símbolos) con memoria O(estados). Cuando
+`n` es muy grande respecto al número de estados se usa exponenciación
+binaria de la matriz de transiciones, O(estados³ × log n).
+
+`PathCounts` guarda la tabla completa de conteos por longitud y estado,
+que usan el muestreo uniforme (`sampling`) y el ranking de cadenas.
+"""
+
+import weakref
+from typing import List
+
+from .afd import AFD
+
+Matrix = List[List[int]]
+
+
+def _transition_matrix(afd: AFD) -> Matrix:
+    """`M[s][t]` = número de símbolos que llevan del estado `s` al `t`."""
+    table = afd._table
+    k = afd._num_symbols
+    n = len(afd._state_names)
+    matrix = [[0] * n for _ in range(n)]
+    for state in range(n):
+        row = matrix[state]
+        for target in table[state * k:(state + 1) * k]:
+            row[target] += 1
+    return matrix
+
+
+def _final_vector(afd: AFD) -> List[int]:
+    return list(afd._final_flags())
+
+
+def _use_matrix_power(afd: AFD, n: int) -> bool:
+    """Decide si la exponenciación de matrices es más barata que la DP."""
+    states = len(afd._state_names)
+    return states * states * n.bit_length() < n * max(afd._num_symbols, 1)
+
+
+def _mat_mult(a: Matrix, b: Matrix) -> Matrix:
+    result = []
+    for row_a in a:
+        row = [0] * len(b[0])
+        for k, value in enumerate(row_a):
+            if value:
+                row_b = b[k]
+                for j, other in enumerate(row_b):
+                    if other:
+                        row[j] += value * other
+        result.append(row)
+    return result
+
+
+def _vec_mult(v: List[int], m: Matrix) -> List[int]:
+    result = [0] * len(m[0])
+    for k, value in enumerate(v):
+        if value:
+            for j, other in enumerate(m[k]):
+                if other:
+                    result[j] += value * other
+    return result
+
+
+def _vec_power(v: List[int], m: Matrix, exponent: int) -> List[int]:
+    """Calcula `v · m^exponent` por exponenciación binaria."""
+    while exponent:
+        if exponent & 1:
+            v = _vec_mult(v, m)
+        exponent >>= 1
+        if exponent:
+            m = _mat_mult(m, m)
+    return v
+
+
+def _forward_counts(afd: AFD, n: int, cumulative: bool) -> int:
+    """
+    DP hacia adelante: `counts[s]` es el número de cadenas de la longitud
+    actual que llevan del estado inicial al estado `s`.
+    """
+    table = afd._table
+    k = afd._num_symbols
+    states = len(afd._state_names)
+    finals = [i for i, flag in enumerate(afd._final_flags()) if flag]
+
+    counts = [0] * states
+    counts[afd._initial_index] = 1
+    total = sum(counts[f] for f in finals) if cumulative else 0
+    for _ in range(n):
+        following = [0] * states
+        for state, value in enumerate(counts):
+            if value:
+                for target in table[state * k:(state + 1) * k]:
+                    following[target] += value
+        counts = following
+        if cumulative:
+            total += sum(counts[f] for f in finals)
+    return total if cumulative else sum(counts[f] for f in finals)
+
+
+def count_accepted(afd: AFD, n: int) -> int:
+    """
+    Cuenta las cadenas de longitud exactamente `n` que acepta el AFD.
+
+    :param afd: instancia de AFD ya validada
+    :param n: longitud de las cadenas
+    :return: número exacto de cadenas aceptadas de longitud `n`
+    """
+    if n < 0:
+        raise ValueError("La longitud debe ser no negativa")
+    if not _use_matrix_power(afd, n):
+        return _forward_counts(afd, n, cumulative=False)
+
+    start = [0] * len(afd._state_names)
+    start[afd._initial_index] = 1
+    reached = _vec_power(start, _transition_matrix(afd), n)
+    return sum(value for value, final in zip(reached, _final_vector(afd)) if final)
+
+
+def count_accepted_upto(afd: AFD, n: int) -> int:
+    """
+    Cuenta las cadenas de longitud entre 0 y `n` (inclusive) que acepta el AFD.
+
+    :param afd: instancia de AFD ya validada
+    :param n: longitud máxima de las cadenas
+    :return: número exacto de cadenas aceptadas de longitud <= `n`
+    """
+    if n < 0:
+        raise ValueError("La longitud debe ser no negativa")
+    if not _use_matrix_power(afd, n):
+        return _forward_counts(afd, n, cumulative=True)
+
+    # Matriz aumentada [[M, f], [0, 1]]: la última columna de su potencia
+    # n + 1 acumula sum(M^r · f) para r = 0..n
+    states = len(afd._state_names)
+    augmented = [row + [final] for row, final in
+                 zip(_transition_matrix(afd), _final_vector(afd))]
+    augmented.append([0] * states + [1])
+    start = [0] * (states + 1)
+    start[afd._initial_index] = 1
+    return _vec_power(start, augmented, n + 1)[states]
+
+
+class PathCounts:
+    """
+    Tabla de conteo de caminos hacia estados finales.
+
+    `row(r)[s]` es el número de cadenas de longitud `r` que, leídas desde
+    el estado `s`, terminan en un estado final. Las filas se calculan bajo
+    demanda y se conservan, así que consultar longitudes ya vistas es O(1).
+    """
+
+    def __init__(self, afd: AFD):
+        # Se guarda la tabla compilada y no el AFD, para que la caché
+        # (`path_counts`) no mantenga vivo al AFD
+        self.table = afd._table
+        self.num_symbols = afd._num_symbols
+        self.initial = afd._initial_index
+        self.rows: List[List[int]] = [_final_vector(afd)]
+
+    def row(self, length: int) -> List[int]:
+        """Devuelve la fila de conteos para cadenas de longitud `length`."""
+        table = self.table
+        k = self.num_symbols
+        while len(self.rows) <= length:
+            previous = self.rows[-1]
+            self.rows.append([sum(previous[target]
+                                  for target in table[state * k:(state + 1) * k])
+                              for state in range(len(previous))])
+        return self.rows[length]
+
+    def count(self, length: int) -> int:
+        """Número de cadenas aceptadas de longitud `length`."""
+        return self.row(length)[self.initial]
+
+
+_path_counts_cache: "weakref.WeakKeyDictionary[AFD, PathCounts]" = weakref.WeakKeyDictionary()
+
+
+def path_counts(afd: AFD) -> PathCounts:
+    """
+    Devuelve la tabla de conteos del AFD, reutilizándola entre llamadas
+    mientras el AFD no se vuelva a compilar.
+    """
+    counts = _path_counts_cache.get(afd)
+    if counts is None or counts.table is not afd._table:
+        counts = PathCounts(afd)
+        _path_counts_cache[afd] = counts
+    return counts
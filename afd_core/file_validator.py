@@ -0,0 +1,180 @@
+"""
+Validación de archivos de cadenas con memoria acotada.
+
+El archivo de entrada (texto plano o `.gz`) se lee línea por línea, se
+valida por bloques con `batch.iter_chunks` y cada resultado se escribe de
+inmediato en la salida, así que la memoria usada depende del tamaño de
+bloque y no del tamaño del archivo.
+
+Formatos de salida (uno por línea de entrada):
+
+* `csv`: columnas `index,string,accepted,final_state`
+* `jsonl`: objetos `{"index", "string", "accepted", "final_state"}`
+* `tsv`: `índice<TAB>cadena<TAB>ACEPTADA|RECHAZADA|ERROR<TAB>estado final`
+
+`index` empieza en 1 (número de línea). Las cadenas con símbolos fuera del
+alfabeto se reportan como no aceptadas y sin estado final (`null` en JSONL,
+vacío en CSV, `ERROR` en TSV).
+"""
+
+import csv
+import gzip
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, TextIO
+
+from .afd import AFD
+from .batch import DEFAULT_CHUNK_SIZE, iter_chunks
+
+FORMATS = ("csv", "jsonl", "tsv")
+
+
+@dataclass
+class ValidationStats:
+    """Resumen de una validación de archivo."""
+
+    total: int = 0
+    """Cadenas procesadas."""
+
+    accepted: int = 0
+    """Cadenas aceptadas."""
+
+    rejected: int = 0
+    """Cadenas rechazadas."""
+
+    errors: int = 0
+    """Cadenas con símbolos fuera del alfabeto."""
+
+    seconds: float = 0.0
+    """Tiempo total de la validación."""
+
+    @property
+    def rate(self) -> float:
+        """Cadenas procesadas por segundo."""
+        return self.total / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.total} cadenas en {self.seconds:.2f} s "
+                f"({self.rate:,.0f} cadenas/s) | Aceptadas: {self.accepted} | "
+                f"Rechazadas: {self.rejected} | Errores: {self.errors}")
+
+
+def open_text(path: str, mode: str = "r") -> TextIO:
+    """Abre un archivo de texto UTF-8, descomprimiendo/comprimiendo si termina en `.gz`."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def read_strings(path: str) -> Iterator[str]:
+    """Lee las cadenas del archivo una a una, sin el salto de línea."""
+    with open_text(path) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def infer_format(output_path: Optional[str]) -> str:
+    """Deduce el formato de salida a partir de la extensión del archivo."""
+    if output_path:
+        name = output_path[:-3] if output_path.endswith(".gz") else output_path
+        for fmt in FORMATS:
+            if name.endswith("." + fmt):
+                return fmt
+    return "tsv"
+
+
+def _row_writer(out: TextIO, fmt: str) -> Callable[[int, str, bool, Optional[str]], None]:
+    """Devuelve una función que escribe una fila de resultados en `fmt`."""
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["index", "string", "accepted", "final_state"])
+        return lambda index, cadena, accepted, final_state: writer.writerow(
+            [index, cadena, "true" if accepted else "false", final_state or ""])
+    if fmt == "jsonl":
+        return lambda index, cadena, accepted, final_state: out.write(json.dumps(
+            {"index": index, "string": cadena, "accepted": accepted,
+             "final_state": final_state}, ensure_ascii=False) + "\n")
+    if fmt == "tsv":
+        def write_tsv(index, cadena, accepted, final_state):
+            if final_state is None:
+                out.write(f"{index}\t{cadena}\tERROR\t-\n")
+            else:
+                resultado = "ACEPTADA" if accepted else "RECHAZADA"
+                out.write(f"{index}\t{cadena}\t{resultado}\t{final_state}\n")
+        return write_tsv
+    raise ValueError(f"Formato de salida desconocido: '{fmt}'")
+
+
+def validate_lines(afd: AFD, strings, out: TextIO, fmt: str = "tsv",
+                   workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   progress: Optional[Callable[[ValidationStats], None]] = None
+                   ) -> ValidationStats:
+    """
+    Valida un iterable de cadenas escribiendo cada resultado en `out`.
+
+    :param afd: AFD con el que se validan las cadenas
+    :param strings: iterable de cadenas (se consume por bloques)
+    :param out: flujo de texto de salida
+    :param fmt: formato de salida (`csv`, `jsonl` o `tsv`)
+    :param workers: número de procesos (ver `batch.iter_chunks`)
+    :param chunk_size: cadenas por bloque
+    :param progress: función que recibe las estadísticas tras cada bloque
+    :return: estadísticas de la validación
+    """
+    write_row = _row_writer(out, fmt)
+    names = afd._state_names
+    stats = ValidationStats()
+    started = time.perf_counter()
+
+    for chunk in iter_chunks(afd, strings, workers=workers, chunk_size=chunk_size):
+        index = chunk.start + 1
+        for cadena, final_index in zip(chunk.strings, chunk.final_indices):
+            if final_index < 0:
+                stats.errors += 1
+                write_row(index, cadena, False, None)
+            else:
+                accepted = afd._is_final_index(final_index)
+                if accepted:
+                    stats.accepted += 1
+                else:
+                    stats.rejected += 1
+                write_row(index, cadena, accepted, names[final_index])
+            index += 1
+
+        stats.total += len(chunk.strings)
+        stats.seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(stats)
+
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def validate_file(afd: AFD, input_path: str, output_path: Optional[str] = None,
+                  fmt: Optional[str] = None, workers: Optional[int] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  progress: Optional[Callable[[ValidationStats], None]] = None
+                  ) -> ValidationStats:
+    """
+    Valida un archivo de cadenas (una por línea) y escribe los resultados.
+
+    :param afd: AFD con el que se validan las cadenas
+    :param input_path: archivo de entrada (`.gz` se descomprime al vuelo)
+    :param output_path: archivo de salida (`.gz` se comprime); None o "-"
+                        escribe en la salida estándar
+    :param fmt: formato de salida; por defecto se deduce de la extensión
+    :param workers: número de procesos (ver `batch.iter_chunks`)
+    :param chunk_size: cadenas por bloque
+    :param progress: función que recibe las estadísticas tras cada bloque
+    :return: estadísticas de la validación
+    """
+    to_stdout = output_path in (None, "-")
+    fmt = fmt or infer_format(None if to_stdout else output_path)
+    strings = read_strings(input_path)
+
+    if to_stdout:
+        return validate_lines(afd, strings, sys.stdout, fmt, workers, chunk_size, progress)
+    with open_text(output_path, "w") as out:
+        return validate_lines(afd, strings, out, fmt, workers, chunk_size, progress)
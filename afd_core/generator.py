@@ -1,13 +1,118 @@
-from collections import deque
-from typing import List
+from itertools import islice
+from typing import Iterator, List, Optional
 from .afd import AFD
 
 
+def _live_step(afd: AFD, live: bytearray, coreachable: bytearray) -> bytearray:
+    """
+    A partir de los estados que aceptan en exactamente `r` pasos, calcula
+    los que aceptan en exactamente `r + 1` pasos.
+    """
+    table = afd._table
+    k = afd._num_symbols
+    result = bytearray(len(live))
+    for state in range(len(live)):
+        if coreachable[state]:
+            base = state * k
+            for j in range(k):
+                if live[table[base + j]]:
+                    result[state] = 1
+                    break
+    return result
+
+
+def _strings_of_length(afd: AFD, live: List[bytearray], length: int) -> Iterator[str]:
+    """
+    Genera en orden lexicográfico (según `afd.alphabet`) las cadenas
+    aceptadas de longitud `length`.
+
+    `live[r]` marca los estados que aceptan en exactamente `r` pasos; solo
+    se avanza hacia esos estados, así que cada rama del DFS produce al
+    menos una cadena y la memoria usada es O(length).
+    """
+    table = afd._table
+    k = afd._num_symbols
+    symbols = afd._symbol_names
+    initial = afd._initial_index
+    if not live[length][initial]:
+        return
+    if length == 0:
+        yield ""
+        return
+
+    path: List[str] = []
+    stack_states = [initial]
+    stack_next = [0]
+    while stack_next:
+        state = stack_states[-1]
+        remaining = length - len(path) - 1
+        live_next = live[remaining]
+        base = state * k
+        j = stack_next[-1]
+        while j < k and not live_next[table[base + j]]:
+            j += 1
+
+        if j == k:
+            stack_states.pop()
+            stack_next.pop()
+            if path:
+                path.pop()
+            continue
+
+        stack_next[-1] = j + 1
+        if remaining == 0:
+            yield "".join(path) + symbols[j]
+        else:
+            path.append(symbols[j])
+            stack_states.append(table[base + j])
+            stack_next.append(0)
+
+
+def iter_accepted(afd: AFD, order: str = "shortlex",
+                  max_length: Optional[int] = None) -> Iterator[str]:
+    """
+    Genera perezosamente las cadenas aceptadas por el AFD.
+
+    Las cadenas salen en orden shortlex: por longitud y, dentro de cada
+    longitud, según el orden de los símbolos en `afd.alphabet`. Sin
+    `max_length` el generador es infinito si el lenguaje lo es; si el
+    lenguaje es finito termina después de su cadena más larga.
+
+    La memoria usada es O(estados × longitud): un conjunto de estados
+    vivos por longitud más la pila del DFS de la longitud actual.
+
+    :param afd: instancia de AFD ya validada
+    :param order: orden de enumeración (solo se admite "shortlex")
+    :param max_length: longitud máxima de las cadenas (None: sin límite)
+    :return: iterador de cadenas aceptadas
+    """
+    if order != "shortlex":
+        raise ValueError(f"Orden de enumeración no soportado: '{order}'")
+
+    coreachable = afd._coreachable()
+    if not coreachable[afd._initial_index]:
+        return
+
+    # Un lenguaje finito no tiene cadenas de longitud >= número de estados
+    if not afd._has_useful_cycle(coreachable):
+        bound = len(afd._state_names) - 1
+        max_length = bound if max_length is None else min(max_length, bound)
+
+    live = [afd._final_flags()]
+    length = 0
+    while max_length is None or length <= max_length:
+        if length > 0:
+            live.append(_live_step(afd, live[-1], coreachable))
+        yield from _strings_of_length(afd, live, length)
+        length += 1
+
+
 def generate_strings(afd: AFD, limit: int = 10, max_length: int = 20) -> List[str]:
     """
     Genera las primeras 'limit' cadenas aceptadas por el AFD,
-    ordenadas por longitud (usando BFS).
-    
+    ordenadas por longitud y, dentro de cada longitud, según el orden de
+    los símbolos en `afd.alphabet` (ver `iter_accepted`).
+
     :param afd: instancia de AFD ya validada
     :param limit: número máximo de cadenas a devolver
     :param max_length: límite de longitud para evitar loops infinitos
@@ -15,30 +120,6 @@ def generate_strings(afd: AFD, limit: int = 10, max_length: int = 20) -> List[st
     """
     afd.validate()
 
-    results: List[str] = []
-    queue = deque()
-    visited = set()
-
-    # Nodo inicial: (estado_actual, cadena_construida)
-    queue.append((afd.initial, ""))
-
-    while queue and len(results) < limit:
-        state, string = queue.popleft()
-
-        # Si es estado final (y no es cadena vacía) → aceptar
-        if state in afd.finals and string not in results:
-            results.append(string)
-            if len(results) >= limit:
-                break
-
-        # Expandir solo hasta max_length
-        if len(string) < max_length:
-            for symbol in afd.alphabet:
-                next_state = afd.transitions[state][symbol]
-                new_string = string + symbol
-                # Usamos visited para no explotar en autómatas con ciclos
-                if (next_state, new_string) not in visited:
-                    visited.add((next_state, new_string))
-                    queue.append((next_state, new_string))
-
-    return results
+    if limit <= 0:
+        return []
+    return list(islice(iter_accepted(afd, max_length=max_length), limit))
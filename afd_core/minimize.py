@@ -0,0 +1,183 @@
+"""
+Minimización de AFDs con el algoritmo de Hopcroft, y eliminación de
+estados inútiles (`trim`).
+
+Se trabaja sobre la tabla compilada del AFD:
+
+1. Se descartan los estados no alcanzables desde el inicial (BFS).
+2. Se parte de la partición {finales, no finales} y se refina: cada par
+   (bloque, símbolo) de la lista de trabajo separa los bloques que tienen
+   estados con y sin transición hacia el bloque con ese símbolo. De las
+   dos mitades de un bloque partido solo se agrega la menor a la lista de
+   trabajo, lo que da el costo O(n · k · log n).
+3. Cada bloque final es un estado del AFD mínimo, con el nombre de su
+   primer estado (según el orden de `afd.states`).
+
+Las transiciones inversas se guardan en formato CSR (`offsets` y
+`sources`), así que la memoria es O(n · k) enteros.
+"""
+
+from array import array
+from typing import Dict, List, Tuple
+
+from .afd import AFD
+
+
+def _inverse_table(table: array, n: int, k: int) -> Tuple[array, array]:
+    """
+    Construye las transiciones inversas en formato CSR: los predecesores de
+    `t` con el símbolo `j` son `sources[offsets[t*k+j]:offsets[t*k+j+1]]`.
+    """
+    offsets = array("i", bytes(4 * (n * k + 1)))
+    for s in range(n):
+        base = s * k
+        for j in range(k):
+            offsets[table[base + j] * k + j + 1] += 1
+    for i in range(n * k):
+        offsets[i + 1] += offsets[i]
+
+    fill = offsets[:-1]
+    sources = array("i", bytes(4 * (n * k)))
+    for s in range(n):
+        base = s * k
+        for j in range(k):
+            key = table[base + j] * k + j
+            sources[fill[key]] = s
+            fill[key] += 1
+    return offsets, sources
+
+
+def _refine(table: array, finals: bytearray, k: int) -> List[int]:
+    """
+    Algoritmo de Hopcroft sobre un AFD completo con estados 0..n-1.
+
+    :return: bloque asignado a cada estado
+    """
+    n = len(finals)
+    accepting = {s for s in range(n) if finals[s]}
+    rejecting = set(range(n)) - accepting
+    blocks: List[set] = [b for b in (accepting, rejecting) if b]
+    block_of = [0] * n
+    for b, members in enumerate(blocks):
+        for s in members:
+            block_of[s] = b
+    if len(blocks) < 2 or k == 0:
+        return block_of
+
+    offsets, sources = _inverse_table(table, n, k)
+
+    # Basta con empezar por el bloque menor, con todos los símbolos
+    smaller = 0 if len(blocks[0]) <= len(blocks[1]) else 1
+    pending = set((smaller, j) for j in range(k))
+    worklist = [(smaller, j) for j in range(k)]
+
+    while worklist:
+        splitter, j = worklist.pop()
+        pending.discard((splitter, j))
+
+        # Estados con transición hacia `splitter` por el símbolo `j`,
+        # agrupados por bloque
+        touched: Dict[int, List[int]] = {}
+        for target in tuple(blocks[splitter]):
+            key = target * k + j
+            for i in range(offsets[key], offsets[key + 1]):
+                s = sources[i]
+                touched.setdefault(block_of[s], []).append(s)
+
+        for b, moving in touched.items():
+            members = blocks[b]
+            if len(moving) == len(members):
+                continue
+
+            # Mover los estados tocados a un bloque nuevo
+            new = len(blocks)
+            members.difference_update(moving)
+            blocks.append(set(moving))
+            for s in moving:
+                block_of[s] = new
+
+            for symbol in range(k):
+                if (b, symbol) in pending:
+                    entry = (new, symbol)
+                else:
+                    entry = (new, symbol) if len(moving) <= len(members) else (b, symbol)
+                pending.add(entry)
+                worklist.append(entry)
+    return block_of
+
+
+def minimize(afd: AFD) -> Tuple[AFD, Dict[str, str]]:
+    """
+    Calcula el AFD mínimo equivalente.
+
+    :param afd: instancia de AFD ya validada
+    :return: (AFD mínimo, diccionario estado original -> estado del AFD
+             mínimo). Los estados no alcanzables no aparecen en el
+             diccionario.
+    """
+    k = afd._num_symbols
+    reachable = [i for i, flag in enumerate(afd._reachable()) if flag]
+    local = {state: i for i, state in enumerate(reachable)}
+
+    table = afd._table
+    sub_table = array("i")
+    for state in reachable:
+        sub_table.extend(local[t] for t in table[state * k:(state + 1) * k])
+    finals = bytearray(1 if afd._is_final_index(s) else 0 for s in reachable)
+
+    block_of = _refine(sub_table, finals, k)
+
+    # Representante de cada bloque: su primer estado en el orden original
+    names = afd._state_names
+    block_name: Dict[int, str] = {}
+    for i, state in enumerate(reachable):
+        block_name.setdefault(block_of[i], names[state])
+    mapping = {names[state]: block_name[block_of[i]] for i, state in enumerate(reachable)}
+
+    symbols = afd._symbol_names
+    transitions: Dict[str, Dict[str, str]] = {}
+    new_finals: List[str] = []
+    for i, state in enumerate(reachable):
+        name = names[state]
+        if mapping[name] != name:
+            continue
+        base = i * k
+        transitions[name] = {symbols[j]: mapping[names[reachable[sub_table[base + j]]]]
+                             for j in range(k)}
+        if finals[i]:
+            new_finals.append(name)
+
+    minimal = AFD(list(transitions), list(symbols), mapping[afd.initial],
+                  new_finals, transitions)
+    return minimal, mapping
+
+
+def trim(afd: AFD) -> AFD:
+    """
+    Elimina los estados no alcanzables y reúne los estados muertos (desde
+    los que no se llega a ningún final) en un único sumidero, que toma el
+    nombre del primer estado muerto. Cuesta un BFS por cada dirección.
+
+    :param afd: instancia de AFD ya validada
+    :return: AFD equivalente sin estados inútiles
+    """
+    k = afd._num_symbols
+    table = afd._table
+    names = afd._state_names
+    symbols = afd._symbol_names
+    coreachable = afd._coreachable()
+    reachable = [i for i, flag in enumerate(afd._reachable()) if flag]
+
+    sink = next((names[s] for s in reachable if not coreachable[s]), None)
+    transitions: Dict[str, Dict[str, str]] = {}
+    for state in reachable:
+        if coreachable[state]:
+            row = table[state * k:(state + 1) * k]
+            transitions[names[state]] = {symbols[j]: names[t] if coreachable[t] else sink
+                                         for j, t in enumerate(row)}
+    if sink is not None:
+        transitions[sink] = {symbol: sink for symbol in symbols}
+
+    finals = [names[s] for s in reachable if coreachable[s] and afd._is_final_index(s)]
+    initial = afd.initial if coreachable[afd._initial_index] else sink
+    return AFD(list(transitions), list(symbols), initial, finals, transitions)
@@ -0,0 +1,212 @@
+"""
+Autómatas finitos no deterministas (con transiciones ε) y su conversión a
+AFD por construcción de subconjuntos.
+
+Cada conjunto de estados del AFN se representa como un entero usado como
+bitset (bit `i` = estado con índice `i`). Las clausuras ε se calculan una
+sola vez por estado y se incorporan a la tabla de movimientos, así que
+avanzar un conjunto con un símbolo es un OR de los movimientos de sus
+estados. Los conjuntos se numeran en un diccionario (bitset -> índice) a
+medida que aparecen en la lista de trabajo, de modo que solo se
+construyen los subconjuntos alcanzables.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from .afd import AFD
+from .operations import unique_name
+
+# Nombre del estado del AFD que corresponde al conjunto vacío
+EMPTY_SET_NAME = "∅"
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Índices de los bits encendidos de `mask`, de menor a mayor."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class NFA:
+    # Símbolo reservado para las transiciones ε
+    EPSILON = "ε"
+
+    def __init__(self, states: List[str], alphabet: List[str],
+                 initial: str, finals: List[str],
+                 transitions: Dict[str, Dict[str, List[str]]]):
+        """
+        :param states: lista de estados
+        :param alphabet: símbolos de entrada (sin `NFA.EPSILON`)
+        :param initial: estado inicial
+        :param finals: estados finales
+        :param transitions: estado -> símbolo -> lista de estados
+                            siguientes; los pares que faltan no tienen
+                            transición y `NFA.EPSILON` indica transiciones ε
+        """
+        self.states = states
+        self.alphabet = alphabet
+        self.initial = initial
+        self.finals = finals
+        self.transitions = transitions
+
+        # Validar el AFN al crearlo
+        if not self.validate():
+            raise ValueError("AFN inválido")
+
+        self.compile()
+
+    def validate(self) -> bool:
+        """Valida que los estados y símbolos usados en el AFN existan."""
+        try:
+            states = set(self.states)
+            symbols = set(self.alphabet)
+            if self.EPSILON in symbols:
+                raise ValueError(f"'{self.EPSILON}' está reservado para las transiciones ε")
+
+            if self.initial not in states:
+                raise ValueError(f"Estado inicial '{self.initial}' no está en la lista de estados")
+
+            for final in self.finals:
+                if final not in states:
+                    raise ValueError(f"Estado final '{final}' no está en la lista de estados")
+
+            for state, row in self.transitions.items():
+                if state not in states:
+                    raise ValueError(f"Transiciones definidas para el estado inexistente '{state}'")
+                for symbol, targets in row.items():
+                    if symbol != self.EPSILON and symbol not in symbols:
+                        raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+                    for target in targets:
+                        if target not in states:
+                            raise ValueError(f"Transición desde '{state}' con '{symbol}' lleva a estado inexistente '{target}'")
+
+            return True
+
+        except ValueError:
+            return False
+
+    def compile(self) -> None:
+        """
+        Compila el AFN en bitsets.
+
+        `_closure[s]` es la clausura ε del estado `s` y `_moves[s * k + j]`
+        la clausura ε de los estados a los que se llega desde `s` con el
+        símbolo `j`. Si se modifican los atributos del AFN hay que volver a
+        llamarlo.
+        """
+        self._state_names: List[str] = list(dict.fromkeys(self.states))
+        index = {state: i for i, state in enumerate(self._state_names)}
+        self._symbol_names: List[str] = list(dict.fromkeys(self.alphabet))
+        n = len(self._state_names)
+
+        def targets(state: str, symbol: str) -> int:
+            mask = 0
+            for target in self.transitions.get(state, {}).get(symbol, ()):
+                mask |= 1 << index[target]
+            return mask
+
+        # Clausura ε de cada estado por DFS
+        epsilon = [targets(state, self.EPSILON) for state in self._state_names]
+        closure = []
+        for s in range(n):
+            mask = 1 << s
+            stack = [s]
+            while stack:
+                new = epsilon[stack.pop()] & ~mask
+                mask |= new
+                stack.extend(_bits(new))
+            closure.append(mask)
+        self._closure = closure
+
+        moves = []
+        for state in self._state_names:
+            for symbol in self._symbol_names:
+                moves.append(self._close(targets(state, symbol)))
+        self._moves = moves
+
+        final_mask = 0
+        for final in self.finals:
+            final_mask |= 1 << index[final]
+        self._final_mask = final_mask
+        self._initial_mask = closure[index[self.initial]]
+
+    def _close(self, mask: int) -> int:
+        """Clausura ε de un conjunto de estados."""
+        result = mask
+        for s in _bits(mask):
+            result |= self._closure[s]
+        return result
+
+    def _step(self, mask: int, j: int) -> int:
+        """Conjunto al que se llega desde `mask` con el símbolo de índice `j`."""
+        k = len(self._symbol_names)
+        moves = self._moves
+        result = 0
+        for s in _bits(mask):
+            result |= moves[s * k + j]
+        return result
+
+    def accepts(self, cadena: str) -> bool:
+        """
+        Indica si el AFN acepta la cadena, simulando el conjunto de estados
+        activos.
+
+        :param cadena: cadena de entrada
+        :return: True si algún estado activo al terminar es final
+        """
+        symbol_index = {symbol: j for j, symbol in enumerate(self._symbol_names)}
+        mask = self._initial_mask
+        for symbol in cadena:
+            j = symbol_index.get(symbol)
+            if j is None:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+            mask = self._step(mask, j)
+        return mask & self._final_mask != 0
+
+    def _set_name(self, mask: int) -> str:
+        if not mask:
+            return EMPTY_SET_NAME
+        return "{" + ",".join(self._state_names[s] for s in _bits(mask)) + "}"
+
+    def to_afd(self, max_states: Optional[int] = None) -> AFD:
+        """
+        Construye el AFD equivalente por construcción de subconjuntos.
+
+        Solo se generan los conjuntos alcanzables desde la clausura ε del
+        estado inicial. Cada estado del AFD se llama como su conjunto, por
+        ejemplo `{q0,q2}`, y el conjunto vacío (si es alcanzable) es `∅`.
+        Si dos conjuntos dan el mismo nombre (estados del AFN con `,`, `{`
+        o `}` en el nombre), al segundo se le agregan apóstrofos.
+
+        :param max_states: número máximo de estados del AFD (None: sin límite)
+        :return: AFD equivalente
+        """
+        k = len(self._symbol_names)
+        start = self._initial_mask
+        index: Dict[int, int] = {start: 0}
+        order: List[int] = [start]
+        table = array("i")
+        position = 0
+        while position < len(order):
+            mask = order[position]
+            for j in range(k):
+                following = self._step(mask, j)
+                target = index.get(following)
+                if target is None:
+                    if max_states is not None and len(order) >= max_states:
+                        raise ValueError(
+                            f"La construcción de subconjuntos supera el límite de {max_states} estados")
+                    target = index[following] = len(order)
+                    order.append(following)
+                table.append(target)
+            position += 1
+
+        taken: set = set()
+        names = [unique_name(self._set_name(mask), taken) for mask in order]
+        symbols = self._symbol_names
+        transitions = {name: {symbols[j]: names[table[i * k + j]] for j in range(k)}
+                       for i, name in enumerate(names)}
+        finals = [name for name, mask in zip(names, order) if mask & self._final_mask]
+        return AFD(names, list(symbols), names[0], finals, transitions)
@@ -0,0 +1,129 @@
+"""
+Operaciones booleanas entre AFDs por construcción de producto.
+
+El producto se construye de forma perezosa: se parte de la tupla de
+estados iniciales y solo se materializan las tuplas alcanzables, que se
+numeran en un diccionario (tupla -> índice) a medida que aparecen. La
+tabla de transiciones del producto es un arreglo plano indexado igual
+que la tabla compilada de `AFD`. Así, combinar muchos AFDs cuesta
+O(tuplas alcanzables × símbolos × componentes) y no el producto completo.
+
+Los alfabetos se unen; un símbolo que falta en un componente lleva a un
+sumidero implícito no final, que aparece como `∅` en los nombres de los
+estados. Cada estado del producto se llama como la tupla de sus
+componentes, por ejemplo `(q0,p1)`.
+"""
+
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .afd import AFD
+from .equivalence import _completed_table, _union_alphabet
+
+# Nombre del componente que corresponde al sumidero implícito
+SINK_NAME = "∅"
+
+
+def unique_name(name: str, taken: set) -> str:
+    """Agrega apóstrofos a `name` hasta que no choque con `taken`."""
+    while name in taken:
+        name += "'"
+    taken.add(name)
+    return name
+
+
+def product(afds: Sequence[AFD], accept: Callable[[Tuple[bool, ...]], bool]) -> AFD:
+    """
+    Construye el producto de varios AFDs con la condición de aceptación
+    `accept`, que recibe una tupla con la aceptación de cada componente.
+
+    :param afds: AFDs a combinar (al menos uno)
+    :param accept: función que decide si una tupla de estados es final
+    :return: AFD con los estados del producto alcanzables desde el inicial
+    """
+    if not afds:
+        raise ValueError("Se necesita al menos un AFD")
+
+    symbols = _union_alphabet(list(afds))
+    k = len(symbols)
+    tables = [_completed_table(afd, symbols)[0] for afd in afds]
+
+    start = tuple(afd._initial_index for afd in afds)
+    index: Dict[Tuple[int, ...], int] = {start: 0}
+    order: List[Tuple[int, ...]] = [start]
+    table = array("i")
+    position = 0
+    while position < len(order):
+        current = order[position]
+        for j in range(k):
+            following = tuple(t[s * k + j] for t, s in zip(tables, current))
+            target = index.get(following)
+            if target is None:
+                target = index[following] = len(order)
+                order.append(following)
+            table.append(target)
+        position += 1
+
+    # Nombres y estados finales
+    taken: set = set()
+    names = []
+    finals = []
+    for current in order:
+        parts = []
+        flags = []
+        for afd, s in zip(afds, current):
+            is_sink = s == len(afd._state_names)
+            parts.append(SINK_NAME if is_sink else afd._state_names[s])
+            flags.append(not is_sink and afd._is_final_index(s))
+        name = unique_name("(" + ",".join(parts) + ")", taken)
+        names.append(name)
+        if accept(tuple(flags)):
+            finals.append(name)
+
+    transitions = {name: {symbols[j]: names[table[i * k + j]] for j in range(k)}
+                   for i, name in enumerate(names)}
+    return AFD(names, symbols, names[0], finals, transitions)
+
+
+def intersection(*afds: AFD) -> AFD:
+    """AFD que acepta las cadenas aceptadas por todos los AFDs."""
+    return product(afds, all)
+
+
+def union(*afds: AFD) -> AFD:
+    """AFD que acepta las cadenas aceptadas por alguno de los AFDs."""
+    return product(afds, any)
+
+
+def difference(a: AFD, b: AFD) -> AFD:
+    """AFD que acepta las cadenas aceptadas por `a` y no por `b`."""
+    return product([a, b], lambda flags: flags[0] and not flags[1])
+
+
+def symmetric_difference(a: AFD, b: AFD) -> AFD:
+    """AFD que acepta las cadenas aceptadas por exactamente uno de `a` y `b`."""
+    return product([a, b], lambda flags: flags[0] != flags[1])
+
+
+def complement(afd: AFD, alphabet: Optional[Sequence[str]] = None) -> AFD:
+    """
+    AFD que acepta las cadenas que `afd` rechaza.
+
+    :param afd: AFD a complementar
+    :param alphabet: alfabeto del complemento (por defecto, el del AFD);
+                     los símbolos nuevos llevan a un sumidero, que pasa a
+                     ser final
+    :return: AFD complemento, con los mismos nombres de estados
+    """
+    symbols = list(dict.fromkeys(list(afd._symbol_names) + list(alphabet or [])))
+    table, sink = _completed_table(afd, symbols)
+    k = len(symbols)
+
+    names = list(afd._state_names)
+    if sink in table[:sink * k]:
+        names.append(unique_name(SINK_NAME, set(names)))
+    finals = [name for i, name in enumerate(names)
+              if i == sink or not afd._is_final_index(i)]
+    transitions = {name: {symbols[j]: names[table[i * k + j]] for j in range(k)}
+                   for i, name in enumerate(names)}
+    return AFD(names, symbols, afd.initial, finals, transitions)
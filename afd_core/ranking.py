@@ -0,0 +1,89 @@
+"""
+Posición (rank) de las cadenas aceptadas en el orden shortlex y su inversa.
+
+El orden es el mismo que produce `iter_accepted`: por longitud y, dentro
+de cada longitud, según el orden de los símbolos en `afd.alphabet`.
+`rank(afd, s)` devuelve la posición de `s` entre las cadenas aceptadas y
+`unrank(afd, i)` la cadena en la posición `i`, ambas en
+O(longitud × símbolos) usando la tabla de conteos `counting.PathCounts`.
+Así se puede paginar el lenguaje ("cadenas 1.000.000 a 1.000.010") sin
+enumerar las anteriores.
+"""
+
+from .afd import AFD
+from .counting import path_counts
+
+
+def rank(afd: AFD, cadena: str) -> int:
+    """
+    Devuelve la posición (desde 0) de `cadena` entre las cadenas aceptadas.
+
+    :param afd: instancia de AFD ya validada
+    :param cadena: cadena aceptada por el AFD
+    :return: índice de la cadena en el orden shortlex
+    """
+    if not afd.accepts(cadena):
+        raise ValueError(f"La cadena '{cadena}' no es aceptada por el AFD")
+
+    counts = path_counts(afd)
+    table = afd._table
+    num_symbols = afd._num_symbols
+    indices = afd._indices(cadena)
+    length = len(indices)
+
+    # Cadenas aceptadas más cortas
+    position = sum(counts.count(r) for r in range(length))
+
+    # Cadenas de la misma longitud que la preceden: en cada paso se suman
+    # las continuaciones aceptadas de los símbolos menores
+    state = afd._initial_index
+    for offset, j in enumerate(indices):
+        following = counts.row(length - offset - 1)
+        base = state * num_symbols
+        position += sum(following[target] for target in table[base:base + j])
+        state = table[base + j]
+    return position
+
+
+def unrank(afd: AFD, index: int) -> str:
+    """
+    Devuelve la cadena aceptada en la posición `index` (desde 0) del orden
+    shortlex, sin enumerar las anteriores.
+
+    :param afd: instancia de AFD ya validada
+    :param index: posición de la cadena
+    :return: cadena aceptada
+    """
+    if index < 0:
+        raise IndexError("La posición debe ser no negativa")
+
+    # Un lenguaje finito no tiene cadenas de longitud >= número de estados
+    max_length = len(afd._state_names) - 1 if afd.is_finite() else None
+
+    counts = path_counts(afd)
+    length = 0
+    while True:
+        if max_length is not None and length > max_length:
+            raise IndexError(f"El AFD acepta menos de {index + 1} cadenas")
+        available = counts.count(length)
+        if index < available:
+            break
+        index -= available
+        length += 1
+
+    table = afd._table
+    num_symbols = afd._num_symbols
+    symbols = afd._symbol_names
+    state = afd._initial_index
+    pieces = []
+    for remaining in range(length, 0, -1):
+        following = counts.row(remaining - 1)
+        base = state * num_symbols
+        for j in range(num_symbols):
+            target = table[base + j]
+            if index < following[target]:
+                break
+            index -= following[target]
+        pieces.append(symbols[j])
+        state = target
+    return "".join(pieces)
@@ -0,0 +1,174 @@
+"""
+Compilación de expresiones regulares a AFD.
+
+Sintaxis admitida, sobre los símbolos del alfabeto:
+
+* `ab`: concatenación; `a|b`: alternativa; `(...)`: agrupación
+* `a*`, `a+`, `a?`: cero o más, una o más, cero o una repetición
+* `.`: cualquier símbolo del alfabeto; `ε`: la cadena vacía
+* `\\x`: el símbolo `x` literal (para usar `|*+?().\\ε` como símbolos)
+
+La expresión se convierte en el autómata de posiciones (Glushkov): un
+estado por cada aparición de un símbolo más el inicial, sin transiciones
+ε. Ese AFN se determiniza con `NFA.to_afd` y se minimiza, y los estados
+del resultado se renombran `q0, q1, ...` (q0 es el inicial).
+
+`compile_regex` guarda los AFDs compilados en una caché LRU con clave
+(patrón, alfabeto), así que compilar de nuevo un patrón ya visto es O(1).
+Los AFDs de la caché son compartidos: no deben modificarse.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from .afd import AFD
+from .nfa import NFA
+
+# Tamaño de la caché de AFDs compilados
+CACHE_SIZE = 256
+
+
+class _Parser:
+    """
+    Parser descendente recursivo que construye el autómata de posiciones
+    directamente: cada nodo devuelve (anulable, primeros, últimos) y las
+    relaciones "siguiente" se acumulan en `follow`.
+    """
+
+    def __init__(self, pattern: str, alphabet: Sequence[str]):
+        self.pattern = pattern
+        self.pos = 0
+        self.symbols = list(alphabet)
+        self.symbol_set = set(alphabet)
+        self.labels: List[FrozenSet[str]] = []   # Símbolos que acepta cada posición
+        self.follow: List[Set[int]] = []
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} en la posición {self.pos} de '{self.pattern}'")
+
+    def peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def parse(self) -> Tuple[bool, Set[int], Set[int]]:
+        node = self.alternation()
+        if self.peek() is not None:
+            raise self.error(f"Carácter inesperado '{self.peek()}'")
+        return node
+
+    def alternation(self):
+        nullable, first, last = self.concatenation()
+        while self.peek() == "|":
+            self.pos += 1
+            other = self.concatenation()
+            nullable = nullable or other[0]
+            first = first | other[1]
+            last = last | other[2]
+        return nullable, first, last
+
+    def concatenation(self):
+        nullable, first, last = True, set(), set()
+        while self.peek() is not None and self.peek() not in "|)":
+            other = self.repetition()
+            for p in last:
+                self.follow[p] |= other[1]
+            first = first | other[1] if nullable else first
+            last = last | other[2] if other[0] else other[2]
+            nullable = nullable and other[0]
+        return nullable, first, last
+
+    def repetition(self):
+        nullable, first, last = self.atom()
+        while self.peek() is not None and self.peek() in "*+?":
+            operator = self.peek()
+            self.pos += 1
+            if operator in "*+":
+                for p in last:
+                    self.follow[p] |= first
+            if operator in "*?":
+                nullable = True
+        return nullable, first, last
+
+    def atom(self):
+        char = self.peek()
+        if char == "(":
+            self.pos += 1
+            node = self.alternation()
+            if self.peek() != ")":
+                raise self.error("Falta ')'")
+            self.pos += 1
+            return node
+        if char in ("*", "+", "?"):
+            raise self.error(f"'{char}' sin expresión a repetir")
+        if char == ")":
+            raise self.error("')' sin '(' correspondiente")
+        self.pos += 1
+        if char == NFA.EPSILON:
+            return True, set(), set()
+        if char == ".":
+            return self.position(frozenset(self.symbols))
+        if char == "\\":
+            char = self.peek()
+            if char is None:
+                raise self.error("'\\' al final de la expresión")
+            self.pos += 1
+        if char not in self.symbol_set:
+            raise self.error(f"Símbolo '{char}' no está en el alfabeto")
+        return self.position(frozenset([char]))
+
+    def position(self, label: FrozenSet[str]):
+        index = len(self.labels)
+        self.labels.append(label)
+        self.follow.append(set())
+        return False, {index}, {index}
+
+
+def _position_nfa(pattern: str, alphabet: Sequence[str]) -> NFA:
+    """AFN de posiciones (Glushkov) de la expresión: estado `q0` inicial y `p<i>` por posición."""
+    parser = _Parser(pattern, alphabet)
+    nullable, first, last = parser.parse()
+
+    names = ["q0"] + [f"p{i}" for i in range(len(parser.labels))]
+
+    def edges(targets: Set[int]) -> Dict[str, List[str]]:
+        row: Dict[str, List[str]] = {}
+        for q in sorted(targets):
+            for symbol in parser.labels[q]:
+                row.setdefault(symbol, []).append(names[q + 1])
+        return row
+
+    transitions = {"q0": edges(first)}
+    for p, targets in enumerate(parser.follow):
+        transitions[names[p + 1]] = edges(targets)
+    finals = [names[p + 1] for p in sorted(last)] + (["q0"] if nullable else [])
+    return NFA(names, list(alphabet), "q0", finals, transitions)
+
+
+def _renamed(afd: AFD) -> AFD:
+    """Copia del AFD con los estados renombrados `q0, q1, ...` en su orden actual."""
+    new = {state: f"q{i}" for i, state in enumerate(afd.states)}
+    transitions = {new[state]: {symbol: new[target] for symbol, target in row.items()}
+                   for state, row in afd.transitions.items()}
+    return AFD([new[s] for s in afd.states], list(afd.alphabet), new[afd.initial],
+               [new[s] for s in afd.finals], transitions)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_cached(pattern: str, alphabet: Tuple[str, ...]) -> AFD:
+    minimal, _ = _position_nfa(pattern, alphabet).to_afd().minimize()
+    return _renamed(minimal)
+
+
+def compile_regex(pattern: str, alphabet: Sequence[str]) -> AFD:
+    """
+    Compila una expresión regular al AFD mínimo que acepta su lenguaje.
+
+    :param pattern: expresión regular (ver la sintaxis en el módulo)
+    :param alphabet: símbolos del alfabeto del AFD
+    :return: AFD mínimo, compartido por la caché (no modificarlo)
+    """
+    return _compile_cached(pattern, tuple(alphabet))
+
+
+# Estadísticas y vaciado de la caché
+cache_info = _compile_cached.cache_info
+cache_clear = _compile_cached.cache_clear
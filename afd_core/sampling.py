@@ -0,0 +1,58 @@
+"""
+Muestreo uniforme de cadenas aceptadas por un AFD.
+
+Usa la tabla de conteos `counting.PathCounts`: desde el estado actual con
+`r` símbolos por leer, cada símbolo se elige con probabilidad proporcional
+al número de cadenas aceptadas de longitud `r - 1` que continúan desde el
+estado al que lleva. Así todas las cadenas aceptadas de la longitud pedida
+tienen la misma probabilidad, y cada muestra cuesta O(longitud × símbolos).
+"""
+
+import random
+from typing import List, Optional
+
+from .afd import AFD
+from .counting import path_counts
+
+
+def sample_accepted(afd: AFD, length: int, k: int = 1,
+                    seed: Optional[int] = None) -> List[str]:
+    """
+    Elige `k` cadenas aceptadas de longitud `length`, uniformemente al azar
+    (con reemplazo).
+
+    :param afd: instancia de AFD ya validada
+    :param length: longitud de las cadenas
+    :param k: número de cadenas a generar
+    :param seed: semilla para obtener muestras reproducibles
+    :return: lista de `k` cadenas aceptadas
+    """
+    if length < 0:
+        raise ValueError("La longitud debe ser no negativa")
+    counts = path_counts(afd)
+    if counts.count(length) == 0:
+        raise ValueError(f"El AFD no acepta cadenas de longitud {length}")
+
+    rng = random.Random(seed)
+    table = afd._table
+    num_symbols = afd._num_symbols
+    symbols = afd._symbol_names
+    rows = [counts.row(r) for r in range(length + 1)]
+
+    samples = []
+    for _ in range(k):
+        state = afd._initial_index
+        pieces = []
+        for remaining in range(length, 0, -1):
+            following = rows[remaining - 1]
+            pick = rng.randrange(rows[remaining][state])
+            base = state * num_symbols
+            for j in range(num_symbols):
+                target = table[base + j]
+                if pick < following[target]:
+                    break
+                pick -= following[target]
+            pieces.append(symbols[j])
+            state = target
+        samples.append("".join(pieces))
+    return samples
@@ -0,0 +1,256 @@
+"""
+Validación de archivos grandes por registros, directamente sobre el
+archivo mapeado en memoria.
+
+`scan_file(afd, path, delimiter=b"\\n")` mapea el archivo con `mmap` y
+valida cada registro (por defecto, cada línea) sin crear un `str` por
+registro. Cada byte `b` es el símbolo `chr(b)`, como en la entrada binaria
+de `AFD.simulate`. `scan_blocks` entrega los mismos resultados por
+bloques, para procesarlos sin acumularlos (por ejemplo, solo contarlos).
+
+Con NumPy (ver `vectorized`) el archivo se procesa por bloques de a lo
+sumo `BLOCK_SIZE` bytes y `BLOCK_RECORDS` registros: los delimitadores de
+un byte se buscan con una comparación vectorizada, el bloque se traduce a
+índices de símbolos con la tabla de 256 entradas y todos sus registros
+avanzan en paralelo sobre la matriz de transiciones. Un registro más largo
+que `BLOCK_SIZE` se simula aparte, leyéndolo por partes desde el mapa
+(ver `AFD._byte_blocks`). Así la memoria de trabajo depende del tamaño de
+bloque y no del tamaño del archivo ni de sus registros.
+
+Sin NumPy, o con símbolos de varios caracteres, cada registro se simula
+por separado a partir de una vista del mapa de memoria.
+"""
+
+import mmap
+import os
+from array import array
+from itertools import islice
+from typing import Iterator, NamedTuple, Sequence, Tuple
+
+from . import vectorized
+from .afd import AFD
+
+# Bytes del archivo procesados por bloque en el camino con NumPy
+BLOCK_SIZE = 1 << 22
+# Registros por bloque (acota los arreglos de posiciones de cada bloque)
+BLOCK_RECORDS = 1 << 18
+
+
+class ScanResult(NamedTuple):
+    """
+    Resultado de `scan_file` (o de un bloque de `scan_blocks`), con un
+    elemento por registro.
+
+    * `accepted`: vector booleano de NumPy (o lista de bool sin NumPy)
+    * `final_indices`: índice del estado final de cada registro (ver
+      `AFD.state_name`), o -1 si tiene bytes fuera del alfabeto
+    """
+    accepted: Sequence[bool]
+    final_indices: Sequence[int]
+
+    def counts(self) -> Tuple[int, int, int]:
+        """Devuelve (aceptados, rechazados, errores)."""
+        final = self.final_indices
+        if isinstance(final, array):
+            errors = final.count(-1)
+            accepted = sum(self.accepted)
+        else:
+            errors = int((final < 0).sum())
+            accepted = int(self.accepted.sum())
+        return accepted, len(final) - accepted - errors, errors
+
+
+def _record_bounds(buffer, delimiter: bytes) -> Iterator[Tuple[int, int]]:
+    """Genera (inicio, fin) de cada registro; un delimitador final no abre un registro vacío."""
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = buffer.find(delimiter, start)
+        if end < 0:
+            end = size
+        yield start, end
+        start = end + len(delimiter)
+
+
+def _strip_cr(buffer, start: int, end: int, delimiter: bytes) -> int:
+    """Con delimitador `\\n`, excluye el `\\r` de los finales de línea de Windows."""
+    if delimiter == b"\n" and end > start and buffer[end - 1] == 13:
+        return end - 1
+    return end
+
+
+def _run_record(afd: AFD, view: memoryview, start: int, end: int) -> int:
+    """Estado final de un registro, o -1 si tiene bytes fuera del alfabeto."""
+    try:
+        return afd._run_index(view[start:end])
+    except ValueError:
+        return -1
+
+
+def _scan_records(afd: AFD, buffer, delimiter: bytes) -> Iterator[ScanResult]:
+    """Simula cada registro por separado sobre vistas del buffer."""
+    with memoryview(buffer) as view:
+        final = array("i")
+        for start, end in _record_bounds(buffer, delimiter):
+            end = _strip_cr(buffer, start, end, delimiter)
+            final.append(_run_record(afd, view, start, end))
+            if len(final) == BLOCK_RECORDS:
+                yield ScanResult([index >= 0 and afd._is_final_index(index) for index in final],
+                                 final)
+                final = array("i")
+        if final:
+            yield ScanResult([index >= 0 and afd._is_final_index(index) for index in final],
+                             final)
+
+
+def _iter_find(buffer, delimiter: bytes, start: int, end: int) -> Iterator[int]:
+    """Posiciones de `delimiter` que empiezan en [start, end)."""
+    position = buffer.find(delimiter, start)
+    while 0 <= position < end:
+        yield position
+        position = buffer.find(delimiter, position + len(delimiter))
+
+
+def _block_ends(data, buffer, delimiter: bytes, start: int):
+    """
+    Fines de los registros que empiezan en `start` y terminan dentro del
+    bloque siguiente (a lo sumo `BLOCK_RECORDS`). Vacío si el primer
+    registro es más largo que el bloque.
+    """
+    np = vectorized.np
+    size = len(data)
+    width = len(delimiter)
+    end = min(size, start + BLOCK_SIZE)
+    if width == 1:
+        ends = np.flatnonzero(data[start:end] == delimiter[0])[:BLOCK_RECORDS] + start
+    else:
+        ends = np.fromiter(islice(_iter_find(buffer, delimiter, start, end), BLOCK_RECORDS),
+                           dtype=np.int64)
+    if end == size and len(ends) < BLOCK_RECORDS and (not len(ends) or ends[-1] + width < size):
+        ends = np.append(ends, size)  # Último registro sin delimitador
+    return ends
+
+
+def _scan_numpy(afd: AFD, buffer, delimiter: bytes) -> Iterator[ScanResult]:
+    """Camino vectorizado: bloques de registros avanzados en paralelo."""
+    np = vectorized.np
+    k = afd._num_symbols
+    lut = vectorized.byte_lookup(afd)
+    if k < 256:
+        lut = lut.astype(np.uint8)  # Un byte por símbolo en la copia traducida
+    matrix = vectorized.transition_matrix(afd)
+    is_final = np.frombuffer(bytes(afd._final_flags()), dtype=np.uint8).astype(bool)
+    width = len(delimiter)
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    view = memoryview(buffer)
+    try:
+        size = len(data)
+        start = 0
+        while start < size:
+            ends = _block_ends(data, buffer, delimiter, start)
+            if not len(ends):
+                # Registro más largo que un bloque: se recorre por partes
+                end = buffer.find(delimiter, start)
+                end = size if end < 0 else end
+                index = _run_record(afd, view, start, _strip_cr(buffer, start, end, delimiter))
+                yield ScanResult(np.array([index >= 0 and is_final[index]], dtype=bool),
+                                 np.array([index], dtype=np.int32))
+                start = end + width
+                continue
+
+            starts = np.empty(len(ends), dtype=np.int64)
+            starts[0] = start
+            starts[1:] = ends[:-1] + width
+            lengths = ends - starts
+            if delimiter == b"\n":
+                # Finales de línea de Windows: excluir el '\r'
+                nonempty = np.flatnonzero(lengths > 0)
+                lengths[nonempty[data[ends[nonempty] - 1] == 13]] -= 1
+
+            low = int(starts[0])
+            high = int(starts[-1] + lengths[-1])
+            symbols = lut[data[low:high]]
+            relative = starts - low
+            final = vectorized.run_ragged(afd, symbols, relative, lengths, matrix)
+
+            # Registros con bytes fuera del alfabeto (los delimitadores no cuentan)
+            bad = np.flatnonzero(symbols == k)
+            if len(bad):
+                record = np.searchsorted(relative, bad, side="right") - 1
+                inside = bad < relative[record] + lengths[record]
+                final[record[inside]] = -1
+
+            accepted = np.zeros(len(final), dtype=bool)
+            valid = final >= 0
+            accepted[valid] = is_final[final[valid]]
+            yield ScanResult(accepted, final)
+            start = int(ends[-1]) + width
+    finally:
+        del data
+        view.release()
+
+
+def _scan_buffer(afd: AFD, buffer, delimiter: bytes) -> Iterator[ScanResult]:
+    if vectorized.HAS_NUMPY and afd._tokenizer is None:
+        return _scan_numpy(afd, buffer, delimiter)
+    return _scan_records(afd, buffer, delimiter)
+
+
+def scan_blocks(afd: AFD, path: str, delimiter: bytes = b"\n") -> Iterator[ScanResult]:
+    """
+    Valida los registros de un archivo y entrega los resultados por bloques
+    consecutivos, sin acumularlos.
+
+    :param afd: instancia de AFD ya validada
+    :param path: ruta del archivo
+    :param delimiter: separador de registros (uno o más bytes)
+    :return: iterador de `ScanResult`, uno por bloque de registros
+    """
+    if not delimiter:
+        raise ValueError("El delimitador no puede ser vacío")
+    if os.path.getsize(path) == 0:
+        return  # mmap no admite archivos vacíos
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        blocks = _scan_buffer(afd, buffer, delimiter)
+        try:
+            yield from blocks
+        finally:
+            blocks.close()  # Libera las vistas del mapa antes de cerrarlo
+
+
+def scan_file(afd: AFD, path: str, delimiter: bytes = b"\n") -> ScanResult:
+    """
+    Valida cada registro de un archivo, separado por `delimiter`.
+
+    Con el delimitador por defecto (`\\n`) también se aceptan finales de
+    línea `\\r\\n`. Un delimitador al final del archivo no agrega un
+    registro vacío. Los resultados de cada bloque se agregan a arreglos
+    compactos (4 bytes por registro para el estado final y 1 para la
+    aceptación); para no guardarlos, usar `scan_blocks`.
+
+    :param afd: instancia de AFD ya validada
+    :param path: ruta del archivo
+    :param delimiter: separador de registros (uno o más bytes)
+    :return: `ScanResult` con la aceptación y el estado final de cada registro
+    """
+    if not delimiter:
+        raise ValueError("El delimitador no puede ser vacío")
+    use_numpy = vectorized.HAS_NUMPY and afd._tokenizer is None
+
+    final = array("i")
+    accepted = bytearray() if use_numpy else []
+    for block in scan_blocks(afd, path, delimiter):
+        if use_numpy:
+            final.frombytes(block.final_indices.astype("int32", copy=False).tobytes())
+            accepted += block.accepted.tobytes()
+        else:
+            final.extend(block.final_indices)
+            accepted.extend(block.accepted)
+
+    if use_numpy:
+        np = vectorized.np
+        return ScanResult(np.frombuffer(accepted, dtype=bool),
+                          np.frombuffer(final, dtype=np.int32))
+    return ScanResult(accepted, final)
@@ -0,0 +1,164 @@
+"""
+Simulación incremental de entradas que llegan por fragmentos.
+
+`StreamingRunner` guarda el estado actual del AFD y lo avanza con cada
+llamada a `feed(fragmento)`, de modo que un archivo enorme o los datos de
+un socket se validan sin concatenarlos en una sola cadena. Los fragmentos
+pueden ser `str` o datos binarios (`bytes`, `bytearray`, `memoryview`;
+cada byte `b` es el símbolo `chr(b)`).
+
+Con símbolos de varios caracteres, la separación en símbolos puede
+depender de caracteres que todavía no llegaron: con `["a", "ab", "bb"]`,
+"abbb..." es `a·bb·bb...` o `ab·bb·...` según la paridad de las `b`. En
+lugar de guardar el texto pendiente, el runner avanza todas las
+separaciones posibles a la vez, como configuraciones (estado del AFD,
+nodo del trie del tokenizador). Dos separaciones que llegan a la misma
+configuración no pueden terminar ambas, porque el alfabeto es
+unívocamente decodificable, así que basta con conservar una. Hay a lo
+sumo estados × nodos del trie configuraciones, de modo que el costo por
+carácter y la memoria no dependen del largo de la entrada. Los símbolos
+se cuentan en cuanto queda una sola separación posible, o al llamar a
+`flush()` al terminar la entrada.
+"""
+
+from .afd import AFD
+
+
+class StreamingRunner:
+    def __init__(self, afd: AFD):
+        """
+        :param afd: instancia de AFD ya validada
+        """
+        self.afd = afd
+        self.reset()
+
+    def reset(self) -> None:
+        """Vuelve al estado inicial y descarta la entrada leída."""
+        self._state = self.afd._initial_index
+        self.symbols_read = 0  # Símbolos consumidos desde el último `reset`
+        self._chars = 0  # Caracteres recibidos (símbolos de varios caracteres)
+        self._chars_read = 0  # Caracteres de los símbolos consumidos
+        # Separaciones posibles: (estado, nodo del trie) -> (símbolos,
+        # caracteres) de los símbolos completos de esa separación
+        tokenizer = self.afd._tokenizer
+        root = tokenizer.root if tokenizer is not None else None
+        self._configs = {(self._state, root): (0, 0)}
+
+    @property
+    def state(self) -> str:
+        """Estado actual (después de los símbolos consumidos)."""
+        return self.afd._state_names[self._state]
+
+    @property
+    def accepting(self) -> bool:
+        """Indica si la entrada consumida hasta ahora es aceptada."""
+        return self.afd._is_final_index(self._state)
+
+    @property
+    def pending_chars(self) -> int:
+        """Caracteres recibidos que aún no se pudieron separar en símbolos."""
+        return self._chars - self._chars_read
+
+    def feed(self, chunk) -> None:
+        """
+        Consume un fragmento de la entrada.
+
+        Si el fragmento contiene un símbolo fuera del alfabeto se lanza
+        `ValueError` y el estado queda como antes de llamar a `feed`.
+
+        :param chunk: `str`, `bytes`, `bytearray` o `memoryview`
+        """
+        afd = self.afd
+        binary = isinstance(chunk, (bytes, bytearray, memoryview))
+        if afd._tokenizer is not None:
+            self._feed_text(bytes(chunk).decode("latin-1") if binary else chunk)
+            return
+
+        if binary:
+            blocks = afd._byte_blocks(chunk)
+        else:
+            blocks = (afd._indices(chunk),)
+        self._advance(blocks)
+
+    def flush(self) -> bool:
+        """
+        Termina la entrada. Con símbolos de varios caracteres, se queda con
+        la separación que termina en un símbolo completo; si no hay
+        ninguna, lanza `ValueError`.
+
+        :return: True si la entrada completa es aceptada
+        """
+        tokenizer = self.afd._tokenizer
+        if tokenizer is not None:
+            root = tokenizer.root
+            complete = [(key, counts) for key, counts in self._configs.items() if key[1] is root]
+            if not complete:
+                raise ValueError("La cadena termina en medio de un símbolo")
+            self._configs = dict(complete)
+            self._commit()
+        return self.accepting
+
+    async def feed_from(self, reader, chunk_size: int = 1 << 16) -> bool:
+        """
+        Consume todo lo que entregue `reader` hasta el fin de la entrada.
+
+        :param reader: objeto con un método `async read(n)` que devuelve
+                       un fragmento vacío al terminar (por ejemplo un
+                       `asyncio.StreamReader`)
+        :param chunk_size: tamaño máximo de cada lectura
+        :return: True si la entrada completa es aceptada
+        """
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                break
+            self.feed(chunk)
+        return self.flush()
+
+    def _feed_text(self, text: str) -> None:
+        """Avanza todas las separaciones posibles con los caracteres de `text`."""
+        root = self.afd._tokenizer.root
+        table = self.afd._table
+        k = self.afd._num_symbols
+        configs = self._configs
+        chars = self._chars
+        for char in text:
+            chars += 1
+            following = {}
+            for (state, node), (symbols, consumed) in configs.items():
+                node = node.children.get(char)
+                if node is None:
+                    continue
+                if node.symbol is not None:
+                    key = (table[state * k + node.symbol], root)
+                    if key not in following:
+                        following[key] = (symbols + 1, chars)
+                if node.children and (state, node) not in following:
+                    following[(state, node)] = (symbols, consumed)
+            if not following:
+                raise ValueError(f"Símbolo '{char}' no está en el alfabeto")
+            configs = following
+        self._configs = configs
+        self._chars = chars
+        if len(configs) == 1:
+            self._commit()
+
+    def _commit(self) -> None:
+        """Consume los símbolos completos de la única separación posible."""
+        ((state, _), (symbols, consumed)), = self._configs.items()
+        self._state = state
+        self.symbols_read = symbols
+        self._chars_read = consumed
+
+    def _advance(self, blocks) -> None:
+        """Avanza el estado con bloques de índices de símbolos."""
+        table = self.afd._table
+        k = self.afd._num_symbols
+        current = self._state
+        count = 0
+        for block in blocks:
+            for j in block:
+                current = table[current * k + j]
+            count += len(block)
+        self._state = current
+        self.symbols_read += count
@@ -0,0 +1,134 @@
+"""
+Separación de la entrada en símbolos del alfabeto.
+
+Si todos los símbolos del alfabeto son de un carácter, cada carácter de la
+cadena es un símbolo y no hace falta este módulo. Cuando hay símbolos de
+varios caracteres (por ejemplo "if" o "ab"), el alfabeto tiene que ser
+unívocamente decodificable (`is_uniquely_decodable`): cada cadena se puede
+escribir a lo sumo de una forma como concatenación de símbolos. Si no, una
+misma cadena correspondería a varios caminos del AFD (con `["a", "b",
+"ab"]`, "ab" es tanto `a·b` como `ab`) y `AFD.validate` lo rechaza.
+
+`Tokenizer` encuentra esa única separación con un trie precompilado: desde
+cada posición alcanzable como frontera entre símbolos recorre el trie y
+marca las fronteras siguientes, guardando el símbolo que llega a cada una.
+Al final reconstruye la separación hacia atrás desde la última posición.
+Cuesta O(longitud × largo del símbolo más largo) y la salida es un
+arreglo de índices de símbolos, que la simulación consume directamente
+sobre la tabla compilada.
+
+Para entradas que llegan por fragmentos, `streaming` recorre el mismo
+trie carácter a carácter.
+"""
+
+from array import array
+from typing import Dict, Iterable, Optional, Sequence
+
+
+def is_uniquely_decodable(symbols: Iterable[str]) -> bool:
+    """
+    Test de Sardinas-Patterson: indica si toda concatenación de símbolos
+    se puede separar de una única forma.
+
+    Se generan los sufijos "colgantes" (lo que sobra cuando un símbolo es
+    prefijo de otro, y así sucesivamente); el código es unívocamente
+    decodificable si ninguno de ellos es un símbolo.
+    """
+    code = set(symbols)
+    if "" in code:
+        return False
+    pending = [word[len(prefix):] for prefix in code for word in code
+               if word != prefix and word.startswith(prefix)]
+    seen = set()
+    while pending:
+        suffix = pending.pop()
+        if suffix in code:
+            return False
+        if suffix in seen:
+            continue
+        seen.add(suffix)
+        for word in code:
+            if word.startswith(suffix):
+                pending.append(word[len(suffix):])
+            elif suffix.startswith(word):
+                pending.append(suffix[len(word):])
+    return True
+
+
+class _Node:
+    __slots__ = ("children", "symbol")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.symbol: Optional[int] = None  # Índice del símbolo que termina aquí
+
+
+class Tokenizer:
+    def __init__(self, symbols: Sequence[str]):
+        """
+        :param symbols: símbolos del alfabeto, unívocamente decodificable;
+                        el índice de cada símbolo es su posición en la lista
+        """
+        self.lengths = [len(symbol) for symbol in symbols]
+        self.root = _Node()
+        for index, symbol in enumerate(symbols):
+            if not symbol:
+                continue  # El símbolo vacío no puede consumir entrada
+            node = self.root
+            for char in symbol:
+                node = node.children.setdefault(char, _Node())
+            if node.symbol is None:
+                node.symbol = index
+
+    def scan(self, text: str, start: int = 0) -> array:
+        """
+        Tokeniza `text` desde `start` hasta el final.
+
+        :param text: texto de entrada
+        :param start: posición desde la que se empieza
+        :return: índices de los símbolos
+        """
+        root = self.root
+        length = len(text)
+        size = length - start + 1
+
+        # `reached[q]` es el índice + 1 del símbolo que termina en la
+        # frontera `start + q` (0: no alcanzable). Con un alfabeto
+        # unívocamente decodificable cada frontera se alcanza de una forma.
+        reached = array("i", bytes(4 * size))
+        reached[0] = -1
+        deepest = start  # Posición más lejana a la que llegó el trie
+        for p in range(size):
+            if not reached[p]:
+                continue
+            node = root
+            i = start + p
+            while i < length:
+                node = node.children.get(text[i])
+                if node is None:
+                    break
+                i += 1
+                if node.symbol is not None and not reached[i - start]:
+                    reached[i - start] = node.symbol + 1
+            deepest = max(deepest, i)
+
+        if not reached[size - 1]:
+            # El primer carácter con el que ningún símbolo puede continuar
+            if deepest < length:
+                raise ValueError(f"Símbolo '{text[deepest]}' no está en el alfabeto")
+            raise ValueError("La cadena termina en medio de un símbolo")
+
+        tokens = array("i")
+        append = tokens.append
+        lengths = self.lengths
+        q = size - 1
+        while q > 0:
+            symbol = reached[q] - 1
+            append(symbol)
+            q -= lengths[symbol]
+        tokens.reverse()
+        return tokens
+
+    def tokenize(self, text: str) -> array:
+        """Índices de los símbolos de `text` completo."""
+        return self.scan(text)
@@ -1,50 +1,75 @@
 """
 Types para representar la simulación de un AFD.
 
-Este módulo define tres tipos de datos:
+Este módulo define los siguientes tipos de datos:
 
 1. `TransitionFunction`: un diccionario que representa la función de transición
    del AFD. La clave es el estado actual, y el valor es otro diccionario
    que tiene como clave el símbolo y como valor el estado siguiente.
 
-2. `TraceStep`: una clase que representa un paso en la simulación del AFD.
-   Tiene los siguientes campos:
+2. `TraceStep`: una tupla con nombre que representa un paso en la simulación
+   del AFD. Tiene los siguientes campos:
    * `from_state`: el estado desde el que se hace la transición
-   * `symbol`: el símbolo que se lee en la transición (None para el estado inicial)
    * `to_state`: el estado al que se llega después de la transición
+   * `symbol`: el símbolo que se lee en la transición (None para el estado inicial)
 
 3. `TraceResult`: una clase que representa el resultado de la simulación del AFD.
    Tiene los siguientes campos:
    * `accepted`: indica si la cadena es aceptada por el AFD
    * `final_state`: el estado final en el que se queda después de la simulación
    * `steps`: la traza de pasos que se realizaron durante la simulación
+
+4. `TraceSteps`: la secuencia compacta que usa `AFD.simulate` para `steps`.
+   Guarda dos arreglos paralelos con los índices de los estados visitados y
+   de los símbolos leídos, y construye cada `TraceStep` cuando se accede a él.
+
+5. `EquivalenceResult`: el resultado de comparar los lenguajes de dos AFDs
+   (ver `afd_core.equivalence`). Tiene los siguientes campos:
+   * `equivalent`: indica si ambos AFDs aceptan el mismo lenguaje
+   * `counterexample`: una cadena más corta aceptada por solo uno de ellos
+     (None si son equivalentes)
 """
 
+from array import array
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence
 
 # Definición del AFD en forma de diccionario
 TransitionFunction = Dict[str, Dict[str, str]]
 
-@dataclass
-class TraceStep:
+
+def index_typecode(count: int) -> str:
+    """
+    Devuelve el typecode de `array` más pequeño que puede guardar índices
+    en el rango [0, count).
+    """
+    if count <= 1 << 8:
+        return "B"
+    if count <= 1 << 16:
+        return "H"
+    return "I"
+
+
+class TraceStep(NamedTuple):
     """
     Representa un paso en la simulación del AFD.
-    
+
     Tiene los siguientes campos:
     * `from_state`: el estado desde el que se hace la transición
-    * `symbol`: el símbolo que se lee en la transición (None para el estado inicial)
     * `to_state`: el estado al que se llega después de la transición
+    * `symbol`: el símbolo que se lee en la transición (None para el estado inicial)
     """
     from_state: str
-    symbol: Optional[str]  # None para el estado inicial
     to_state: str
+    symbol: Optional[str] = None  # None para el estado inicial
+
 
 @dataclass
 class TraceResult:
     """
     Representa el resultado de la simulación del AFD.
-    
+
     Tiene los siguientes campos:
     * `accepted`: indica si la cadena es aceptada por el AFD
     * `final_state`: el estado final en el que se queda después de la simulación
@@ -52,4 +77,74 @@ class TraceResult:
     """
     accepted: bool
     final_state: str
-    steps: List[TraceStep]
+    steps: Sequence[TraceStep]
+
+
+class TraceSteps(SequenceABC):
+    """
+    Secuencia perezosa y compacta de pasos de una simulación.
+
+    `states[i]` es el índice del estado alcanzado en el paso `i` (el paso 0
+    es el estado inicial) y `symbols[i - 1]` el índice del símbolo leído
+    para llegar a él. Ambos arreglos usan el typecode más pequeño posible,
+    así que cada paso ocupa entre 2 y 8 bytes en lugar de un objeto.
+    """
+
+    __slots__ = ("_state_names", "_symbol_names", "_states", "_symbols")
+
+    def __init__(self, state_names: List[str], symbol_names: List[str],
+                 states: array, symbols: array):
+        self._state_names = state_names
+        self._symbol_names = symbol_names
+        self._states = states
+        self._symbols = symbols
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de paso fuera de rango")
+
+        to_state = self._state_names[self._states[index]]
+        if index == 0:
+            return TraceStep(from_state="", to_state=to_state, symbol=None)
+        return TraceStep(from_state=self._state_names[self._states[index - 1]],
+                         to_state=to_state,
+                         symbol=self._symbol_names[self._symbols[index - 1]])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SequenceABC) or len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"TraceSteps(<{len(self)} pasos>)"
+
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arreglos de la traza, en bytes."""
+        return (self._states.itemsize * len(self._states)
+                + self._symbols.itemsize * len(self._symbols))
+
+
+@dataclass
+class EquivalenceResult:
+    """
+    Representa el resultado de comparar los lenguajes de dos AFDs.
+
+    Tiene los siguientes campos:
+    * `equivalent`: indica si ambos AFDs aceptan el mismo lenguaje
+    * `counterexample`: una cadena más corta aceptada por solo uno de los
+      dos AFDs (None si son equivalentes)
+
+    Se evalúa como booleano según `equivalent`.
+    """
+    equivalent: bool
+    counterexample: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.equivalent
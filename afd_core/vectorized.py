@@ -0,0 +1,223 @@
+"""
+Simulación vectorizada de muchas cadenas a la vez con NumPy.
+
+NumPy es una dependencia opcional: si no está instalado, `HAS_NUMPY` es
+False y `AFD.run_many` / `AFD.accepts_many` usan su implementación en
+Python puro.
+
+Las cadenas de un lote (`str`, o `bytes` donde cada byte `b` es el
+símbolo `chr(b)`) se codifican en un único buffer de índices de
+símbolos (datos + desplazamientos) y se avanzan todas en paralelo sobre la
+matriz de transiciones: en el paso `t` se actualizan, con una sola
+operación, todas las cadenas de longitud mayor que `t`.
+"""
+
+from array import array
+from typing import List, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+    HAS_NUMPY = False
+
+# Cadenas procesadas por lote, para acotar la memoria de los buffers
+BATCH_SIZE = 1 << 16
+# Con menos cadenas activas que esto, se terminan con el bucle escalar
+SCALAR_TAIL = 32
+
+
+def _symbol_lookup(afd):
+    """Devuelve (códigos, índices) ordenados de los símbolos de un carácter."""
+    pairs = sorted((ord(symbol), j) for j, symbol in enumerate(afd._symbol_names)
+                   if len(symbol) == 1)
+    codes = np.array([code for code, _ in pairs], dtype=np.uint32)
+    indices = np.array([j for _, j in pairs], dtype=np.int32)
+    return codes, indices
+
+
+def byte_lookup(afd) -> "np.ndarray":
+    """
+    Tabla de 256 entradas byte -> índice de símbolo (el byte `b` es el
+    símbolo `chr(b)`); los bytes fuera del alfabeto valen `num_simbolos`.
+    """
+    codes, indices = _symbol_lookup(afd)
+    lut = np.full(256, afd._num_symbols, dtype=np.int32)
+    small = codes < 256
+    lut[codes[small]] = indices[small]
+    return lut
+
+
+def transition_matrix(afd) -> "np.ndarray":
+    """
+    Matriz `estados × (símbolos + 1)` de transiciones; la columna extra deja
+    el estado igual y corresponde a los símbolos inválidos.
+    """
+    k = afd._num_symbols
+    num_states = len(afd._state_names)
+    matrix = np.empty((num_states, k + 1), dtype=np.int32)
+    matrix[:, :k] = np.frombuffer(afd._table, dtype=np.int32).reshape(num_states, k)
+    matrix[:, k] = np.arange(num_states, dtype=np.int32)
+    return matrix
+
+
+def _encode_indices(afd, strings: List[str]):
+    """
+    Codifica cada cadena por separado con `AFD._indices`: alfabetos con
+    símbolos de varios caracteres (tokenizador) o lotes con secuencias de
+    símbolos ya separados. Las cadenas con símbolos inválidos quedan vacías
+    y marcadas como inválidas.
+    """
+    data = array("i")
+    lengths = np.zeros(len(strings), dtype=np.int64)
+    invalid = np.zeros(len(strings), dtype=bool)
+    for i, cadena in enumerate(strings):
+        try:
+            indices = afd._indices(cadena)
+        except ValueError:
+            invalid[i] = True
+            continue
+        data.extend(indices)
+        lengths[i] = len(indices)
+
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    symbols = np.frombuffer(data, dtype=np.int32) if len(data) else np.empty(0, dtype=np.int32)
+    return symbols, offsets, invalid
+
+
+def _join(strings: List[str]):
+    """
+    Une el lote en un solo `str` o, si todas las cadenas son binarias, en
+    un solo `bytes`. En un lote mixto los datos binarios se decodifican
+    como latin-1 (el byte `b` es el carácter `chr(b)`).
+
+    :return: (cadenas normalizadas, unión), o None si alguna cadena no es
+             `str` ni binaria
+    """
+    binary = text = False
+    for cadena in strings:
+        if isinstance(cadena, str):
+            text = True
+        elif isinstance(cadena, (bytes, bytearray, memoryview)):
+            binary = True
+        else:
+            return None
+    if binary and text:
+        strings = [cadena if isinstance(cadena, str) else bytes(cadena).decode("latin-1")
+                   for cadena in strings]
+    elif binary:
+        strings = [cadena if isinstance(cadena, bytes) else bytes(cadena) for cadena in strings]
+    return strings, b"".join(strings) if binary and not text else "".join(strings)
+
+
+def _encode(afd, strings: List[str]):
+    """
+    Codifica las cadenas en un buffer de índices de símbolos.
+
+    :return: (símbolos, desplazamientos, máscara de cadenas inválidas); los
+             caracteres fuera del alfabeto se codifican como `num_simbolos`
+    """
+    joined = None if afd._tokenizer is not None else _join(strings)
+    if joined is None:
+        return _encode_indices(afd, strings)
+    strings, joined = joined
+
+    k = afd._num_symbols
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    try:
+        # Camino rápido: entrada binaria o latin-1 con una tabla de 256 entradas
+        raw = joined if isinstance(joined, bytes) else joined.encode("latin-1")
+        data = np.frombuffer(raw, dtype=np.uint8)
+        symbols = byte_lookup(afd)[data]
+    except UnicodeEncodeError:
+        codes, indices = _symbol_lookup(afd)
+        data = np.frombuffer(joined.encode("utf-32-le", errors="surrogatepass"),
+                             dtype=np.uint32)
+        if len(codes):
+            pos = np.minimum(np.searchsorted(codes, data), len(codes) - 1)
+            symbols = np.where(codes[pos] == data, indices[pos], k).astype(np.int32)
+        else:
+            symbols = np.full(len(data), k, dtype=np.int32)
+
+    invalid = np.zeros(len(strings), dtype=bool)
+    bad_positions = np.flatnonzero(symbols == k)
+    if len(bad_positions):
+        invalid[np.searchsorted(offsets, bad_positions, side="right") - 1] = True
+    return symbols, offsets, invalid
+
+
+def run_ragged(afd, symbols, starts, lengths, matrix) -> "np.ndarray":
+    """
+    Avanza en paralelo las secuencias `symbols[starts[i]:starts[i] + lengths[i]]`
+    y devuelve el estado final de cada una.
+    """
+    n = len(starts)
+
+    # Ordenar por longitud descendente: las cadenas activas son un prefijo
+    order = np.argsort(-lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    starts = starts[order]
+    states = np.full(n, afd._initial_index, dtype=np.int32)
+
+    max_length = int(sorted_lengths[0]) if n else 0
+    m = n  # Secuencias activas: las de longitud mayor que `t`
+    for t in range(max_length):
+        while sorted_lengths[m - 1] <= t:
+            m -= 1
+        if m <= SCALAR_TAIL:
+            # Pocas cadenas largas: terminar con un bucle escalar
+            rows = matrix.tolist()
+            for i in range(m):
+                state = int(states[i])
+                row_symbols = symbols[starts[i] + t:starts[i] + sorted_lengths[i]]
+                for j in row_symbols.tolist():
+                    state = rows[state][j]
+                states[i] = state
+            break
+        states[:m] = matrix[states[:m], symbols[starts[:m] + t]]
+
+    final = np.empty(n, dtype=np.int32)
+    final[order] = states
+    return final
+
+
+def _run_batch(afd, strings: List[str], matrix) -> "np.ndarray":
+    """Avanza un lote de cadenas en paralelo y devuelve sus estados finales."""
+    symbols, offsets, invalid = _encode(afd, strings)
+    final = run_ragged(afd, symbols, offsets[:-1], np.diff(offsets), matrix)
+    final[invalid] = -1
+    return final
+
+
+def run_many(afd, strings: Sequence[str]) -> "np.ndarray":
+    """
+    Calcula el índice del estado final de cada cadena.
+
+    :return: arreglo `int32`; -1 para las cadenas con símbolos fuera del alfabeto
+    """
+    strings = list(strings)
+    matrix = transition_matrix(afd)
+
+    if not strings:
+        return np.empty(0, dtype=np.int32)
+    return np.concatenate([_run_batch(afd, strings[i:i + BATCH_SIZE], matrix)
+                           for i in range(0, len(strings), BATCH_SIZE)])
+
+
+def accepts_many(afd, strings: Sequence[str]) -> "np.ndarray":
+    """
+    Indica qué cadenas acepta el AFD.
+
+    :return: arreglo booleano; False para las cadenas con símbolos inválidos
+    """
+    final = run_many(afd, strings)
+    is_final = np.frombuffer(bytes(afd._final_flags()), dtype=np.uint8).astype(bool)
+    accepted = np.zeros(len(final), dtype=bool)
+    valid = final >= 0
+    accepted[valid] = is_final[final[valid]]
+    return accepted
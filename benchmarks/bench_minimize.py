@@ -0,0 +1,61 @@
+"""
+Benchmark de la minimización de AFDs (algoritmo de Hopcroft).
+
+Genera un AFD aleatorio con `base` estados y lo replica: cada estado se
+copia varias veces y cada transición va a una copia al azar del destino.
+El AFD resultante tiene `estados` estados, pero su mínimo tiene a lo sumo
+`base` (todas las copias de un estado son equivalentes).
+
+Uso:
+    python benchmarks/bench_minimize.py [estados] [símbolos] [copias]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from afd_core.afd import AFD  # noqa: E402
+
+
+def redundant_afd(num_states: int, num_symbols: int, copies: int, seed: int = 0) -> AFD:
+    """AFD aleatorio de `num_states` estados con `copies` copias de cada estado base."""
+    rng = random.Random(seed)
+    base = max(1, num_states // copies)
+    alphabet = [f"s{j}" for j in range(num_symbols)]
+    base_targets = [[rng.randrange(base) for _ in alphabet] for _ in range(base)]
+    base_finals = [rng.random() < 0.5 for _ in range(base)]
+
+    states = [f"q{i}" for i in range(base * copies)]
+    transitions = {}
+    for i, state in enumerate(states):
+        origin = i % base
+        transitions[state] = {symbol: states[target + base * rng.randrange(copies)]
+                              for symbol, target in zip(alphabet, base_targets[origin])}
+    finals = [state for i, state in enumerate(states) if base_finals[i % base]]
+    return AFD(states, alphabet, states[0], finals, transitions)
+
+
+def main():
+    num_states = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_symbols = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    copies = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    start = time.perf_counter()
+    afd = redundant_afd(num_states, num_symbols, copies)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    minimal, _ = afd.minimize()
+    elapsed = time.perf_counter() - start
+
+    print(f"Estados: {len(afd.states):,}  símbolos: {num_symbols}  copias: {copies}")
+    print(f"Construcción y validación: {build:8.2f} s")
+    print(f"Minimización:              {elapsed:8.2f} s")
+    print(f"Estados del AFD mínimo:    {len(minimal.states):,}")
+
+
+if __name__ == "__main__":
+    main()
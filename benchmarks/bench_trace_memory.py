@@ -0,0 +1,72 @@
+"""
+Benchmark de memoria de la traza de simulación.
+
+Compara la traza anterior (una lista con un dataclass `TraceStep` por
+símbolo) con la traza compacta de `AFD.simulate` (`TraceSteps`).
+
+Uso:
+    python benchmarks/bench_trace_memory.py [longitud]
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from afd_core.afd import AFD  # noqa: E402
+
+
+@dataclass
+class LegacyTraceStep:
+    """Representación anterior de un paso (dataclass con `__dict__`)."""
+    from_state: str
+    to_state: str
+    symbol: Optional[str] = None
+
+
+def legacy_simulate(afd: AFD, cadena: str):
+    """Reproduce la traza anterior: un objeto por símbolo."""
+    current = afd.initial
+    steps = [LegacyTraceStep(from_state="", to_state=current, symbol=None)]
+    for symbol in cadena:
+        from_state = current
+        current = afd.transitions[current][symbol]
+        steps.append(LegacyTraceStep(from_state=from_state, to_state=current, symbol=symbol))
+    return steps
+
+
+def measure(func, *args) -> int:
+    """Devuelve los bytes retenidos por el resultado de `func`."""
+    tracemalloc.start()
+    result = func(*args)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main():
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    afd = AFD(
+        states=["q0", "q1"],
+        alphabet=["0", "1"],
+        initial="q0",
+        finals=["q1"],
+        transitions={"q0": {"0": "q0", "1": "q1"}, "q1": {"0": "q1", "1": "q0"}},
+    )
+    cadena = "0110" * (length // 4)
+
+    legacy = measure(legacy_simulate, afd, cadena)
+    compact = measure(afd.simulate, cadena)
+
+    print(f"Longitud de la cadena: {len(cadena):,}")
+    print(f"Traza anterior:  {legacy / 1e6:10.2f} MB ({legacy / len(cadena):6.1f} B/paso)")
+    print(f"Traza compacta:  {compact / 1e6:10.2f} MB ({compact / len(cadena):6.1f} B/paso)")
+    print(f"Reducción:       {legacy / compact:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import itertools
+import pytest
+from afd_core.afd import AFD
+
+@pytest.fixture
+def odd_ones_afd():
+    # AFD que acepta cadenas con un número impar de '1'
+    return AFD(["q0", "q1"], ["0", "1"], "q0", ["q1"],
+               {"q0": {"0": "q0", "1": "q1"}, "q1": {"0": "q1", "1": "q0"}})
+
+@pytest.fixture
+def ends_in_01_afd():
+    # AFD que acepta cadenas que terminan en "01"
+    return AFD(["q0", "q1", "q2"], ["0", "1"], "q0", ["q2"],
+               {"q0": {"0": "q1", "1": "q0"},
+                "q1": {"0": "q1", "1": "q2"},
+                "q2": {"0": "q1", "1": "q0"}})
+
+def _all_strings(alphabet, max_length=6, min_length=0):
+    for n in range(min_length, max_length + 1):
+        yield from map("".join, itertools.product(alphabet, repeat=n))
+
+@pytest.fixture
+def all_strings():
+    """
+    Enumerador de fuerza bruta para comparar con los algoritmos:
+    `all_strings(alfabeto, max_length=6, min_length=0)` genera todas las
+    cadenas con longitud entre `min_length` y `max_length`, en orden shortlex.
+    """
+    return _all_strings
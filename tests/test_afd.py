@@ -1,6 +1,6 @@
 import pytest
 from afd_core.afd import AFD
-from afd_core.types import TraceResult
+from afd_core.types import TraceResult, TraceStep
 
 @pytest.fixture
 def simple_afd():
@@ -35,3 +35,157 @@ def test_simulate_reject(simple_afd):
 def test_simulate_invalid_symbol(simple_afd):
     with pytest.raises(ValueError):
         simple_afd.simulate("2")
+
+def test_compiled_table_matches_transitions(simple_afd):
+    k = len(simple_afd.alphabet)
+    for i, state in enumerate(simple_afd.states):
+        for j, symbol in enumerate(simple_afd.alphabet):
+            target = simple_afd._table[i * k + j]
+            assert simple_afd.states[target] == simple_afd.transitions[state][symbol]
+
+def test_simulate_trace_steps(simple_afd):
+    result = simple_afd.simulate("101")
+    assert [s.to_state for s in result.steps] == ["q0", "q1", "q1", "q0"]
+    assert [s.symbol for s in result.steps] == [None, "1", "0", "1"]
+    assert result.steps[2].from_state == "q1"
+
+def test_run_and_accepts_match_simulate(simple_afd):
+    for cadena in ["", "0", "1", "10", "0110", "111"]:
+        result = simple_afd.simulate(cadena)
+        assert simple_afd.run(cadena) == result.final_state
+        assert simple_afd.accepts(cadena) is result.accepted
+
+def test_run_invalid_symbol(simple_afd):
+    with pytest.raises(ValueError, match="no está en el alfabeto"):
+        simple_afd.accepts("012")
+
+def test_is_final(simple_afd):
+    assert simple_afd.is_final("q1") is True
+    assert simple_afd.is_final("q0") is False
+    assert simple_afd.is_final("qX") is False
+
+def test_iter_trace_matches_simulate(simple_afd):
+    cadena = "10110"
+    assert list(simple_afd.iter_trace(cadena)) == list(simple_afd.simulate(cadena).steps)
+
+def test_lazy_steps_indexing(simple_afd):
+    steps = simple_afd.simulate("1" * 1000).steps
+    assert len(steps) == 1001
+    assert steps[-1].to_state == "q0"
+    assert steps[-1].from_state == "q1"
+    assert [s.symbol for s in steps[1:3]] == ["1", "1"]
+    with pytest.raises(IndexError):
+        steps[1001]
+
+def test_trace_is_compact(simple_afd):
+    steps = simple_afd.simulate("01" * 50_000).steps
+    # Dos arreglos de un byte por paso en lugar de un objeto por paso
+    assert steps.nbytes() <= 2 * len(steps)
+    assert isinstance(steps[1], TraceStep)
+    assert not hasattr(steps[1], "__dict__")
+
+BATCH_STRINGS = ["", "1", "0", "10", "11", "0110", "2", "1x1", "1" * 101, "01" * 40 + "1"]
+
+def _expected_final(afd, cadena):
+    try:
+        return afd.run(cadena)
+    except ValueError:
+        return None
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_run_many_matches_run(simple_afd, monkeypatch, has_numpy):
+    from afd_core import vectorized
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+
+    finals = list(simple_afd.run_many(BATCH_STRINGS))
+    accepted = list(simple_afd.accepts_many(BATCH_STRINGS))
+    for cadena, index, ok in zip(BATCH_STRINGS, finals, accepted):
+        expected = _expected_final(simple_afd, cadena)
+        if expected is None:
+            assert index == -1 and not ok
+        else:
+            assert simple_afd.state_name(index) == expected
+            assert bool(ok) == simple_afd.accepts(cadena)
+
+def test_run_many_unicode_and_large_batch(monkeypatch):
+    from afd_core import vectorized
+    if not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "BATCH_SIZE", 7)
+    afd = AFD(["p", "q"], ["α", "b"], "p", ["q"],
+              {"p": {"α": "q", "b": "p"}, "q": {"α": "p", "b": "q"}})
+    strings = ["α", "αα", "bαb", "c", "", "€"] * 5
+    assert list(afd.accepts_many(strings)) == [
+        afd.accepts(s) if set(s) <= {"α", "b"} else False for s in strings
+    ]
+
+def test_language_properties(simple_afd):
+    assert not simple_afd.is_empty()
+    assert not simple_afd.is_finite()
+    assert not simple_afd.is_universal()
+    assert simple_afd.shortest_accepted() == "1"
+
+    # Acepta solo "ab"; "q3" no es alcanzable
+    only_ab = AFD(["q0", "q1", "q2", "sink", "q3"], ["a", "b"], "q0", ["q2", "q3"],
+                  {"q0": {"a": "q1", "b": "sink"}, "q1": {"a": "sink", "b": "q2"},
+                   "q2": {"a": "sink", "b": "sink"}, "sink": {"a": "sink", "b": "sink"},
+                   "q3": {"a": "q3", "b": "q3"}})
+    assert only_ab.is_finite() and not only_ab.is_empty()
+    assert only_ab.shortest_accepted() == "ab"
+
+    # Todos los estados alcanzables son finales; "q1" no lo es pero no se alcanza
+    universal = AFD(["q0", "q1"], ["a"], "q0", ["q0"],
+                    {"q0": {"a": "q0"}, "q1": {"a": "q0"}})
+    assert universal.is_universal()
+    assert universal.shortest_accepted() == ""
+
+def test_empty_language():
+    afd = AFD(["q0", "q1"], ["a"], "q0", ["q1"], {"q0": {"a": "q0"}, "q1": {"a": "q1"}})
+    assert afd.is_empty() and afd.is_finite()
+    assert afd.shortest_accepted() is None
+
+def test_bytes_input(simple_afd, monkeypatch):
+    from afd_core import afd as afd_module
+    monkeypatch.setattr(afd_module, "BYTE_BLOCK_SIZE", 3)
+    data = b"0110100"
+    for value in [data, bytearray(data), memoryview(data)]:
+        assert simple_afd.run(value) == simple_afd.run("0110100")
+        assert simple_afd.accepts(value)
+        result = simple_afd.simulate(value)
+        assert result.steps == simple_afd.simulate("0110100").steps
+        assert list(simple_afd.iter_trace(value)) == list(result.steps)
+    with pytest.raises(ValueError, match="0x32 no está en el alfabeto"):
+        simple_afd.run(b"0110102")
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_run_many_bytes(simple_afd, monkeypatch, has_numpy):
+    from afd_core import vectorized
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+    strings = [b"1", b"11", b"", b"012", memoryview(b"0001")]
+    assert list(simple_afd.accepts_many(strings)) == [True, False, False, False, True]
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_run_many_mixed_batch(simple_afd, monkeypatch, has_numpy):
+    from afd_core import vectorized
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+    # Cada elemento se clasifica por separado, no por el primero del lote
+    strings = [b"1", "1", bytearray(b"11"), memoryview(b"0"), "2", b"2", "é"]
+    assert list(simple_afd.accepts_many(strings)) == [True, True, False, False,
+                                                      False, False, False]
+    assert list(simple_afd.run_many(strings))[4:] == [-1, -1, -1]
+    # Secuencias de símbolos ya separados junto con cadenas
+    sequences = ["1", ["1", "0"], ("0",), ["10"]]
+    assert list(simple_afd.accepts_many(sequences)) == [True, True, False, False]
+    assert list(simple_afd.run_many(sequences))[3] == -1
+
+def test_bytes_input_multi_char_alphabet():
+    afd = AFD(["q0", "q1"], ["GET", " "], "q0", ["q1"],
+              {"q0": {"GET": "q1", " ": "q0"}, "q1": {"GET": "q1", " ": "q0"}})
+    assert afd.accepts(b" GETGET")
+    assert [step.symbol for step in afd.simulate(b"GET GET").steps[1:]] == ["GET", " ", "GET"]
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from afd_core.batch import iter_chunks, validate_batch
+from afd_core.cli import main
+from afd_core.persistence import save_to_json
+
+def _expected(afd, strings):
+    expected = []
+    for cadena in strings:
+        try:
+            expected.append(afd.states.index(afd.run(cadena)))
+        except ValueError:
+            expected.append(-1)
+    return expected
+
+STRINGS = ["", "1", "10", "11", "2", "0111", "1a"] * 20
+
+def test_validate_batch_in_process(odd_ones_afd):
+    result = validate_batch(odd_ones_afd, iter(STRINGS), workers=1, chunk_size=8)
+    assert list(result) == _expected(odd_ones_afd, STRINGS)
+
+def test_validate_batch_multiprocess(odd_ones_afd):
+    result = validate_batch(odd_ones_afd, STRINGS, workers=2, chunk_size=9)
+    assert list(result) == _expected(odd_ones_afd, STRINGS)
+
+def test_iter_chunks_unordered_covers_input(odd_ones_afd):
+    chunks = list(iter_chunks(odd_ones_afd, STRINGS, workers=2, chunk_size=10, ordered=False))
+    chunks.sort(key=lambda chunk: chunk.start)
+    assert [s for chunk in chunks for s in chunk.strings] == STRINGS
+    assert [i for chunk in chunks for i in chunk.final_indices] == _expected(odd_ones_afd, STRINGS)
+
+def test_cli_validate(odd_ones_afd, capsys):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        afd_path = os.path.join(tmpdir, "afd.json")
+        input_path = os.path.join(tmpdir, "cadenas.txt")
+        save_to_json(odd_ones_afd, afd_path)
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.write("1\n11\n2\n")
+
+        assert main(["validate", afd_path, input_path, "--workers", "1"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ["1\t1\tACEPTADA\tq1", "2\t11\tRECHAZADA\tq0", "3\t2\tERROR\t-"]
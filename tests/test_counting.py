@@ -0,0 +1,26 @@
+import pytest
+from afd_core import counting
+from afd_core.counting import count_accepted, count_accepted_upto
+
+@pytest.mark.parametrize("use_power", [False, True])
+def test_count_matches_enumeration(ends_in_01_afd, all_strings, monkeypatch, use_power):
+    monkeypatch.setattr(counting, "_use_matrix_power", lambda afd, n: use_power)
+    for n in range(9):
+        assert count_accepted(ends_in_01_afd, n) == sum(
+            map(ends_in_01_afd.accepts, all_strings("01", n, n)))
+        assert count_accepted_upto(ends_in_01_afd, n) == sum(
+            map(ends_in_01_afd.accepts, all_strings("01", n)))
+
+def test_count_large_lengths(odd_ones_afd):
+    # La mitad de las cadenas binarias de longitud n tiene un número impar de '1'
+    assert count_accepted(odd_ones_afd, 5000) == 2 ** 4999
+    assert count_accepted(odd_ones_afd, 10 ** 6) == 2 ** (10 ** 6 - 1)
+    assert count_accepted_upto(odd_ones_afd, 1000) == 2 ** 1000 - 1
+
+def test_count_edge_cases(odd_ones_afd):
+    assert count_accepted(odd_ones_afd, 0) == 0
+    assert count_accepted_upto(odd_ones_afd, 0) == 0
+    # Una longitud negativa es un error en las dos funciones
+    for count in (count_accepted, count_accepted_upto):
+        with pytest.raises(ValueError, match="no negativa"):
+            count(odd_ones_afd, -1)
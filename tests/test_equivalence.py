@@ -0,0 +1,69 @@
+import itertools
+import random
+import pytest
+from afd_core.afd import AFD
+from afd_core.equivalence import equivalent
+
+@pytest.fixture
+def ends_in_1_afd():
+    return AFD(["q0", "q1"], ["0", "1"], "q0", ["q1"],
+               {"q0": {"0": "q0", "1": "q1"}, "q1": {"0": "q0", "1": "q1"}})
+
+@pytest.fixture
+def ends_in_1_redundant_afd():
+    return AFD(["a", "b", "c", "d"], ["0", "1"], "a", ["b", "d"],
+               {"a": {"0": "c", "1": "b"},
+                "b": {"0": "a", "1": "d"},
+                "c": {"0": "a", "1": "d"},
+                "d": {"0": "c", "1": "b"}})
+
+def _brute_difference(a, b, symbols, max_length):
+    for n in range(max_length + 1):
+        for s in map("".join, itertools.product(symbols, repeat=n)):
+            def accepts(afd):
+                return set(s) <= set(afd.alphabet) and afd.accepts(s)
+            if accepts(a) != accepts(b):
+                return s
+    return None
+
+def test_equivalent_automata(ends_in_1_afd, ends_in_1_redundant_afd):
+    result = equivalent(ends_in_1_afd, ends_in_1_redundant_afd)
+    assert result
+    assert result.counterexample is None
+
+def test_shortest_counterexample(ends_in_1_afd):
+    # Acepta las cadenas que terminan en "11"
+    ends_in_11 = AFD(["q0", "q1", "q2"], ["0", "1"], "q0", ["q2"],
+                     {"q0": {"0": "q0", "1": "q1"},
+                      "q1": {"0": "q0", "1": "q2"},
+                      "q2": {"0": "q0", "1": "q2"}})
+    result = equivalent(ends_in_1_afd, ends_in_11)
+    assert not result
+    assert result.counterexample == "1"
+
+def test_different_alphabets(ends_in_1_afd):
+    # Mismo lenguaje sobre {0, 1}, pero también acepta "2"
+    extended = AFD(["q0", "q1"], ["0", "1", "2"], "q0", ["q1"],
+                   {"q0": {"0": "q0", "1": "q1", "2": "q1"},
+                    "q1": {"0": "q0", "1": "q1", "2": "q1"}})
+    result = equivalent(ends_in_1_afd, extended)
+    assert result.counterexample == "2"
+
+def test_random_automata_against_brute_force():
+    rng = random.Random(5)
+    for _ in range(200):
+        afds = []
+        for _ in range(2):
+            n = rng.randint(1, 4)
+            states = [f"q{i}" for i in range(n)]
+            alphabet = ["a", "b"]
+            transitions = {s: {x: rng.choice(states) for x in alphabet} for s in states}
+            finals = [s for s in states if rng.random() < 0.5]
+            afds.append(AFD(states, alphabet, "q0", finals, transitions))
+        # Con 8 estados en total, una diferencia aparece con longitud <= 6
+        expected = _brute_difference(afds[0], afds[1], ["a", "b"], 8)
+        result = equivalent(*afds)
+        assert result.equivalent == (expected is None)
+        if expected is not None:
+            assert len(result.counterexample) == len(expected)
+            assert afds[0].accepts(result.counterexample) != afds[1].accepts(result.counterexample)
@@ -0,0 +1,50 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+from afd_core.file_validator import infer_format, validate_file
+
+def test_validate_gzip_to_csv(odd_ones_afd):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, "cadenas.txt.gz")
+        output_path = os.path.join(tmpdir, "resultados.csv")
+        with gzip.open(input_path, "wt", encoding="utf-8") as f:
+            f.write("1\n\n2\r\n011\n")
+
+        stats = validate_file(odd_ones_afd, input_path, output_path, chunk_size=2, workers=1)
+
+        with open(output_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+
+    assert rows == [
+        ["index", "string", "accepted", "final_state"],
+        ["1", "1", "true", "q1"],
+        ["2", "", "false", "q0"],
+        ["3", "2", "false", ""],
+        ["4", "011", "false", "q0"],
+    ]
+    assert (stats.total, stats.accepted, stats.rejected, stats.errors) == (4, 1, 2, 1)
+    assert stats.rate > 0
+
+def test_validate_to_jsonl_gz(odd_ones_afd):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, "cadenas.txt")
+        output_path = os.path.join(tmpdir, "resultados.jsonl.gz")
+        with open(input_path, "w", encoding="utf-8") as f:
+            f.write("10\nx\n")
+
+        validate_file(odd_ones_afd, input_path, output_path, workers=1)
+
+        with gzip.open(output_path, "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+
+    assert rows == [
+        {"index": 1, "string": "10", "accepted": True, "final_state": "q1"},
+        {"index": 2, "string": "x", "accepted": False, "final_state": None},
+    ]
+
+def test_infer_format():
+    assert infer_format("out.csv") == "csv"
+    assert infer_format("out.jsonl.gz") == "jsonl"
+    assert infer_format(None) == "tsv"
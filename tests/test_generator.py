@@ -1,6 +1,7 @@
 import pytest
+from itertools import islice
 from afd_core.afd import AFD
-from afd_core.generator import generate_strings
+from afd_core.generator import generate_strings, iter_accepted
 
 @pytest.fixture
 def afd_even_zeros():
@@ -36,3 +37,50 @@ def test_generate_no_accepting():
     )
     result = generate_strings(afd, limit=5)
     assert result == []
+
+def test_generate_shortlex_order(afd_even_zeros):
+    assert generate_strings(afd_even_zeros, limit=5) == ["", "1", "00", "11", "001"]
+
+def test_generate_prunes_dead_states():
+    # Solo acepta "ab"; el resto de ramas cae en un sumidero
+    afd = AFD(
+        states=["q0", "q1", "q2", "dead"],
+        alphabet=["a", "b"],
+        initial="q0",
+        finals=["q2"],
+        transitions={
+            "q0": {"a": "q1", "b": "dead"},
+            "q1": {"a": "dead", "b": "q2"},
+            "q2": {"a": "dead", "b": "dead"},
+            "dead": {"a": "dead", "b": "dead"},
+        }
+    )
+    assert generate_strings(afd, limit=10, max_length=10_000) == ["ab"]
+
+def test_generate_large_limit_unique(afd_even_zeros):
+    strings = generate_strings(afd_even_zeros, limit=20_000, max_length=20)
+    assert len(strings) == 20_000
+    assert len(set(strings)) == 20_000
+    assert all(s.count("0") % 2 == 0 for s in strings)
+
+def test_iter_accepted_is_lazy_and_unbounded(afd_even_zeros):
+    strings = iter_accepted(afd_even_zeros)
+    first = list(islice(strings, 5))
+    assert first == ["", "1", "00", "11", "001"]
+    # Sin límite de longitud se pueden seguir pidiendo cadenas
+    later = list(islice(strings, 100_000))
+    assert len(later[-1]) > 15
+
+def test_iter_accepted_finite_language_terminates():
+    afd = AFD(
+        states=["q0", "q1", "q2"],
+        alphabet=["a"],
+        initial="q0",
+        finals=["q1"],
+        transitions={"q0": {"a": "q1"}, "q1": {"a": "q2"}, "q2": {"a": "q2"}}
+    )
+    assert list(iter_accepted(afd)) == ["a"]
+
+def test_iter_accepted_invalid_order(afd_even_zeros):
+    with pytest.raises(ValueError):
+        next(iter_accepted(afd_even_zeros, order="lex"))
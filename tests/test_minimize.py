@@ -0,0 +1,89 @@
+import itertools
+import random
+import pytest
+from afd_core.afd import AFD
+
+@pytest.fixture
+def redundant_afd():
+    # Acepta cadenas que terminan en '1'; q1/q3 y q0/q2 son equivalentes
+    # y q4 no es alcanzable
+    return AFD(["q0", "q1", "q2", "q3", "q4"], ["0", "1"], "q0", ["q1", "q3"],
+               {"q0": {"0": "q2", "1": "q1"},
+                "q1": {"0": "q0", "1": "q3"},
+                "q2": {"0": "q0", "1": "q3"},
+                "q3": {"0": "q2", "1": "q1"},
+                "q4": {"0": "q4", "1": "q0"}})
+
+def _same_language(a, b, max_length=7):
+    return all(a.accepts(s) == b.accepts(s)
+               for n in range(max_length + 1)
+               for s in map("".join, itertools.product(a.alphabet, repeat=n)))
+
+def _moore_classes(afd):
+    # Minimización ingenua (Moore) para comparar: clases de estados alcanzables
+    reachable, frontier = {afd.initial}, [afd.initial]
+    while frontier:
+        state = frontier.pop()
+        for target in afd.transitions[state].values():
+            if target not in reachable:
+                reachable.add(target)
+                frontier.append(target)
+    label = {s: afd.is_final(s) for s in reachable}
+    while True:
+        refined = {s: (label[s],) + tuple(label[afd.transitions[s][a]] for a in afd.alphabet)
+                   for s in reachable}
+        if len(set(refined.values())) == len(set(label.values())):
+            return len(set(label.values()))
+        label = refined
+
+def test_minimize_merges_equivalent_states(redundant_afd):
+    minimal, mapping = redundant_afd.minimize()
+    assert minimal.states == ["q0", "q1"]
+    assert minimal.initial == "q0"
+    assert minimal.finals == ["q1"]
+    assert mapping == {"q0": "q0", "q1": "q1", "q2": "q0", "q3": "q1"}
+    assert _same_language(redundant_afd, minimal)
+
+def test_minimize_single_class():
+    afd = AFD(["a", "b"], ["x"], "a", [], {"a": {"x": "b"}, "b": {"x": "a"}})
+    minimal, mapping = afd.minimize()
+    assert minimal.states == ["a"]
+    assert minimal.transitions == {"a": {"x": "a"}}
+    assert mapping == {"a": "a", "b": "a"}
+
+def test_minimize_random_automata():
+    rng = random.Random(3)
+    for _ in range(200):
+        n = rng.randint(1, 9)
+        states = [f"q{i}" for i in range(n)]
+        alphabet = ["a", "b", "c"][:rng.randint(1, 3)]
+        transitions = {s: {a: rng.choice(states) for a in alphabet} for s in states}
+        finals = [s for s in states if rng.random() < 0.4]
+        afd = AFD(states, alphabet, rng.choice(states), finals, transitions)
+
+        minimal, mapping = afd.minimize()
+        assert len(minimal.states) == _moore_classes(afd)
+        assert _same_language(afd, minimal, max_length=6)
+        assert all(afd.run(s) in mapping and mapping[afd.run(s)] == minimal.run(s)
+                   for s in ["", "a", "aa", "ab"] if set(s) <= set(alphabet))
+
+def test_trim_removes_useless_states():
+    # q3 no es alcanzable; d1 y d2 son estados muertos
+    afd = AFD(["q0", "d1", "q1", "d2", "q3"], ["a", "b"], "q0", ["q1"],
+              {"q0": {"a": "q1", "b": "d1"},
+               "d1": {"a": "d2", "b": "d1"},
+               "q1": {"a": "q1", "b": "d2"},
+               "d2": {"a": "d1", "b": "d2"},
+               "q3": {"a": "q0", "b": "q0"}})
+    trimmed = afd.trim()
+    assert trimmed.states == ["q0", "q1", "d1"]
+    assert trimmed.transitions == {"q0": {"a": "q1", "b": "d1"},
+                                   "q1": {"a": "q1", "b": "d1"},
+                                   "d1": {"a": "d1", "b": "d1"}}
+    assert _same_language(afd, trimmed)
+
+def test_trim_empty_language():
+    afd = AFD(["q0", "q1"], ["a"], "q0", [], {"q0": {"a": "q1"}, "q1": {"a": "q0"}})
+    trimmed = afd.trim()
+    assert trimmed.states == ["q0"]
+    assert trimmed.finals == []
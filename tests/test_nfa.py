@@ -0,0 +1,66 @@
+import pytest
+from afd_core.nfa import NFA
+from afd_core.persistence import load_from_json, save_to_json
+
+def _nth_from_last_nfa(n):
+    # Acepta las cadenas cuyo n-ésimo símbolo desde el final es 'a'
+    states = [f"q{i}" for i in range(n + 1)]
+    transitions = {"q0": {"a": ["q0", "q1"], "b": ["q0"]}}
+    for i in range(1, n):
+        transitions[f"q{i}"] = {"a": [f"q{i + 1}"], "b": [f"q{i + 1}"]}
+    return NFA(states, ["a", "b"], "q0", [f"q{n}"], transitions)
+
+@pytest.fixture
+def epsilon_nfa():
+    # a*b* con transición ε entre las dos partes
+    return NFA(["p", "q"], ["a", "b"], "p", ["q"],
+               {"p": {"a": ["p"], "ε": ["q"]}, "q": {"b": ["q"]}})
+
+def test_subset_construction_matches_nfa(all_strings):
+    nfa = _nth_from_last_nfa(3)
+    afd = nfa.to_afd()
+    assert len(afd.states) == 8
+    for s in all_strings("ab", 7):
+        assert afd.accepts(s) == nfa.accepts(s) == (len(s) >= 3 and s[-3] == "a")
+
+def test_epsilon_transitions(epsilon_nfa, tmp_path):
+    afd = epsilon_nfa.to_afd()
+    assert afd.initial == "{p,q}"
+    assert "∅" in afd.states
+    for s, expected in [("", True), ("aab", True), ("abb", True), ("ba", False)]:
+        assert afd.accepts(s) == expected
+
+    # El AFD resultante se puede guardar y simular como cualquier otro
+    path = tmp_path / "afd.json"
+    save_to_json(afd, str(path))
+    assert load_from_json(str(path)).simulate("aab").accepted
+
+def test_set_names_do_not_collide():
+    # {"a,b"} y {"a", "b"} se escribirían los dos como "{a,b}"
+    nfa = NFA(["s", "a,b", "a", "b"], ["x", "y"], "s", ["a,b"],
+              {"s": {"x": ["a,b"], "y": ["a", "b"]}})
+    afd = nfa.to_afd()
+    assert len(set(afd.states)) == len(afd.states) == 4
+    assert afd.accepts("x") and not afd.accepts("y")
+    assert {afd.run("x"), afd.run("y")} == {"{a,b}", "{a,b}'"}
+
+def test_max_states():
+    with pytest.raises(ValueError, match="límite"):
+        _nth_from_last_nfa(10).to_afd(max_states=100)
+    assert len(_nth_from_last_nfa(10).to_afd(max_states=1024).states) == 1024
+
+def test_hundreds_of_states():
+    # Cadena de 500 estados unidos por ε: el AFD tiene un estado por posición
+    n = 500
+    states = [f"s{i}" for i in range(n)]
+    transitions = {f"s{i}": {"x": [f"s{i + 1}"], "ε": [f"s{i + 1}"]} for i in range(n - 1)}
+    nfa = NFA(states, ["x"], "s0", [f"s{n - 1}"], transitions)
+    afd = nfa.to_afd()
+    assert afd.accepts("") and afd.accepts("x" * (n - 1))
+    assert not afd.accepts("x" * n)
+
+def test_invalid_nfa():
+    with pytest.raises(ValueError, match="AFN inválido"):
+        NFA(["p"], ["a"], "p", [], {"p": {"a": ["r"]}})
+    with pytest.raises(ValueError, match="AFN inválido"):
+        NFA(["p"], ["a", "ε"], "p", [], {})
@@ -0,0 +1,55 @@
+import pytest
+from afd_core.afd import AFD
+from afd_core.operations import complement, intersection, union
+
+@pytest.fixture
+def even_zeros_afd():
+    return AFD(["e", "o"], ["0", "1"], "e", ["e"],
+               {"e": {"0": "o", "1": "e"}, "o": {"0": "e", "1": "o"}})
+
+@pytest.fixture
+def ends_in_1_afd():
+    return AFD(["p0", "p1"], ["0", "1"], "p0", ["p1"],
+               {"p0": {"0": "p0", "1": "p1"}, "p1": {"0": "p0", "1": "p1"}})
+
+def _accepts(afd, s):
+    return set(s) <= set(afd.alphabet) and afd.accepts(s)
+
+def test_binary_operations(even_zeros_afd, ends_in_1_afd, all_strings):
+    a, b = even_zeros_afd, ends_in_1_afd
+    cases = [
+        (a.intersection(b), lambda x, y: x and y),
+        (a.union(b), lambda x, y: x or y),
+        (a.difference(b), lambda x, y: x and not y),
+        (a.symmetric_difference(b), lambda x, y: x != y),
+    ]
+    for result, expected in cases:
+        assert result.initial == "(e,p0)"
+        assert len(result.states) == 4
+        for s in all_strings(["0", "1"]):
+            assert result.accepts(s) == expected(a.accepts(s), b.accepts(s))
+
+def test_product_only_builds_reachable_tuples():
+    # 20 copias del mismo AFD de 3 estados: 3^20 tuplas posibles, 3 alcanzables
+    afd = AFD(["q0", "q1", "q2"], ["a"], "q0", ["q2"],
+              {"q0": {"a": "q1"}, "q1": {"a": "q2"}, "q2": {"a": "q0"}})
+    result = intersection(*[afd] * 20)
+    assert len(result.states) == 3
+    assert result.accepts("aa") and not result.accepts("aaa")
+
+def test_different_alphabets(even_zeros_afd, all_strings):
+    only_a = AFD(["s"], ["a"], "s", ["s"], {"s": {"a": "s"}})
+    result = union(even_zeros_afd, only_a)
+    assert result.alphabet == ["0", "1", "a"]
+    assert "(∅,s)" in result.states
+    for s in all_strings(["0", "1", "a"], 4):
+        assert result.accepts(s) == (_accepts(even_zeros_afd, s) or _accepts(only_a, s))
+
+def test_complement(ends_in_1_afd, all_strings):
+    result = complement(ends_in_1_afd)
+    assert result.states == ends_in_1_afd.states
+    assert all(result.accepts(s) != ends_in_1_afd.accepts(s) for s in all_strings(["0", "1"]))
+
+    extended = ends_in_1_afd.complement(["0", "1", "2"])
+    assert extended.states == ["p0", "p1", "∅"]
+    assert extended.accepts("12") and not extended.accepts("1")
@@ -0,0 +1,35 @@
+from itertools import islice
+import pytest
+from afd_core.afd import AFD
+from afd_core.generator import iter_accepted
+from afd_core.ranking import rank, unrank
+
+@pytest.fixture
+def finite_afd():
+    # Acepta solo "a" y "ab"; el alfabeto está en orden inverso a propósito
+    return AFD(["q0", "q1", "q2", "sink"], ["b", "a"], "q0", ["q1", "q2"],
+               {"q0": {"a": "q1", "b": "sink"},
+                "q1": {"a": "sink", "b": "q2"},
+                "q2": {"a": "sink", "b": "sink"},
+                "sink": {"a": "sink", "b": "sink"}})
+
+def test_rank_unrank_match_enumeration(ends_in_01_afd):
+    for i, cadena in enumerate(islice(iter_accepted(ends_in_01_afd), 300)):
+        assert rank(ends_in_01_afd, cadena) == i
+        assert unrank(ends_in_01_afd, i) == cadena
+
+def test_unrank_far_page(ends_in_01_afd):
+    page = [unrank(ends_in_01_afd, i) for i in range(10 ** 6, 10 ** 6 + 10)]
+    assert all(ends_in_01_afd.accepts(s) for s in page)
+    assert [rank(ends_in_01_afd, s) for s in page] == list(range(10 ** 6, 10 ** 6 + 10))
+
+def test_finite_language(finite_afd):
+    assert [unrank(finite_afd, i) for i in range(2)] == ["a", "ab"]
+    with pytest.raises(IndexError):
+        unrank(finite_afd, 2)
+
+def test_invalid_arguments(ends_in_01_afd):
+    with pytest.raises(ValueError):
+        rank(ends_in_01_afd, "10")
+    with pytest.raises(IndexError):
+        unrank(ends_in_01_afd, -1)
@@ -0,0 +1,43 @@
+import random
+import re
+import pytest
+from afd_core import regex
+from afd_core.regex import compile_regex
+
+def _random_pattern(rng, depth=0):
+    choice = rng.random()
+    if depth > 3 or choice < 0.3:
+        return rng.choice(["a", "b", ".", "ε"])
+    if choice < 0.55:
+        return _random_pattern(rng, depth + 1) + _random_pattern(rng, depth + 1)
+    if choice < 0.75:
+        return "(" + _random_pattern(rng, depth + 1) + "|" + _random_pattern(rng, depth + 1) + ")"
+    return "(" + _random_pattern(rng, depth + 1) + ")" + rng.choice("*+?")
+
+def test_matches_python_re(all_strings):
+    rng = random.Random(11)
+    for _ in range(150):
+        pattern = _random_pattern(rng)
+        afd = compile_regex(pattern, ["a", "b"])
+        expected = re.compile(pattern.replace("ε", ""))
+        for s in all_strings("ab"):
+            assert afd.accepts(s) == bool(expected.fullmatch(s)), pattern
+
+def test_result_is_minimal():
+    # Cadenas sobre {0, 1} que terminan en "01": el AFD mínimo tiene 3 estados
+    afd = compile_regex("(0|1)*01", ["0", "1"])
+    assert afd.states == ["q0", "q1", "q2"]
+    assert afd.initial == "q0"
+    assert afd.minimize()[0].states == afd.states
+
+def test_escapes_and_cache():
+    regex.cache_clear()
+    afd = compile_regex("(\\(x\\))+", ["(", ")", "x"])
+    assert afd.accepts("(x)(x)") and not afd.accepts("")
+    assert compile_regex("(\\(x\\))+", ("(", ")", "x")) is afd
+    assert regex.cache_info().hits == 1
+
+@pytest.mark.parametrize("pattern", ["(ab", "ab)", "*a", "a|c", "a\\"])
+def test_syntax_errors(pattern):
+    with pytest.raises(ValueError):
+        compile_regex(pattern, ["a", "b"])
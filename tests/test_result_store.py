@@ -0,0 +1,32 @@
+import pytest
+from ui.result_store import ACCEPTED, ERROR, REJECTED, ResultStore
+
+@pytest.fixture
+def store(odd_ones_afd):
+    store = ResultStore(odd_ones_afd, describe_error=lambda cadena: "símbolo inválido")
+    strings = ["1", "11", "2", "", "10"]
+    store.append(strings, [1, 0, -1, 0, 1])
+    return store
+
+def test_rows_in_input_order(store):
+    assert len(store) == 5
+    assert store.row(0) == (["1", "1", "ACEPTADA", "q1"], "accepted")
+    assert store.row(2) == (["3", "2", "ERROR: símbolo inválido...", "-"], "error")
+    assert store.row(3)[0][1] == "ε"
+    assert store.counts == {ACCEPTED: 2, REJECTED: 2, ERROR: 1}
+
+def test_filter_and_append(store):
+    store.set_filter(ACCEPTED)
+    assert [store.row(i)[0][0] for i in range(len(store))] == ["1", "5"]
+    store.append(["111", "0"], [1, 0])
+    assert [store.row(i)[0][1] for i in range(len(store))] == ["1", "10", "111"]
+    store.set_filter(None)
+    assert len(store) == 7
+
+def test_sort(store):
+    store.sort("Cadena")
+    assert [store.row(i)[0][1] for i in range(len(store))] == ["ε", "1", "10", "11", "2"]
+    store.sort("#", descending=True)
+    assert store.row(0)[0][0] == "5"
+    store.set_filter(REJECTED)
+    assert [store.row(i)[0][0] for i in range(len(store))] == ["4", "2"]
@@ -0,0 +1,26 @@
+from collections import Counter
+import pytest
+from afd_core.counting import count_accepted, path_counts
+from afd_core.sampling import sample_accepted
+
+def test_path_counts_match_count_accepted(ends_in_01_afd):
+    counts = path_counts(ends_in_01_afd)
+    assert path_counts(ends_in_01_afd) is counts
+    for n in range(12):
+        assert counts.count(n) == count_accepted(ends_in_01_afd, n)
+
+def test_samples_are_accepted_and_reproducible(ends_in_01_afd):
+    samples = sample_accepted(ends_in_01_afd, 200, k=50, seed=7)
+    assert len(samples) == 50
+    assert all(len(s) == 200 and ends_in_01_afd.accepts(s) for s in samples)
+    assert samples == sample_accepted(ends_in_01_afd, 200, k=50, seed=7)
+
+def test_samples_are_uniform(ends_in_01_afd):
+    # Hay 4 cadenas aceptadas de longitud 4: 0001, 0101, 1001, 1101
+    counts = Counter(sample_accepted(ends_in_01_afd, 4, k=8000, seed=1))
+    assert set(counts) == {"0001", "0101", "1001", "1101"}
+    assert all(1700 < c < 2300 for c in counts.values())
+
+def test_no_accepted_strings_of_length(ends_in_01_afd):
+    with pytest.raises(ValueError):
+        sample_accepted(ends_in_01_afd, 1)
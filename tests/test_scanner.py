@@ -0,0 +1,84 @@
+import pytest
+from afd_core import scanner, vectorized
+from afd_core.cli import main
+from afd_core.persistence import save_to_json
+from afd_core.scanner import scan_blocks, scan_file
+
+RECORDS = ["1", "11", "", "012", "0001", "1" * 5000, "10\r", "0110100"]
+
+def _expected(afd, records):
+    result = []
+    for record in records:
+        record = record.rstrip("\r")
+        try:
+            result.append(afd.accepts(record))
+        except ValueError:
+            result.append(False)
+    return result
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+@pytest.mark.parametrize("delimiter", [b"\n", b"||"])
+def test_scan_matches_accepts(odd_ones_afd, tmp_path, monkeypatch, has_numpy, delimiter):
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+    # Bloques diminutos: "1" * 5000 es un registro más largo que el bloque
+    monkeypatch.setattr(scanner, "BLOCK_SIZE", 16)
+    monkeypatch.setattr(scanner, "BLOCK_RECORDS", 3)
+
+    path = tmp_path / "records.txt"
+    records = RECORDS if delimiter == b"\n" else [r.rstrip("\r") for r in RECORDS]
+    path.write_bytes(delimiter.join(r.encode() for r in records) + delimiter)
+
+    result = scan_file(odd_ones_afd, str(path), delimiter)
+    assert list(result.accepted) == _expected(odd_ones_afd, records)
+    assert list(result.final_indices)[3] == -1
+    assert odd_ones_afd.state_name(result.final_indices[4]) == "q1"
+
+    blocks = list(scan_blocks(odd_ones_afd, str(path), delimiter))
+    assert len(blocks) > 2
+    assert [ok for block in blocks for ok in block.accepted] == list(result.accepted)
+    assert tuple(map(sum, zip(*(block.counts() for block in blocks)))) == result.counts()
+
+def test_scan_edge_cases(odd_ones_afd, tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert len(scan_file(odd_ones_afd, str(empty)).accepted) == 0
+
+    # Sin delimitador final, el último registro también cuenta
+    path = tmp_path / "records.txt"
+    path.write_bytes(b"1\n\n111")
+    assert list(scan_file(odd_ones_afd, str(path)).accepted) == [True, False, True]
+
+    with pytest.raises(ValueError):
+        scan_file(odd_ones_afd, str(path), b"")
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_cli_scan(odd_ones_afd, tmp_path, monkeypatch, capsys, has_numpy):
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+    afd_path = tmp_path / "afd.json"
+    save_to_json(odd_ones_afd, str(afd_path))
+    input_path = tmp_path / "registros.log"
+    input_path.write_bytes(b"1\t11\t2\t0111")
+
+    assert main(["scan", str(afd_path), str(input_path), "--delimiter", "\\t"]) == 0
+    summary = capsys.readouterr().err
+    assert "4 cadenas" in summary
+    assert "Aceptadas: 2 | Rechazadas: 1 | Errores: 1" in summary
+
+def test_cli_scan_delimiter(odd_ones_afd, tmp_path, capsys):
+    afd_path = tmp_path / "afd.json"
+    save_to_json(odd_ones_afd, str(afd_path))
+    input_path = tmp_path / "registros.log"
+    # Un delimitador fuera de latin-1 se busca codificado en UTF-8
+    input_path.write_bytes("1€11€111".encode("utf-8"))
+
+    assert main(["scan", str(afd_path), str(input_path), "--delimiter", "€"]) == 0
+    assert "Aceptadas: 2 | Rechazadas: 1" in capsys.readouterr().err
+
+    for bad in ["\\u20ac", "\\x", ""]:
+        with pytest.raises(SystemExit):
+            main(["scan", str(afd_path), str(input_path), "--delimiter", bad])
+    assert "delimitador" in capsys.readouterr().err
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from afd_core.afd import AFD
+from afd_core.streaming import StreamingRunner
+
+def test_feed_chunks(odd_ones_afd):
+    runner = StreamingRunner(odd_ones_afd)
+    runner.feed("01")
+    runner.feed(b"10")
+    runner.feed(memoryview(b"1"))
+    assert runner.state == odd_ones_afd.run("01101")
+    assert runner.accepting
+    assert runner.symbols_read == 5
+
+    runner.reset()
+    assert runner.state == "q0" and runner.symbols_read == 0
+
+def test_invalid_chunk_keeps_state(odd_ones_afd):
+    runner = StreamingRunner(odd_ones_afd)
+    runner.feed("1")
+    with pytest.raises(ValueError):
+        runner.feed("0012")
+    assert runner.state == "q1" and runner.symbols_read == 1
+
+def test_symbol_split_across_chunks():
+    afd = AFD(["q0", "q1"], ["a", "abc"], "q0", ["q1"],
+              {"q0": {"a": "q0", "abc": "q1"}, "q1": {"a": "q0", "abc": "q1"}})
+    runner = StreamingRunner(afd)
+    runner.feed("aab")
+    assert runner.symbols_read == 1 and runner.pending_chars == 2
+    runner.feed("c")
+    assert runner.accepting and runner.pending_chars == 0
+    runner.feed("a")
+    assert runner.pending_chars == 1
+    assert runner.flush() is False
+    assert runner.symbols_read == 3
+    runner.feed("ab")
+    with pytest.raises(ValueError, match="en medio de un símbolo"):
+        runner.flush()
+
+def test_unbounded_decoding_delay():
+    # "abbb..." es a·bb·bb... o ab·bb·b... según la paridad de las "b":
+    # la separación no se decide hasta el final de la entrada
+    afd = AFD(["q0", "q1"], ["a", "ab", "bb"], "q0", ["q1"],
+              {"q0": {"a": "q0", "ab": "q0", "bb": "q1"},
+               "q1": {"a": "q0", "ab": "q0", "bb": "q1"}})
+    runner = StreamingRunner(afd)
+    runner.feed("a")
+    for _ in range(2000):
+        runner.feed("b" * 64)
+        assert len(runner._configs) <= 2
+    assert runner.symbols_read == 0 and runner.pending_chars == 128_001
+    assert runner.flush() is True
+    assert runner.symbols_read == 64_001 and runner.pending_chars == 0
+
+    runner.reset()
+    runner.feed("abbb")
+    with pytest.raises(ValueError, match="'c' no está en el alfabeto"):
+        runner.feed("bbc")
+    assert runner.pending_chars == 4
+    runner.feed("b")
+    assert runner.flush() is True and runner.symbols_read == 3  # a·bb·bb
+
+def test_feed_from_reader(odd_ones_afd):
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"1" * 1001)
+        reader.feed_eof()
+        runner = StreamingRunner(odd_ones_afd)
+        accepted = await runner.feed_from(reader, chunk_size=64)
+        return accepted, runner.symbols_read
+
+    assert asyncio.run(main()) == (True, 1001)
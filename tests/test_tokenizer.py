@@ -0,0 +1,77 @@
+import pytest
+from afd_core.afd import AFD
+from afd_core.tokenizer import Tokenizer, is_uniquely_decodable
+from afd_core.generator import generate_strings, iter_accepted
+from afd_core.counting import count_accepted
+from afd_core.ranking import rank, unrank
+
+@pytest.fixture
+def keyword_afd():
+    # Acepta secuencias de "if" y "x" que terminan en "x"
+    return AFD(["q0", "q1"], ["if", "i", "x"], "q0", ["q1"],
+               {"q0": {"if": "q0", "i": "q0", "x": "q1"},
+                "q1": {"if": "q0", "i": "q0", "x": "q1"}})
+
+def test_unique_decoding():
+    # "ab" es prefijo de "abb" solo en apariencia: "abb" se separa como a·bb
+    tokenizer = Tokenizer(["a", "ab", "bb"])
+    assert list(tokenizer.tokenize("abb")) == [0, 2]
+    assert list(tokenizer.tokenize("abbb")) == [1, 2]
+    assert list(tokenizer.tokenize("aab")) == [0, 1]
+    with pytest.raises(ValueError, match="'z' no está en el alfabeto"):
+        tokenizer.tokenize("abz")
+    with pytest.raises(ValueError):
+        tokenizer.tokenize("ba")
+
+def test_error_reports_failing_character():
+    tokenizer = Tokenizer(["GET", " "])
+    with pytest.raises(ValueError, match="'X' no está en el alfabeto"):
+        tokenizer.tokenize("GET GEX")
+    with pytest.raises(ValueError, match="termina en medio de un símbolo"):
+        tokenizer.tokenize("GET GE")
+
+def test_uniquely_decodable():
+    assert is_uniquely_decodable(["if", "i", "x"])
+    assert is_uniquely_decodable(["a", "ab", "bb"])
+    assert not is_uniquely_decodable(["a", "b", "ab"])
+    assert not is_uniquely_decodable(["a", "ab", "abc", "c"])
+    assert not is_uniquely_decodable(["a", "ab", "ba"])  # aba = a·ba = ab·a
+    assert not is_uniquely_decodable(["", "a"])
+
+def test_ambiguous_alphabet_rejected():
+    # Con "a", "b" y "ab", la cadena "ab" correspondería a dos caminos
+    with pytest.raises(ValueError, match="AFD inválido"):
+        AFD(["q0"], ["a", "b", "ab"], "q0", ["q0"],
+            {"q0": {"a": "q0", "b": "q0", "ab": "q0"}})
+
+def test_enumerators_agree_with_accepts():
+    # Alfabeto sin prefijos libres: la separación de "abb..." depende del final
+    afd = AFD(["q0", "q1"], ["a", "ab", "bb"], "q0", ["q1"],
+              {"q0": {"a": "q1", "ab": "q0", "bb": "q0"},
+               "q1": {"a": "q1", "ab": "q0", "bb": "q1"}})
+    accepted = generate_strings(afd, limit=40, max_length=4)
+    assert len(accepted) == len(set(accepted)) == 40
+    assert all(afd.accepts(s) for s in accepted)
+    for i in range(40):
+        assert rank(afd, unrank(afd, i)) == i
+    assert sum(1 for s in iter_accepted(afd, max_length=3) if len(afd._indices(s)) == 3) \
+        == count_accepted(afd, 3)
+
+def test_simulate_multi_char_symbols(keyword_afd):
+    result = keyword_afd.simulate("ifiix")
+    assert result.accepted
+    assert [step.symbol for step in result.steps[1:]] == ["if", "i", "i", "x"]
+    assert [step.symbol for step in keyword_afd.iter_trace("ifx")][1:] == ["if", "x"]
+    assert keyword_afd.run("xif") == "q0"
+    # También se aceptan secuencias ya separadas en símbolos
+    assert keyword_afd.simulate(["i", "x"]).accepted
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_run_many_multi_char_symbols(keyword_afd, monkeypatch, has_numpy):
+    from afd_core import vectorized
+    if has_numpy and not vectorized.HAS_NUMPY:
+        pytest.skip("NumPy no está instalado")
+    monkeypatch.setattr(vectorized, "HAS_NUMPY", has_numpy)
+    strings = ["ifx", "if", "", "fx", "iix", "x" * 50]
+    assert list(keyword_afd.accepts_many(strings)) == [True, False, False, False, True, True]
+    assert list(keyword_afd.run_many(strings))[3] == -1
@@ -0,0 +1,76 @@
+import threading
+import time
+import pytest
+from afd_core import batch
+from afd_core.batch import BatchChunk
+from ui import validation_worker
+from ui.validation_worker import ValidationWorker
+
+def _poll_until(worker, condition, timeout=5.0):
+    """Llama a `poll()` como lo haría el bucle de Tk hasta que se cumpla `condition`."""
+    received = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = worker.poll()
+        received.append(result)
+        if condition(result):
+            return received
+        time.sleep(0.001)
+    raise AssertionError("La validación no terminó a tiempo")
+
+def test_validates_in_process(odd_ones_afd, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("La interfaz no debe crear procesos")
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", no_pool)
+
+    strings = ["1", "ε", "10", "2"] * 1000
+    worker = ValidationWorker(odd_ones_afd, chunk_size=300)
+    assert worker.start(strings)
+    with pytest.raises(RuntimeError):
+        worker.start(["1"])
+
+    results = _poll_until(worker, lambda result: result.finished)
+    chunks = [chunk for result in results for chunk in result.chunks]
+    assert [chunk.start for chunk in chunks] == list(range(0, 4000, 300))
+    final = [index for chunk in chunks for index in chunk.final_indices]
+    assert final == [1, 0, 1, -1] * 1000
+    assert chunks[0].strings[:2] == ["1", ""]  # "ε" es la cadena vacía
+    assert not worker.running and not any(result.errors for result in results)
+
+def test_cancel_then_start_waits_for_previous_run(odd_ones_afd, monkeypatch):
+    # Bloques que solo avanzan cuando el test lo permite
+    gate = threading.Event()
+    def slow_chunks(afd, strings, workers, chunk_size):
+        assert workers == 1
+        for start, cadena in enumerate(strings):
+            gate.wait()
+            yield BatchChunk(start, [cadena], [afd._run_index(cadena)])
+    monkeypatch.setattr(validation_worker, "iter_chunks", slow_chunks)
+
+    worker = ValidationWorker(odd_ones_afd)
+    worker.start(["1", "11", "111"])
+    worker.cancel()
+    assert not worker.start(["0", "1"])
+    assert worker.waiting and worker.total == 3
+
+    # La validación en espera empieza al recibir el fin de la cancelada
+    gate.set()
+    results = _poll_until(worker, lambda result: result.started)
+    assert not any(result.chunks for result in results)
+    assert worker.total == 2 and not worker.waiting and not worker.cancelled
+
+    results = _poll_until(worker, lambda result: result.finished)
+    assert [chunk.strings[0] for result in results for chunk in result.chunks] == ["0", "1"]
+
+def test_errors_are_reported(odd_ones_afd, monkeypatch):
+    def failing_chunks(afd, strings, workers, chunk_size):
+        yield BatchChunk(0, ["1"], [1])
+        raise MemoryError("sin memoria")
+    monkeypatch.setattr(validation_worker, "iter_chunks", failing_chunks)
+
+    worker = ValidationWorker(odd_ones_afd)
+    worker.start(["1", "0"])
+    results = _poll_until(worker, lambda result: result.finished)
+    assert sum(len(result.chunks) for result in results) == 1
+    errors = [error for result in results for error in result.errors]
+    assert len(errors) == 1 and isinstance(errors[0], MemoryError)
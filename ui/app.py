@@ -1,5 +1,6 @@
 # ui/app.py
 import tkinter as tk
+from itertools import islice
 from ui.editor import GraphEditor
 from tkinter import ttk, filedialog, messagebox
 from afd_core.afd import AFD
@@ -81,6 +82,12 @@ class AutomataApp:
         gen_menu.add_command(label="Mostrar primeras 10 cadenas", command=self._generate_strings)
         menu_bar.add_cascade(label="Generación", menu=gen_menu)
 
+        # Menú Transformaciones
+        transform_menu = tk.Menu(menu_bar, tearoff=0)
+        transform_menu.add_command(label="Minimizar AFD", command=self._minimize_afd)
+        transform_menu.add_command(label="Eliminar estados inútiles", command=self._trim_afd)
+        menu_bar.add_cascade(label="Transformaciones", menu=transform_menu)
+
         self.root.config(menu=menu_bar)
 
     def _create_bottom_panel(self):
@@ -158,16 +165,16 @@ class AutomataApp:
         
         try:
             afd = self.canvas.to_afd()
-            result = afd.simulate(cadena)
+            final_state = afd.run(cadena)
             
-            if result.accepted:
+            if afd.is_final(final_state):
                 self.result_label.config(
-                    text=f"Resultado: '{cadena}' ACEPTADA (estado final: {result.final_state})",
+                    text=f"Resultado: '{cadena}' ACEPTADA (estado final: {final_state})",
                     foreground="green"
                 )
             else:
                 self.result_label.config(
-                    text=f"Resultado: '{cadena}' RECHAZADA (estado final: {result.final_state})",
+                    text=f"Resultado: '{cadena}' RECHAZADA (estado final: {final_state})",
                     foreground="red"
                 )
         except Exception as e:
@@ -194,8 +201,8 @@ class AutomataApp:
         """Muestra las primeras 10 cadenas aceptadas por el AFD."""
         try:
             afd = self.canvas.to_afd()
-            from afd_core.generator import generate_strings
-            strings = generate_strings(afd, limit=10)
+            from afd_core.generator import iter_accepted
+            strings = list(islice(iter_accepted(afd), 10))
             
             # Crear ventana de resultados
             gen_window = tk.Toplevel(self.root)
@@ -220,6 +227,32 @@ class AutomataApp:
         except Exception as e:
             messagebox.showerror("Error de generación", str(e))
 
+    def _minimize_afd(self):
+        """Reemplaza el AFD del editor por su AFD mínimo equivalente."""
+        try:
+            afd = self.canvas.to_afd()
+            minimal, _ = afd.minimize()
+            self.canvas.from_afd(minimal)
+            self.result_label.config(
+                text=f"Resultado: AFD minimizado ({len(afd.states)} → {len(minimal.states)} estados)",
+                foreground="black"
+            )
+        except Exception as e:
+            messagebox.showerror("Error de minimización", str(e))
+
+    def _trim_afd(self):
+        """Quita del editor los estados no alcanzables y reúne los estados muertos."""
+        try:
+            afd = self.canvas.to_afd()
+            trimmed = afd.trim()
+            self.canvas.from_afd(trimmed)
+            self.result_label.config(
+                text=f"Resultado: estados inútiles eliminados ({len(afd.states)} → {len(trimmed.states)} estados)",
+                foreground="black"
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudieron eliminar los estados inútiles:\n{str(e)}")
+
     def _batch_validate(self):
         """Abre ventana para validar múltiples cadenas."""
         try:
@@ -1,6 +1,13 @@
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from afd_core.afd import AFD
+from ui.result_store import ACCEPTED, ERROR, REJECTED, ResultStore
+from ui.validation_worker import ValidationWorker
+from ui.virtual_table import VirtualResultsView
+
+# Milisegundos entre actualizaciones de la interfaz
+POLL_INTERVAL_MS = 50
 
 
 class BatchValidatorWindow:
@@ -8,6 +15,13 @@ class BatchValidatorWindow:
         self.parent = parent
         self.afd = afd
         
+        # Estado de la validación en segundo plano
+        self.validation = ValidationWorker(afd)
+        self.result_store = ResultStore(afd, describe_error=self._describe_error)
+        self.validation_total = 0
+        self.validation_done = 0
+        self.validation_started = 0.0
+        
         # Crear ventana
         self.window = tk.Toplevel(parent)
         self.window.title("Validador de Múltiples Cadenas")
@@ -20,6 +34,9 @@ class BatchValidatorWindow:
         self.create_widgets()
         self.center_window()
         
+        # Cancelar la validación en curso al cerrar la ventana
+        self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
     def setup_styles(self):
         """Configura los estilos personalizados con paleta moderna."""
         self.style = ttk.Style()
@@ -157,12 +174,31 @@ class BatchValidatorWindow:
         button_frame = tk.Frame(input_container, bg=self.colors['bg_card'])
         button_frame.pack(fill="x")
         
-        ttk.Button(button_frame, text="Validar Todas", 
-                  style="BatchNav.TButton",
-                  command=self.validate_all).pack(side="left", padx=(0, 8))
+        self.validate_btn = ttk.Button(button_frame, text="Validar Todas", 
+                                      style="BatchNav.TButton",
+                                      command=self.validate_all)
+        self.validate_btn.pack(side="left", padx=(0, 8))
         ttk.Button(button_frame, text="Limpiar", 
                   style="BatchNav.TButton",
                   command=self.clear_input).pack(side="left", padx=8)
+        self.cancel_btn = ttk.Button(button_frame, text="Cancelar", 
+                                    style="BatchNav.TButton",
+                                    command=self.cancel_validation,
+                                    state="disabled")
+        self.cancel_btn.pack(side="left", padx=8)
+        
+        # Progreso de la validación
+        progress_frame = tk.Frame(input_container, bg=self.colors['bg_card'])
+        progress_frame.pack(fill="x", pady=(10, 0))
+        
+        self.progress_bar = ttk.Progressbar(progress_frame, orient="horizontal",
+                                            mode="determinate")
+        self.progress_bar.pack(side="left", fill="x", expand=True)
+        self.progress_label = tk.Label(progress_frame, text="",
+                                       bg=self.colors['bg_card'],
+                                       fg=self.colors['text_secondary'],
+                                       font=("Segoe UI", 9))
+        self.progress_label.pack(side="left", padx=(10, 0))
         
         # Frame de resultados
         result_frame = ttk.LabelFrame(main_frame, text="Resultados", style="BatchCard.TLabelframe")
@@ -171,28 +207,51 @@ class BatchValidatorWindow:
         result_container = tk.Frame(result_frame, bg=self.colors['bg_card'])
         result_container.pack(fill="both", expand=True, padx=15, pady=15)
         
-        # Tabla de resultados con estilo moderno
-        columns = ["#", "Cadena", "Resultado", "Estado Final"]
-        self.result_tree = ttk.Treeview(result_container, columns=columns, 
-                                       show="headings", height=8,
-                                       style="BatchResults.Treeview")
-        
-        # Configurar columnas
-        column_widths = [50, 250, 120, 150]
-        for i, col in enumerate(columns):
-            self.result_tree.heading(col, text=col)
-            self.result_tree.column(col, width=column_widths[i], anchor="center")
-        
-        # Scrollbar para resultados
-        scrollbar_result = ttk.Scrollbar(result_container, orient="vertical", 
-                                        command=self.result_tree.yview)
-        self.result_tree.configure(yscrollcommand=scrollbar_result.set)
+        # Filtro por resultado
+        filter_frame = tk.Frame(result_container, bg=self.colors['bg_card'])
+        filter_frame.pack(fill="x", pady=(0, 8))
+        
+        tk.Label(filter_frame, text="Mostrar:",
+                bg=self.colors['bg_card'], fg=self.colors['text_primary'],
+                font=("Segoe UI", 9, "bold")).pack(side="left")
+        
+        self.filter_var = tk.StringVar(value="Todas")
+        self.filter_options = {"Todas": None, "ACEPTADA": ACCEPTED,
+                               "RECHAZADA": REJECTED, "ERROR": ERROR}
+        filter_box = ttk.Combobox(filter_frame, textvariable=self.filter_var,
+                                  values=list(self.filter_options), state="readonly", width=12)
+        filter_box.pack(side="left", padx=(5, 10))
+        filter_box.bind("<<ComboboxSelected>>", lambda e: self.apply_filter())
+        
+        self.counts_label = tk.Label(filter_frame, text="",
+                                     bg=self.colors['bg_card'],
+                                     fg=self.colors['text_secondary'],
+                                     font=("Segoe UI", 9))
+        self.counts_label.pack(side="left")
+        
+        # Tabla de resultados virtualizada con estilo moderno
+        self.results_view = VirtualResultsView(result_container, self.result_store,
+                                               style="BatchResults.Treeview",
+                                               column_widths=[50, 250, 120, 150],
+                                               bg=self.colors['bg_card'])
+        self.results_view.pack(fill="both", expand=True)
         
-        self.result_tree.pack(side="left", fill="both", expand=True)
-        scrollbar_result.pack(side="right", fill="y")
+        # Configurar colores para las filas con estilo moderno
+        self.results_view.tag_configure("accepted", 
+                                       background=self.colors['accent_green'], 
+                                       foreground="white")
+        self.results_view.tag_configure("rejected", 
+                                       background=self.colors['accent_red'], 
+                                       foreground="white")
+        self.results_view.tag_configure("error", 
+                                       background=self.colors['accent_orange'], 
+                                       foreground="white")
         
     def validate_all(self):
-        """Valida todas las cadenas ingresadas."""
+        """Valida todas las cadenas ingresadas en un hilo de fondo."""
+        if self.validation.running and not self.validation.cancelled:
+            return
+        
         # Obtener cadenas del texto
         text_content = self.text_input.get(1.0, tk.END).strip()
         if not text_content:
@@ -210,59 +269,116 @@ class BatchValidatorWindow:
             messagebox.showwarning("Advertencia", "No se encontraron cadenas válidas.")
             return
         
-        # Limpiar resultados anteriores
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
-        
-        # Validar cada cadena
-        for i, cadena in enumerate(strings, 1):
-            try:
-                # Manejar cadena vacía
-                test_string = cadena if cadena != "ε" else ""
-                result = self.afd.simulate(test_string)
-                
-                # Determinar resultado
-                if result.accepted:
-                    resultado_text = "ACEPTADA"
-                    resultado_color = "accepted"
-                else:
-                    resultado_text = "RECHAZADA"
-                    resultado_color = "rejected"
-                
-                # Insertar en tabla
-                item = self.result_tree.insert("", "end", values=[
-                    str(i),
-                    cadena if cadena else "ε",
-                    resultado_text,
-                    result.final_state
-                ], tags=(resultado_color,))
-                
-            except Exception as e:
-                # Error en la simulación
-                self.result_tree.insert("", "end", values=[
-                    str(i),
-                    cadena,
-                    f"ERROR: {str(e)[:20]}...",
-                    "-"
-                ], tags=("error",))
+        if not self.validation.start(strings):
+            # La validación cancelada todavía termina su bloque; la nueva
+            # empieza cuando `_poll_results` reciba su fin
+            self.validate_btn.config(state="disabled")
+            self.progress_label.config(text="En espera: terminando la validación cancelada...")
+            return
         
-        # Configurar colores para las filas con estilo moderno
-        self.result_tree.tag_configure("accepted", 
-                                      background=self.colors['accent_green'], 
-                                      foreground="white")
-        self.result_tree.tag_configure("rejected", 
-                                      background=self.colors['accent_red'], 
-                                      foreground="white")
-        self.result_tree.tag_configure("error", 
-                                      background=self.colors['accent_orange'], 
-                                      foreground="white")
+        self._prepare_run()
+        self.window.after(POLL_INTERVAL_MS, self._poll_results)
+    
+    def _prepare_run(self):
+        """Limpia los resultados anteriores y prepara el progreso y los controles."""
+        self.result_store.clear()
+        self.filter_var.set("Todas")
+        self.results_view.set_filter(None)
+        self.counts_label.config(text="")
+        
+        self.validation_total = self.validation.total
+        self.validation_done = 0
+        self.validation_started = time.perf_counter()
+        self.progress_bar.configure(maximum=self.validation_total, value=0)
+        self.progress_label.config(text=f"0/{self.validation_total}")
+        self.validate_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+    
+    def _poll_results(self):
+        """Agrega al almacén los resultados recibidos del hilo de fondo."""
+        if not self.window.winfo_exists():
+            return
+        
+        result = self.validation.poll()
+        for error in result.errors:
+            messagebox.showerror("Error", f"Error durante la validación:\n{error}")
+        if result.started:
+            self._prepare_run()
+        
+        for chunk in result.chunks:
+            self.result_store.append(chunk.strings, chunk.final_indices)
+            self.validation_done += len(chunk.strings)
+        
+        # Solo se redibujan las filas visibles, no todos los resultados
+        if result.chunks:
+            self.results_view.refresh()
+            self._update_counts()
+        if not self.validation.waiting:
+            self._update_progress()
+        
+        if result.finished:
+            self._finish_validation()
+        else:
+            self.window.after(POLL_INTERVAL_MS, self._poll_results)
+    
+    def _describe_error(self, test_string):
+        """Repite la simulación de una cadena inválida para obtener el mensaje de error."""
+        try:
+            self.afd.run(test_string)
+        except ValueError as e:
+            return str(e)
+        return ""
+    
+    def _update_counts(self):
+        """Actualiza el resumen de resultados por tipo."""
+        counts = self.result_store.counts
+        self.counts_label.config(
+            text=f"Aceptadas: {counts[ACCEPTED]} | Rechazadas: {counts[REJECTED]} | "
+                 f"Errores: {counts[ERROR]}")
+    
+    def apply_filter(self):
+        """Filtra la tabla por el resultado elegido."""
+        self.results_view.set_filter(self.filter_options[self.filter_var.get()])
+    
+    def _update_progress(self):
+        """Actualiza la barra de progreso y la velocidad de validación."""
+        elapsed = time.perf_counter() - self.validation_started
+        rate = self.validation_done / elapsed if elapsed > 0 else 0
+        self.progress_bar.configure(value=self.validation_done)
+        self.progress_label.config(
+            text=f"{self.validation_done}/{self.validation_total} | {rate:,.0f} filas/s")
+    
+    def _finish_validation(self):
+        """Restaura los controles al terminar o cancelar la validación."""
+        self.validate_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        if self.validation.cancelled:
+            self.progress_label.config(
+                text=f"Cancelado: {self.validation_done}/{self.validation_total}")
+    
+    def cancel_validation(self):
+        """Cancela la validación en curso; se puede iniciar otra enseguida."""
+        if self.validation.running:
+            self.validation.cancel()
+            self.cancel_btn.config(state="disabled")
+            self.validate_btn.config(state="normal")
+    
+    def on_closing(self):
+        """Cancela la validación en curso y cierra la ventana."""
+        self.validation.cancel()
+        self.window.destroy()
     
     def clear_input(self):
         """Limpia el área de entrada y resultados."""
+        self.cancel_validation()
         self.text_input.delete(1.0, tk.END)
         # Limpiar resultados también
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
+        self.result_store.clear()
+        self.filter_var.set("Todas")
+        self.results_view.set_filter(None)
+        self.counts_label.config(text="")
+        self.progress_bar.configure(value=0)
+        self.progress_label.config(text="")
     
     def center_window(self):
         """Centra la ventana en la pantalla."""
@@ -650,6 +650,7 @@ class GraphEditor(tk.Canvas):
     def to_afd(self):
         """Convierte el estado actual del canvas a una instancia AFD."""
         from afd_core.afd import AFD
+        from afd_core.tokenizer import is_uniquely_decodable
         
         if not self.has_valid_structure():
             raise ValueError("El autómata no tiene estructura válida (necesita estados, inicial y transiciones)")
@@ -662,6 +663,11 @@ class GraphEditor(tk.Canvas):
         
         if not alphabet:
             raise ValueError("No se ha definido ningún símbolo en las transiciones")
+
+        if not is_uniquely_decodable(alphabet):
+            raise ValueError("Los símbolos se pueden combinar de dos formas distintas "
+                             "(por ejemplo 'a', 'b' y 'ab'); cada cadena debe separarse "
+                             "en símbolos de una única forma")
         
         # Construir función de transición
         transitions = {}
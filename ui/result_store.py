@@ -0,0 +1,136 @@
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from afd_core.afd import AFD
+
+# Códigos de resultado guardados por fila
+ACCEPTED, REJECTED, ERROR = 0, 1, 2
+STATUS_TEXT = {ACCEPTED: "ACEPTADA", REJECTED: "RECHAZADA", ERROR: "ERROR"}
+STATUS_TAGS = {ACCEPTED: "accepted", REJECTED: "rejected", ERROR: "error"}
+
+# Columnas de la tabla de resultados
+COLUMNS = ["#", "Cadena", "Resultado", "Estado Final"]
+
+
+class ResultStore:
+    """
+    Resultados de una validación por lotes, guardados en arreglos paralelos.
+
+    Las filas no se guardan como objetos: solo la cadena, el índice del
+    estado final y un código de resultado por fila. Los filtros y el orden
+    se aplican sobre un arreglo de posiciones (`view`), de modo que la tabla
+    virtual puede pedir cualquier fila visible sin recorrer las demás.
+    """
+
+    def __init__(self, afd: AFD,
+                 describe_error: Optional[Callable[[str], str]] = None):
+        self.afd = afd
+        self.describe_error = describe_error
+        self.clear()
+
+    def clear(self) -> None:
+        """Elimina todas las filas y restablece filtro y orden."""
+        self.strings: List[str] = []
+        self.final_indices = array("i")
+        self.status = bytearray()
+        self.counts = {ACCEPTED: 0, REJECTED: 0, ERROR: 0}
+        self.filter_status: Optional[int] = None
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        self._view: Optional[array] = None  # None: todas las filas en orden
+        self._errors: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """Cantidad de filas visibles con el filtro actual."""
+        return len(self.strings) if self._view is None else len(self._view)
+
+    @property
+    def total(self) -> int:
+        """Cantidad total de filas guardadas."""
+        return len(self.strings)
+
+    def append(self, strings: Sequence[str], final_indices: Sequence[int]) -> None:
+        """Agrega un bloque de resultados (cadenas y estados finales)."""
+        first = len(self.strings)
+        self.strings.extend(strings)
+        self.final_indices.extend(final_indices)
+        for final_index in final_indices:
+            if final_index < 0:
+                code = ERROR
+            elif self.afd._is_final_index(final_index):
+                code = ACCEPTED
+            else:
+                code = REJECTED
+            self.status.append(code)
+            self.counts[code] += 1
+
+        # Las filas nuevas se agregan al final de la vista; un orden activo
+        # se vuelve a aplicar al llamar a `sort`
+        if self._view is not None:
+            wanted = self.filter_status
+            self._view.extend(i for i in range(first, len(self.strings))
+                              if wanted is None or self.status[i] == wanted)
+
+    def set_filter(self, status: Optional[int]) -> None:
+        """Muestra solo las filas con el código de resultado `status` (None: todas)."""
+        self.filter_status = status
+        self._rebuild_view()
+
+    def sort(self, column: Optional[str], descending: bool = False) -> None:
+        """Ordena las filas visibles por `column` (None: orden original)."""
+        self.sort_column = column
+        self.sort_descending = descending
+        self._rebuild_view()
+
+    def _rebuild_view(self) -> None:
+        rows = range(len(self.strings))
+        if self.filter_status is not None:
+            rows = [i for i in rows if self.status[i] == self.filter_status]
+
+        if self.sort_column is not None:
+            rows = sorted(rows, key=self._sort_key(self.sort_column),
+                          reverse=self.sort_descending)
+
+        if self.filter_status is None and self.sort_column is None:
+            self._view = None
+        else:
+            self._view = array("I", rows)
+
+    def _sort_key(self, column: str) -> Callable[[int], object]:
+        if column == "#":
+            return lambda i: i
+        if column == "Cadena":
+            return self.strings.__getitem__
+        if column == "Resultado":
+            return self.status.__getitem__
+        if column == "Estado Final":
+            def final_state(i):
+                final_index = self.final_indices[i]
+                return self.afd.state_name(final_index) if final_index >= 0 else ""
+            return final_state
+        raise ValueError(f"Columna desconocida: '{column}'")
+
+    def row_index(self, position: int) -> int:
+        """Índice en la entrada de la fila visible en `position`."""
+        return position if self._view is None else self._view[position]
+
+    def row(self, position: int) -> Tuple[List[str], str]:
+        """
+        Devuelve los valores y la etiqueta de color de la fila visible en `position`.
+
+        :return: ([#, cadena, resultado, estado final], etiqueta)
+        """
+        i = self.row_index(position)
+        cadena = self.strings[i]
+        code = self.status[i]
+        if code == ERROR:
+            message = self._errors.get(i)
+            if message is None:
+                message = self.describe_error(cadena) if self.describe_error else ""
+                self._errors[i] = message
+            resultado = f"ERROR: {message[:20]}..." if message else "ERROR"
+            final_state = "-"
+        else:
+            resultado = STATUS_TEXT[code]
+            final_state = self.afd.state_name(self.final_indices[i])
+        return [str(i + 1), cadena if cadena else "ε", resultado, final_state], STATUS_TAGS[code]
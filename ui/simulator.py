@@ -1,9 +1,14 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import time
 import math
 from afd_core.afd import AFD, TraceResult
 
+# Cantidad de pasos que se cargan a la vez en la tabla de pasos
+STEPS_PAGE_SIZE = 200
+# Cantidad de símbolos de la cadena que se dibujan alrededor del paso actual
+STRING_WINDOW = 60
+
 class SimulatorWindow:
     def __init__(self, parent, afd: AFD, cadena: str, canvas=None):
         self.parent = parent
@@ -14,13 +19,15 @@ class SimulatorWindow:
         self.result = None
         self.original_colors = {}  # Para restaurar colores originales
         self.auto_playing = False  # Control para auto-play
+        self.steps_page_start = 0  # Primer paso cargado en la tabla de pasos
         
         # Simular la cadena
         self.result = afd.simulate(cadena)
         
         # Crear ventana
         self.window = tk.Toplevel(parent)
-        self.window.title(f"Simulador AFD - Cadena: '{cadena if cadena else 'ε'}'")
+        titulo = cadena if len(cadena) <= 50 else cadena[:50] + "…"
+        self.window.title(f"Simulador AFD - Cadena: '{titulo if titulo else 'ε'}'")
         self.window.geometry("1200x800")
         self.window.configure(bg="#f0f2f5")  # Fondo claro moderno
         
@@ -461,18 +468,26 @@ class SimulatorWindow:
         self.steps_table.pack(side="left", fill="both", expand=True)
         scrollbar_steps.pack(side="right", fill="y")
         
+        # Elegir una fila de la tabla lleva a ese paso
+        self.steps_table.bind("<<TreeviewSelect>>", self.on_step_selected)
+        
         # Llenar tabla
         self.populate_steps_table()
         
     def populate_steps_table(self):
-        """Llena la tabla de pasos."""
-        for i, step in enumerate(self.result.steps):
+        """Llena la tabla con la página de pasos que contiene el paso actual."""
+        self.steps_page_start = (self.current_step // STEPS_PAGE_SIZE) * STEPS_PAGE_SIZE
+        self.steps_table.delete(*self.steps_table.get_children())
+        
+        page_end = min(self.steps_page_start + STEPS_PAGE_SIZE, len(self.result.steps))
+        for i in range(self.steps_page_start, page_end):
+            step = self.result.steps[i]
             if i == 0:
                 values = ["Inicial", "-", step.to_state]
             else:
                 values = [step.from_state, f"'{step.symbol}'", step.to_state]
             
-            self.steps_table.insert("", "end", values=values)
+            self.steps_table.insert("", "end", iid=str(i), values=values)
         
     def create_control_panel(self, parent):
         """Crea el panel de controles."""
@@ -516,6 +531,25 @@ class SimulatorWindow:
                                   font=("Segoe UI", 10, "bold"))
         self.step_label.pack(side="left")
         
+        # Navegación directa: páginas de la tabla y salto a un paso cualquiera
+        self.next_page_btn = ttk.Button(info_frame, text="Página >>",
+                                        style="Nav.TButton",
+                                        command=lambda: self.change_page(1))
+        self.next_page_btn.pack(side="right", padx=(5, 0))
+        self.prev_page_btn = ttk.Button(info_frame, text="<< Página",
+                                        style="Nav.TButton",
+                                        command=lambda: self.change_page(-1))
+        self.prev_page_btn.pack(side="right", padx=5)
+        
+        ttk.Button(info_frame, text="Ir", style="Nav.TButton",
+                   command=self.go_to_entered_step).pack(side="right", padx=5)
+        self.step_entry = ttk.Entry(info_frame, width=10)
+        self.step_entry.pack(side="right")
+        self.step_entry.bind("<Return>", lambda e: self.go_to_entered_step())
+        tk.Label(info_frame, text="Ir al paso:",
+                 bg=self.colors['bg_card'], fg=self.colors['text_primary'],
+                 font=("Segoe UI", 9)).pack(side="right", padx=(0, 5))
+        
     def update_display(self):
         """Actualiza toda la visualización."""
         # Actualizar indicador de paso
@@ -533,6 +567,10 @@ class SimulatorWindow:
         
         # Resaltar paso en tabla
         self.highlight_current_step()
+        self.prev_page_btn.config(state="normal" if self.steps_page_start > 0 else "disabled")
+        self.next_page_btn.config(
+            state="normal" if self.steps_page_start + STEPS_PAGE_SIZE < len(self.result.steps)
+            else "disabled")
         
         # Resaltar estado en el grafo visual
         self.highlight_visual_state()
@@ -558,10 +596,21 @@ class SimulatorWindow:
             return
         
         x_start = 25
-        char_width = 30
-        
-        for i, char in enumerate(self.cadena):
-            x = x_start + i * char_width
+        # Ancho de cada casilla según el símbolo más largo del alfabeto
+        longest = max((len(symbol) for symbol in self.afd.alphabet), default=1)
+        char_width = max(30, 10 * longest + 14)
+        half_width = char_width // 2 - 3
+        
+        # Solo se dibuja una ventana de la cadena alrededor del paso actual
+        # (un símbolo por paso, aunque tenga varios caracteres)
+        num_symbols = len(self.result.steps) - 1
+        window_start = max(0, self.current_step - STRING_WINDOW // 2)
+        window_end = min(num_symbols, window_start + STRING_WINDOW)
+        window_start = max(0, window_end - STRING_WINDOW)
+        
+        for i in range(window_start, window_end):
+            char = self.result.steps[i + 1].symbol
+            x = x_start + (i - window_start) * char_width
             
             # Color según el estado de procesamiento
             if i < self.current_step:
@@ -583,10 +632,10 @@ class SimulatorWindow:
             # Dibujar fondo del carácter con bordes redondeados (simulado)
             if i < self.current_step or (i == self.current_step and self.current_step > 0):
                 # Rectángulo con "bordes redondeados"
-                self.string_canvas.create_rectangle(x-12, 12, x+12, 38, 
+                self.string_canvas.create_rectangle(x-half_width, 12, x+half_width, 38, 
                                                    fill=bg_color, outline=border_color, width=2)
             else:
-                self.string_canvas.create_rectangle(x-12, 12, x+12, 38, 
+                self.string_canvas.create_rectangle(x-half_width, 12, x+half_width, 38, 
                                                    fill=bg_color, outline=border_color, width=1)
             
             # Dibujar carácter
@@ -594,8 +643,8 @@ class SimulatorWindow:
                                           font=("Segoe UI", 12, "bold"))
         
         # Flecha indicadora moderna
-        if self.current_step > 0 and self.current_step <= len(self.cadena):
-            arrow_x = x_start + (self.current_step - 1) * char_width
+        if self.current_step > 0 and self.current_step <= num_symbols:
+            arrow_x = x_start + (self.current_step - 1 - window_start) * char_width
             # Crear flecha más elegante
             points = [arrow_x-8, 42, arrow_x+8, 42, arrow_x, 48]
             self.string_canvas.create_polygon(points, fill=self.colors['accent_blue'], 
@@ -605,8 +654,8 @@ class SimulatorWindow:
         self.string_canvas.configure(scrollregion=self.string_canvas.bbox("all"))
         
         # Auto-scroll para mantener el carácter actual visible
-        if self.current_step > 0 and self.current_step <= len(self.cadena):
-            char_x = x_start + (self.current_step - 1) * char_width
+        if self.current_step > 0 and self.current_step <= num_symbols:
+            char_x = x_start + (self.current_step - 1 - window_start) * char_width
             canvas_width = self.string_canvas.winfo_width()
             if canvas_width > 1:  # Asegurar que el canvas está inicializado
                 scroll_region = self.string_canvas.bbox("all")
@@ -632,8 +681,13 @@ class SimulatorWindow:
         for item in self.steps_table.selection():
             self.steps_table.selection_remove(item)
         
-        if self.current_step < len(self.steps_table.get_children()):
-            item = self.steps_table.get_children()[self.current_step]
+        # Cargar otra página si el paso actual quedó fuera de la tabla
+        if not (self.steps_page_start <= self.current_step
+                < self.steps_page_start + STEPS_PAGE_SIZE):
+            self.populate_steps_table()
+        
+        item = str(self.current_step)
+        if self.steps_table.exists(item):
             self.steps_table.selection_set(item)
             self.steps_table.see(item)
     
@@ -711,6 +765,34 @@ class SimulatorWindow:
             self.current_step += 1
             self.update_display()
     
+    def go_to_step(self, step: int):
+        """Salta a un paso cualquiera de la traza (la tabla carga su página)."""
+        step = max(0, min(step, len(self.result.steps) - 1))
+        if step != self.current_step:
+            self.current_step = step
+            self.update_display()
+    
+    def go_to_entered_step(self):
+        """Salta al paso escrito en el campo "Ir al paso"."""
+        last = len(self.result.steps) - 1
+        text = self.step_entry.get().strip()
+        if not text.isdigit() or int(text) > last:
+            messagebox.showerror("Paso inválido",
+                                 f"Ingrese un número de paso entre 0 y {last}.",
+                                 parent=self.window)
+            return
+        self.go_to_step(int(text))
+    
+    def change_page(self, delta: int):
+        """Carga la página anterior o siguiente de la tabla y va a su primer paso."""
+        self.go_to_step(self.steps_page_start + delta * STEPS_PAGE_SIZE)
+    
+    def on_step_selected(self, event=None):
+        """Va al paso de la fila elegida en la tabla."""
+        selection = self.steps_table.selection()
+        if selection:
+            self.go_to_step(int(selection[0]))
+    
     def auto_play(self):
         """Reproduce automáticamente la simulación."""
         if self.auto_playing:
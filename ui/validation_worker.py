@@ -0,0 +1,138 @@
+import queue
+import threading
+from typing import List, NamedTuple, Sequence
+
+from afd_core.afd import AFD
+from afd_core.batch import BatchChunk, iter_chunks
+
+# Cadenas por bloque que valida el hilo de fondo
+VALIDATION_CHUNK_SIZE = 2000
+
+
+class PollResult(NamedTuple):
+    """
+    Lo recibido del hilo de fondo desde el último `poll()`.
+
+    * `chunks`: bloques validados de la validación en curso
+    * `errors`: excepciones lanzadas durante la validación
+    * `started`: empezó la validación que estaba en espera
+    * `finished`: terminó la validación y no hay otra en espera
+    """
+    chunks: List[BatchChunk]
+    errors: List[Exception]
+    started: bool
+    finished: bool
+
+
+class ValidationWorker:
+    """
+    Validación en lote en un hilo de fondo, sin depender de Tk.
+
+    El hilo valida las cadenas por bloques y los envía por una cola; la
+    ventana los recoge con `poll()` desde el bucle de eventos (con `after`),
+    así que la interfaz nunca se toca desde el hilo de fondo.
+
+    Las cadenas se validan en el proceso actual (`workers=1`): crear un
+    `ProcessPoolExecutor` desde un hilo dentro del proceso de Tk no es
+    seguro con `fork` y es lento con `spawn`.
+
+    La cancelación toma efecto entre bloques. Si se pide otra validación
+    mientras la cancelada termina su bloque, la nueva queda en espera y
+    empieza en cuanto termina el hilo anterior.
+    """
+
+    def __init__(self, afd: AFD, chunk_size: int = VALIDATION_CHUNK_SIZE):
+        self.afd = afd
+        self.chunk_size = chunk_size
+        self.total = 0  # Cadenas de la validación en curso
+        self._thread = None
+        self._cancel_event = threading.Event()
+        self._results_queue = queue.Queue()
+        self._waiting = None
+
+    @property
+    def running(self) -> bool:
+        """Indica si hay un hilo de validación sin terminar."""
+        return self._thread is not None
+
+    @property
+    def cancelled(self) -> bool:
+        """Indica si se canceló la última validación."""
+        return self._cancel_event.is_set()
+
+    @property
+    def waiting(self) -> bool:
+        """Indica si hay una validación esperando a que termine la cancelada."""
+        return self._waiting is not None
+
+    def start(self, strings: Sequence[str]) -> bool:
+        """
+        Empieza a validar `strings` en el hilo de fondo.
+
+        :param strings: cadenas a validar ("ε" representa la cadena vacía)
+        :return: True si empezó, False si quedó en espera de que termine
+                 una validación cancelada
+        """
+        if self._thread is not None:
+            if not self._cancel_event.is_set():
+                raise RuntimeError("Ya hay una validación en curso")
+            self._waiting = list(strings)
+            return False
+
+        strings = list(strings)
+        self.total = len(strings)
+        self._cancel_event = threading.Event()
+        self._results_queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run,
+                                        args=(strings, self._cancel_event, self._results_queue),
+                                        daemon=True)
+        self._thread.start()
+        return True
+
+    def cancel(self) -> None:
+        """Cancela la validación en curso y descarta la que esté en espera."""
+        self._cancel_event.set()
+        self._waiting = None
+
+    def poll(self) -> PollResult:
+        """Recoge sin bloquear lo que el hilo de fondo envió a la cola."""
+        chunks: List[BatchChunk] = []
+        errors: List[Exception] = []
+        finished = False
+        try:
+            while True:
+                item = self._results_queue.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    errors.append(item)
+                elif not self._cancel_event.is_set():
+                    chunks.append(item)
+        except queue.Empty:
+            pass
+
+        if not finished:
+            return PollResult(chunks, errors, False, False)
+        self._thread = None
+        if self._waiting is not None:
+            strings, self._waiting = self._waiting, None
+            self.start(strings)
+            return PollResult(chunks, errors, True, False)
+        return PollResult(chunks, errors, False, True)
+
+    def _run(self, strings, cancel_event, results_queue):
+        """Valida las cadenas por bloques y envía cada bloque a la cola."""
+        # La cadena "ε" representa la cadena vacía
+        test_strings = (cadena if cadena != "ε" else "" for cadena in strings)
+        chunks = iter_chunks(self.afd, test_strings, workers=1, chunk_size=self.chunk_size)
+        try:
+            for chunk in chunks:
+                if cancel_event.is_set():
+                    break
+                results_queue.put(chunk)
+        except Exception as e:
+            results_queue.put(e)
+        finally:
+            chunks.close()
+            results_queue.put(None)  # Fin de la validación
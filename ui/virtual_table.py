@@ -0,0 +1,120 @@
+import tkinter as tk
+from tkinter import ttk
+
+from ui.result_store import COLUMNS, ResultStore
+
+# Alto de fila por defecto del Treeview (píxeles) si el estilo no lo define
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualResultsView(tk.Frame):
+    """
+    Tabla de resultados virtualizada sobre un `ResultStore`.
+
+    El `ttk.Treeview` solo contiene tantas filas como caben en pantalla; al
+    desplazarse se reescriben sus valores con las filas visibles del
+    almacén. Así la tabla se mantiene fluida con millones de resultados.
+    """
+
+    def __init__(self, parent, store: ResultStore, style: str = "Treeview",
+                 column_widths=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.store = store
+        self.top = 0  # Primera fila visible del almacén
+        self.visible_rows = 1
+
+        row_height = ttk.Style().lookup(style, "rowheight")
+        self.row_height = int(row_height) if row_height else DEFAULT_ROW_HEIGHT
+
+        self.tree = ttk.Treeview(self, columns=COLUMNS, show="headings",
+                                 height=8, style=style, selectmode="none")
+        column_widths = column_widths or [50, 250, 120, 150]
+        for i, col in enumerate(COLUMNS):
+            self.tree.heading(col, text=col, command=lambda c=col: self.toggle_sort(c))
+            self.tree.column(col, width=column_widths[i], anchor="center")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<Configure>", lambda e: self.refresh())
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+
+    def tag_configure(self, tag, **options):
+        self.tree.tag_configure(tag, **options)
+
+    # -------------------------
+    # Desplazamiento
+    # -------------------------
+    def on_scroll(self, action, amount, unit=None):
+        """Atiende los comandos de la barra de desplazamiento."""
+        if action == "moveto":
+            self.top = int(float(amount) * len(self.store))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.top += int(amount) * step
+        self.refresh()
+
+    def on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def scroll_rows(self, rows: int):
+        self.top += rows
+        self.refresh()
+
+    # -------------------------
+    # Orden y filtro
+    # -------------------------
+    def toggle_sort(self, column: str):
+        """Ordena por la columna; un segundo clic invierte el orden."""
+        descending = self.store.sort_column == column and not self.store.sort_descending
+        self.store.sort(column, descending)
+        self.top = 0
+        self.refresh()
+
+    def set_filter(self, status):
+        self.store.set_filter(status)
+        self.top = 0
+        self.refresh()
+
+    # -------------------------
+    # Dibujo
+    # -------------------------
+    def refresh(self):
+        """Reescribe las filas visibles a partir del almacén."""
+        height = self.tree.winfo_height()
+        if height > 1:
+            # Descontar el encabezado (aproximadamente una fila)
+            self.visible_rows = max(1, height // self.row_height - 1)
+
+        total = len(self.store)
+        self.top = max(0, min(self.top, total - self.visible_rows))
+        count = min(self.visible_rows, total - self.top)
+
+        # Ajustar la cantidad de ítems del Treeview a las filas visibles
+        items = self.tree.get_children()
+        if len(items) > count:
+            self.tree.delete(*items[count:])
+            items = items[:count]
+        for _ in range(count - len(items)):
+            self.tree.insert("", "end")
+        items = self.tree.get_children()
+
+        for offset, item in enumerate(items):
+            values, tag = self.store.row(self.top + offset)
+            self.tree.item(item, values=values, tags=(tag,))
+
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        # Indicar la columna de orden en los encabezados
+        for col in COLUMNS:
+            arrow = ""
+            if col == self.store.sort_column:
+                arrow = " ▼" if self.store.sort_descending else " ▲"
+            self.tree.heading(col, text=col + arrow)